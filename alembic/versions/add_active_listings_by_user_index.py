@@ -0,0 +1,35 @@
+"""Add partial index for each user's active listings
+
+Revision ID: add_active_listings_by_user_001
+Revises: add_search_trigram_indexes_001
+Create Date: 2026-10-16
+
+Creating a user listing counts that user's status = 'available' rows against
+the per-user cap. A partial index on user_id holds only active listings, so
+the count reads a few index entries instead of the user's whole history. The
+single-column status index is dropped: every status = 'available' query now
+has a partial index, and the expired-listing cleanup filters by expires_at.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_active_listings_by_user_001'
+down_revision = 'add_search_trigram_indexes_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ============================================================================
+    # USER_BULLS_SELL TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_user_bulls_sell_active_by_user', 'user_bulls_sell', ['user_id'],
+                    unique=False, postgresql_where=sa.text("status = 'available'"))
+    op.drop_index('ix_user_bulls_sell_status', table_name='user_bulls_sell')
+
+
+def downgrade():
+    op.create_index('ix_user_bulls_sell_status', 'user_bulls_sell', ['status'], unique=False)
+    op.drop_index('ix_user_bulls_sell_active_by_user', table_name='user_bulls_sell')
@@ -0,0 +1,37 @@
+"""Add partial indexes for available listings
+
+Revision ID: add_available_listings_001
+Revises: add_race_participants_001
+Create Date: 2026-10-16
+
+Public listing endpoints only read status = 'available' rows, newest first.
+Partial indexes keep sold/expired history out of those scans.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_available_listings_001'
+down_revision = 'add_race_participants_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ============================================================================
+    # USER_BULLS_SELL TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_user_bulls_sell_available_created', 'user_bulls_sell', [sa.text('created_at DESC')],
+                    unique=False, postgresql_where=sa.text("status = 'available'"))
+
+    # ============================================================================
+    # MARKETPLACE_LISTINGS TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_marketplace_listings_available_created', 'marketplace_listings', [sa.text('created_at DESC')],
+                    unique=False, postgresql_where=sa.text("status = 'available'"))
+
+
+def downgrade():
+    op.drop_index('ix_marketplace_listings_available_created', table_name='marketplace_listings')
+    op.drop_index('ix_user_bulls_sell_available_created', table_name='user_bulls_sell')
@@ -0,0 +1,48 @@
+"""Add bull_stats materialized view
+
+Revision ID: add_bull_stats_view_001
+Revises: add_hot_path_indexes_001
+Create Date: 2026-10-16
+
+Per-bull race statistics (total races, podium counts, best/average time)
+are read on every bull listing and detail request but only change when race
+results are written. The view is refreshed concurrently after those writes
+(see app/services/bull_stats.py).
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_bull_stats_view_001'
+down_revision = 'add_hot_path_indexes_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE MATERIALIZED VIEW bull_stats AS
+        SELECT
+            bull_id,
+            count(*) AS total_races,
+            count(*) FILTER (WHERE position = 1) AS first_place_wins,
+            count(*) FILTER (WHERE position = 2) AS second_place_wins,
+            count(*) FILTER (WHERE position = 3) AS third_place_wins,
+            min(time_milliseconds) AS best_time_milliseconds,
+            avg(time_milliseconds) AS avg_time_milliseconds
+        FROM (
+            SELECT bull1_id AS bull_id, position, time_milliseconds, is_disqualified FROM race_results
+            UNION ALL
+            SELECT bull2_id AS bull_id, position, time_milliseconds, is_disqualified FROM race_results
+        ) r
+        WHERE bull_id IS NOT NULL AND is_disqualified = false
+        GROUP BY bull_id
+    """)
+
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index('ix_bull_stats_bull_id', 'bull_stats', ['bull_id'], unique=True)
+
+
+def downgrade():
+    op.drop_index('ix_bull_stats_bull_id', table_name='bull_stats')
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS bull_stats")
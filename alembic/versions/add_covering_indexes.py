@@ -0,0 +1,38 @@
+"""Add partial indexes for owner bulls and listing expiry
+
+Revision ID: add_covering_indexes_001
+Revises: add_available_listings_001
+Create Date: 2026-10-16
+
+Owner bull pages filter on (owner_id, is_active) and sort by name; the expiry
+job scans available listings by expires_at. Both only touch a small slice of
+their tables, so partial indexes keep them to an index range scan.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_covering_indexes_001'
+down_revision = 'add_available_listings_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ============================================================================
+    # BULLS TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_bulls_owner_name_active', 'bulls', ['owner_id', 'name'],
+                    unique=False, postgresql_where=sa.text('is_active = true'))
+
+    # ============================================================================
+    # USER_BULLS_SELL TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_user_bulls_sell_available_expires', 'user_bulls_sell', ['expires_at'],
+                    unique=False, postgresql_where=sa.text("status = 'available'"))
+
+
+def downgrade():
+    op.drop_index('ix_user_bulls_sell_available_expires', table_name='user_bulls_sell')
+    op.drop_index('ix_bulls_owner_name_active', table_name='bulls')
@@ -0,0 +1,57 @@
+"""Add partial indexes for race result statistics
+
+Revision ID: add_hot_path_indexes_001
+Revises: add_user_bulls_001
+Create Date: 2026-10-16
+
+Bull statistics filter race_results by bull1_id/bull2_id with
+is_disqualified = false (and position = 1 for wins). These partial indexes
+let each aggregate use an index lookup instead of scanning race_results.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_hot_path_indexes_001'
+down_revision = 'add_user_bulls_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ============================================================================
+    # RACE_RESULTS TABLE INDEXES
+    # ============================================================================
+    # Total races / best time per bull (non-disqualified results only)
+    op.create_index('ix_race_results_bull1_dq', 'race_results', ['bull1_id', 'is_disqualified'],
+                    unique=False, postgresql_where=sa.text('is_disqualified = false'))
+    op.create_index('ix_race_results_bull2_dq', 'race_results', ['bull2_id', 'is_disqualified'],
+                    unique=False, postgresql_where=sa.text('is_disqualified = false'))
+
+    # First place wins per bull
+    op.create_index('ix_race_results_bull1_pos1', 'race_results', ['bull1_id'],
+                    unique=False, postgresql_where=sa.text('position = 1 AND is_disqualified = false'))
+    op.create_index('ix_race_results_bull2_pos1', 'race_results', ['bull2_id'],
+                    unique=False, postgresql_where=sa.text('position = 1 AND is_disqualified = false'))
+
+    # ============================================================================
+    # RACES TABLE INDEXES
+    # ============================================================================
+    # Recent completed races ordered by end_date desc
+    op.create_index('ix_races_status_end_date', 'races', ['status', sa.text('end_date DESC')], unique=False)
+
+
+def downgrade():
+    # ============================================================================
+    # RACES TABLE - DROP INDEXES
+    # ============================================================================
+    op.drop_index('ix_races_status_end_date', table_name='races')
+
+    # ============================================================================
+    # RACE_RESULTS TABLE - DROP INDEXES
+    # ============================================================================
+    op.drop_index('ix_race_results_bull2_pos1', table_name='race_results')
+    op.drop_index('ix_race_results_bull1_pos1', table_name='race_results')
+    op.drop_index('ix_race_results_bull2_dq', table_name='race_results')
+    op.drop_index('ix_race_results_bull1_dq', table_name='race_results')
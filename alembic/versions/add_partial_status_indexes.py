@@ -0,0 +1,39 @@
+"""Add partial indexes for scheduled races and race days
+
+Revision ID: add_partial_status_indexes_001
+Revises: add_race_total_participants_001
+Create Date: 2026-10-16
+
+Upcoming-race listings (public /races/upcoming, admin dashboard) read only
+scheduled races by start_date, and the notification job reads only scheduled
+race days by race_date. Scheduled rows are a small, hot slice of each table,
+so partial indexes on that slice stay small and cache-resident.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_partial_status_indexes_001'
+down_revision = 'add_race_total_participants_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ============================================================================
+    # RACES TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_races_scheduled_start_date', 'races', ['start_date'],
+                    unique=False, postgresql_where=sa.text("status = 'scheduled'"))
+
+    # ============================================================================
+    # RACE_DAYS TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_race_days_scheduled_date', 'race_days', ['race_date'],
+                    unique=False, postgresql_where=sa.text("status = 'scheduled'"))
+
+
+def downgrade():
+    op.drop_index('ix_race_days_scheduled_date', table_name='race_days')
+    op.drop_index('ix_races_scheduled_start_date', table_name='races')
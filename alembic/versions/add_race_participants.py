@@ -0,0 +1,140 @@
+"""Add race_participants table
+
+Revision ID: add_race_participants_001
+Revises: add_bull_stats_view_001
+Create Date: 2026-10-16
+
+Normalizes race_results.bull1_id/bull2_id into one row per bull so per-bull
+statistics can use an indexed lookup on bull_id instead of
+OR(bull1_id, bull2_id). Rows are kept in sync by a trigger on race_results,
+and bull_stats is rebuilt on top of the new table. The per-bull partial
+indexes on race_results (add_hot_path_indexes_001) have no readers left and
+are dropped.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_race_participants_001'
+down_revision = 'add_bull_stats_view_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ============================================================================
+    # RACE_PARTICIPANTS TABLE
+    # ============================================================================
+    op.create_table('race_participants',
+        sa.Column('race_result_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('slot', sa.SmallInteger(), nullable=False),
+        sa.Column('bull_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.CheckConstraint('slot IN (1, 2)', name='check_participant_slot'),
+        sa.ForeignKeyConstraint(['race_result_id'], ['race_results.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['bull_id'], ['bulls.id'], ondelete='RESTRICT'),
+        sa.PrimaryKeyConstraint('race_result_id', 'slot')
+    )
+    op.create_index('ix_race_participants_bull_id', 'race_participants', ['bull_id', 'race_result_id'], unique=False)
+
+    # ============================================================================
+    # SYNC TRIGGER
+    # ============================================================================
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_race_participants() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM race_participants WHERE race_result_id = NEW.id;
+            INSERT INTO race_participants (race_result_id, slot, bull_id)
+            SELECT NEW.id, p.slot, p.bull_id
+            FROM (VALUES (1, NEW.bull1_id), (2, NEW.bull2_id)) AS p(slot, bull_id)
+            WHERE p.bull_id IS NOT NULL
+              -- Same bull in both slots still counts as one participation
+              AND NOT (p.slot = 2 AND p.bull_id IS NOT DISTINCT FROM NEW.bull1_id);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_race_results_sync_participants
+        AFTER INSERT OR UPDATE OF bull1_id, bull2_id ON race_results
+        FOR EACH ROW EXECUTE FUNCTION sync_race_participants()
+    """)
+
+    # ============================================================================
+    # BACKFILL
+    # ============================================================================
+    op.execute("""
+        INSERT INTO race_participants (race_result_id, slot, bull_id)
+        SELECT id, 1, bull1_id FROM race_results WHERE bull1_id IS NOT NULL
+        UNION ALL
+        SELECT id, 2, bull2_id FROM race_results
+        WHERE bull2_id IS NOT NULL AND bull2_id IS DISTINCT FROM bull1_id
+    """)
+
+    # ============================================================================
+    # BULL_STATS VIEW (rebuilt on race_participants)
+    # ============================================================================
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS bull_stats")
+    op.execute("""
+        CREATE MATERIALIZED VIEW bull_stats AS
+        SELECT
+            p.bull_id,
+            count(*) AS total_races,
+            count(*) FILTER (WHERE r.position = 1) AS first_place_wins,
+            count(*) FILTER (WHERE r.position = 2) AS second_place_wins,
+            count(*) FILTER (WHERE r.position = 3) AS third_place_wins,
+            min(r.time_milliseconds) AS best_time_milliseconds,
+            avg(r.time_milliseconds) AS avg_time_milliseconds
+        FROM race_participants p
+        JOIN race_results r ON r.id = p.race_result_id
+        WHERE r.is_disqualified = false
+        GROUP BY p.bull_id
+    """)
+    op.create_index('ix_bull_stats_bull_id', 'bull_stats', ['bull_id'], unique=True)
+
+    # ============================================================================
+    # RACE_RESULTS PER-BULL INDEXES (stats now read race_participants/bull_stats)
+    # ============================================================================
+    op.drop_index('ix_race_results_bull2_pos1', table_name='race_results')
+    op.drop_index('ix_race_results_bull1_pos1', table_name='race_results')
+    op.drop_index('ix_race_results_bull2_dq', table_name='race_results')
+    op.drop_index('ix_race_results_bull1_dq', table_name='race_results')
+
+
+def downgrade():
+    op.create_index('ix_race_results_bull1_dq', 'race_results', ['bull1_id', 'is_disqualified'],
+                    unique=False, postgresql_where=sa.text('is_disqualified = false'))
+    op.create_index('ix_race_results_bull2_dq', 'race_results', ['bull2_id', 'is_disqualified'],
+                    unique=False, postgresql_where=sa.text('is_disqualified = false'))
+    op.create_index('ix_race_results_bull1_pos1', 'race_results', ['bull1_id'],
+                    unique=False, postgresql_where=sa.text('position = 1 AND is_disqualified = false'))
+    op.create_index('ix_race_results_bull2_pos1', 'race_results', ['bull2_id'],
+                    unique=False, postgresql_where=sa.text('position = 1 AND is_disqualified = false'))
+
+    # Restore bull_stats on race_results directly
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS bull_stats")
+    op.execute("""
+        CREATE MATERIALIZED VIEW bull_stats AS
+        SELECT
+            bull_id,
+            count(*) AS total_races,
+            count(*) FILTER (WHERE position = 1) AS first_place_wins,
+            count(*) FILTER (WHERE position = 2) AS second_place_wins,
+            count(*) FILTER (WHERE position = 3) AS third_place_wins,
+            min(time_milliseconds) AS best_time_milliseconds,
+            avg(time_milliseconds) AS avg_time_milliseconds
+        FROM (
+            SELECT bull1_id AS bull_id, position, time_milliseconds, is_disqualified FROM race_results
+            UNION ALL
+            SELECT bull2_id AS bull_id, position, time_milliseconds, is_disqualified FROM race_results
+        ) r
+        WHERE bull_id IS NOT NULL AND is_disqualified = false
+        GROUP BY bull_id
+    """)
+    op.create_index('ix_bull_stats_bull_id', 'bull_stats', ['bull_id'], unique=True)
+
+    op.execute("DROP TRIGGER IF EXISTS trg_race_results_sync_participants ON race_results")
+    op.execute("DROP FUNCTION IF EXISTS sync_race_participants()")
+    op.drop_index('ix_race_participants_bull_id', table_name='race_participants')
+    op.drop_table('race_participants')
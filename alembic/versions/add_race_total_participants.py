@@ -0,0 +1,70 @@
+"""Add races.total_participants
+
+Revision ID: add_race_total_participants_001
+Revises: add_trigram_indexes_001
+Create Date: 2026-10-16
+
+Denormalizes the sum of race_days.total_participants onto races so race
+listings and search read it directly instead of aggregating race days per
+request. Kept current by a trigger on race_days.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_race_total_participants_001'
+down_revision = 'add_trigram_indexes_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ============================================================================
+    # RACES COLUMN
+    # ============================================================================
+    op.add_column('races', sa.Column('total_participants', sa.Integer(), nullable=False, server_default=sa.text('0')))
+
+    # ============================================================================
+    # SYNC TRIGGER
+    # ============================================================================
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_race_total_participants() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE races SET total_participants = (
+                    SELECT coalesce(sum(total_participants), 0) FROM race_days WHERE race_id = OLD.race_id
+                ) WHERE id = OLD.race_id;
+            END IF;
+            IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.race_id IS DISTINCT FROM OLD.race_id) THEN
+                UPDATE races SET total_participants = (
+                    SELECT coalesce(sum(total_participants), 0) FROM race_days WHERE race_id = NEW.race_id
+                ) WHERE id = NEW.race_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_race_days_sync_total_participants
+        AFTER INSERT OR DELETE OR UPDATE OF race_id, total_participants ON race_days
+        FOR EACH ROW EXECUTE FUNCTION sync_race_total_participants()
+    """)
+
+    # ============================================================================
+    # BACKFILL
+    # ============================================================================
+    op.execute("""
+        UPDATE races r SET total_participants = d.total
+        FROM (
+            SELECT race_id, coalesce(sum(total_participants), 0) AS total
+            FROM race_days GROUP BY race_id
+        ) d
+        WHERE d.race_id = r.id
+    """)
+
+
+def downgrade():
+    op.execute("DROP TRIGGER IF EXISTS trg_race_days_sync_total_participants ON race_days")
+    op.execute("DROP FUNCTION IF EXISTS sync_race_total_participants()")
+    op.drop_column('races', 'total_participants')
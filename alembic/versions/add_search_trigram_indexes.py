@@ -0,0 +1,48 @@
+"""Add trigram indexes for the remaining admin search columns
+
+Revision ID: add_search_trigram_indexes_001
+Revises: add_partial_status_indexes_001
+Create Date: 2026-10-16
+
+Admin list searches OR an ILIKE '%term%' across several columns. Postgres can
+only combine trigram indexes for an OR when every branch is indexed; one
+unindexed column (bull registration number, owner email, race address) sends
+the whole search back to a sequential scan.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_search_trigram_indexes_001'
+down_revision = 'add_partial_status_indexes_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # ============================================================================
+    # BULLS TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_bulls_registration_number_trgm', 'bulls', ['registration_number'],
+                    unique=False, postgresql_using='gin',
+                    postgresql_ops={'registration_number': 'gin_trgm_ops'})
+
+    # ============================================================================
+    # OWNERS TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_owners_email_trgm', 'owners', ['email'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+
+    # ============================================================================
+    # RACES TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_races_address_trgm', 'races', ['address'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'address': 'gin_trgm_ops'})
+
+
+def downgrade():
+    op.drop_index('ix_races_address_trgm', table_name='races')
+    op.drop_index('ix_owners_email_trgm', table_name='owners')
+    op.drop_index('ix_bulls_registration_number_trgm', table_name='bulls')
@@ -0,0 +1,52 @@
+"""Add trigram indexes for name/address search
+
+Revision ID: add_trigram_indexes_001
+Revises: add_covering_indexes_001
+Create Date: 2026-10-16
+
+Public and admin search use ILIKE '%term%', which a btree index can't serve.
+pg_trgm GIN indexes let Postgres answer those substring matches from the index.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_trigram_indexes_001'
+down_revision = 'add_covering_indexes_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # ============================================================================
+    # BULLS TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_bulls_name_trgm', 'bulls', ['name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+    # ============================================================================
+    # OWNERS TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_owners_full_name_trgm', 'owners', ['full_name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'})
+    op.create_index('ix_owners_phone_number_trgm', 'owners', ['phone_number'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'phone_number': 'gin_trgm_ops'})
+    op.create_index('ix_owners_address_trgm', 'owners', ['address'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'address': 'gin_trgm_ops'})
+
+    # ============================================================================
+    # RACES TABLE INDEXES
+    # ============================================================================
+    op.create_index('ix_races_name_trgm', 'races', ['name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade():
+    op.drop_index('ix_races_name_trgm', table_name='races')
+    op.drop_index('ix_owners_address_trgm', table_name='owners')
+    op.drop_index('ix_owners_phone_number_trgm', table_name='owners')
+    op.drop_index('ix_owners_full_name_trgm', table_name='owners')
+    op.drop_index('ix_bulls_name_trgm', table_name='bulls')
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,37 @@
+"""Add server defaults for user_bulls_sell timestamps
+
+Revision ID: add_user_bulls_sell_ts_defaults_001
+Revises: add_active_listings_by_user_001
+Create Date: 2026-10-16
+
+created_at, updated_at and expires_at are now filled in by the database
+(naive UTC, matching the existing rows) instead of by the API, so a listing
+INSERT doesn't have to carry Python-computed timestamps.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_user_bulls_sell_ts_defaults_001'
+down_revision = 'add_active_listings_by_user_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ============================================================================
+    # USER_BULLS_SELL TIMESTAMP DEFAULTS
+    # ============================================================================
+    op.alter_column('user_bulls_sell', 'created_at',
+                    server_default=sa.text("timezone('utc', now())"))
+    op.alter_column('user_bulls_sell', 'updated_at',
+                    server_default=sa.text("timezone('utc', now())"))
+    op.alter_column('user_bulls_sell', 'expires_at',
+                    server_default=sa.text("timezone('utc', now()) + interval '30 days'"))
+
+
+def downgrade():
+    op.alter_column('user_bulls_sell', 'expires_at', server_default=None)
+    op.alter_column('user_bulls_sell', 'updated_at', server_default=None)
+    op.alter_column('user_bulls_sell', 'created_at', server_default=None)
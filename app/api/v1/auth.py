@@ -1,8 +1,9 @@
 """
 Public user authentication endpoints
 """
+import time
 from datetime import timedelta, datetime
-from typing import Annotated, Optional
+from typing import Annotated, Dict, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
@@ -19,6 +20,36 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 # OAuth2 scheme for user authentication
 oauth2_user_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Fields of User handed to endpoints, cached per username so each authenticated
+# request doesn't query users (the JWT is still verified on every request)
+_APP_USER_FIELDS = ("id", "username", "email", "full_name", "phone", "is_active",
+                    "last_login", "created_at", "updated_at")
+_app_user_cache: Dict[str, Tuple[float, Tuple]] = {}
+_APP_USER_CACHE_MAX_ENTRIES = 10000
+
+
+def _load_app_user(db: Session, username: str) -> Optional[User]:
+    """
+    Detached User snapshot for username, from the cache or the database
+
+    Returns None if no such user exists (misses are not cached).
+    """
+    now = time.monotonic()
+    entry = _app_user_cache.get(username)
+    if entry is None or entry[0] <= now:
+        user = db.query(User).filter(User.username == username).first()
+        if user is None:
+            _app_user_cache.pop(username, None)
+            return None
+        if len(_app_user_cache) >= _APP_USER_CACHE_MAX_ENTRIES:
+            _app_user_cache.clear()
+        entry = (
+            now + settings.APP_AUTH_CACHE_SECONDS,
+            tuple(getattr(user, field) for field in _APP_USER_FIELDS)
+        )
+        _app_user_cache[username] = entry
+    return User(**dict(zip(_APP_USER_FIELDS, entry[1])))
+
 
 async def get_current_app_user(
     token: str = Depends(oauth2_user_scheme),
@@ -42,8 +73,8 @@ async def get_current_app_user(
     if username is None:
         raise credentials_exception
 
-    # Get user from database
-    user = db.query(User).filter(User.username == username).first()
+    # Get user (cached for APP_AUTH_CACHE_SECONDS)
+    user = _load_app_user(db, username)
     if user is None:
         raise credentials_exception
 
@@ -188,6 +219,14 @@ async def update_profile(
     db: Session = Depends(get_db)
 ):
     """Update user profile - requires authentication"""
+    # current_user is a cached snapshot; load the row to update
+    old_username = current_user.username
+    current_user = db.get(User, current_user.id)
+    if current_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
 
     # Check if username is being changed and if it's already taken
     if request.username and request.username != current_user.username:
@@ -220,6 +259,7 @@ async def update_profile(
     current_user.updated_at = datetime.utcnow()
 
     db.commit()
+    _app_user_cache.pop(old_username, None)
     db.refresh(current_user)
 
     return current_user
@@ -5,7 +5,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from app.core.dependencies import get_current_active_admin
 from app.db.base import get_db
@@ -13,6 +13,7 @@ from app.models.admin import AdminUser
 from app.models.bull import Bull
 from app.models.owner import Owner
 from app.schemas.bull import BullCreate, BullUpdate, BullResponse
+from app.services.response_cache import response_cache
 
 router = APIRouter(prefix="/admin/bulls", tags=["Admin - Bulls"])
 
@@ -51,6 +52,7 @@ async def create_bull(
     db_bull = Bull(**bull.model_dump())
     db.add(db_bull)
     db.commit()
+    response_cache.invalidate("owner_detail", "race_results", "search")
     db.refresh(db_bull)
     
     if db_bull.photo_url:
@@ -88,18 +90,27 @@ async def list_bulls(
         query = query.filter(Bull.is_active == is_active)
 
     total = query.count()
-    bulls = query.order_by(Bull.name).offset(skip).limit(limit).all()
+    # Owners come back in the same query; any other lazy load raises instead of
+    # silently issuing one query per bull
+    bulls = (
+        query.options(joinedload(Bull.owner), raiseload("*"))
+        .order_by(Bull.name)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+    # Sign URLs concurrently
+    photo_urls = await storage_service.generate_signed_urls(bull.photo_url for bull in bulls)
 
     # Enrich bulls with owner_name
     result = []
     for bull in bulls:
-        # Sign URL
         if bull.photo_url:
-            bull.photo_url = storage_service.generate_signed_url(bull.photo_url)
-            
+            bull.photo_url = photo_urls.get(bull.photo_url)
+
         bull_dict = BullResponse.model_validate(bull).model_dump()
-        owner = db.query(Owner).filter(Owner.id == bull.owner_id).first()
-        bull_dict['owner_name'] = owner.full_name if owner else 'Unknown'
+        bull_dict['owner_name'] = bull.owner.full_name if bull.owner else 'Unknown'
         result.append(bull_dict)
 
     return {
@@ -160,19 +171,17 @@ async def update_bull(
             )
 
     # Delete old images from storage if photo_url or thumbnail_url is being updated
-    if 'photo_url' in update_data and update_data['photo_url'] != bull.photo_url:
-        if bull.photo_url:
-            storage_service.delete_file(bull.photo_url)
-
-    if 'thumbnail_url' in update_data and update_data['thumbnail_url'] != bull.thumbnail_url:
-        if bull.thumbnail_url:
-            storage_service.delete_file(bull.thumbnail_url)
+    await storage_service.delete_files(
+        getattr(bull, field) for field in ('photo_url', 'thumbnail_url')
+        if field in update_data and update_data[field] != getattr(bull, field)
+    )
 
     # Apply updates
     for field, value in update_data.items():
         setattr(bull, field, value)
 
     db.commit()
+    response_cache.invalidate("owner_detail", "race_results", "search")
     db.refresh(bull)
 
     if bull.photo_url:
@@ -196,11 +205,9 @@ async def delete_bull(
         )
 
     # Delete images from storage before deleting bull
-    if bull.photo_url:
-        storage_service.delete_file(bull.photo_url)
-    if bull.thumbnail_url:
-        storage_service.delete_file(bull.thumbnail_url)
+    await storage_service.delete_files([bull.photo_url, bull.thumbnail_url])
 
     db.delete(bull)
     db.commit()
+    response_cache.invalidate("owner_detail", "race_results", "search")
     return None
@@ -78,18 +78,18 @@ async def get_dashboard_stats(
         },
         "upcoming_races": [
             {
-                "id": str(race.id),
+                "id": race.id,
                 "name": race.name,
-                "date": race.start_date.isoformat(),
+                "date": race.start_date,
                 "address": race.address
             }
             for race in upcoming_races
         ],
         "recent_races": [
             {
-                "id": str(race.id),
+                "id": race.id,
                 "name": race.name,
-                "date": race.start_date.isoformat(),
+                "date": race.start_date,
                 "participants": race.total_participants,
                 "address": race.address
             }
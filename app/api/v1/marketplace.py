@@ -12,6 +12,7 @@ from app.core.dependencies import get_current_active_admin
 from app.db.base import get_db
 from app.models.admin import AdminUser
 from app.models.marketplace import MarketplaceListing
+from app.services.response_cache import response_cache
 from app.services.storage import storage_service
 
 router = APIRouter(prefix="/admin/marketplace", tags=["Admin - Marketplace"])
@@ -67,10 +68,11 @@ async def list_marketplace_items(
         
     items = query.order_by(MarketplaceListing.created_at.desc()).offset(skip).limit(limit).all()
     
-    # Generate signed URLs for all items
+    # Generate signed URLs for all items concurrently
+    image_urls = await storage_service.generate_signed_urls(item.image_url for item in items)
     for item in items:
         if item.image_url:
-            item.image_url = storage_service.generate_signed_url(item.image_url)
+            item.image_url = image_urls.get(item.image_url)
             
     return items
 
@@ -153,10 +155,7 @@ async def update_marketplace_item(
     if image:
         try:
             # Delete old image and thumbnail if they exist
-            if listing.image_url:
-                storage_service.delete_file(listing.image_url)
-            if listing.thumbnail_url:
-                storage_service.delete_file(listing.thumbnail_url)
+            await storage_service.delete_files([listing.image_url, listing.thumbnail_url])
 
             # Upload new with thumbnail generation
             new_path, new_thumbnail_path = await storage_service.upload_bull_image(image, folder="selling_bulls")
@@ -169,6 +168,7 @@ async def update_marketplace_item(
             )
 
     db.commit()
+    response_cache.invalidate("available_bull_detail")
     db.refresh(listing)
     
     # Sign URL for response
@@ -189,11 +189,9 @@ async def delete_marketplace_item(
         raise HTTPException(status_code=404, detail="Listing not found")
         
     # Delete image and thumbnail from storage
-    if listing.image_url:
-        storage_service.delete_file(listing.image_url)
-    if listing.thumbnail_url:
-        storage_service.delete_file(listing.thumbnail_url)
+    await storage_service.delete_files([listing.image_url, listing.thumbnail_url])
 
     db.delete(listing)
     db.commit()
+    response_cache.invalidate("available_bull_detail")
     return None
@@ -5,7 +5,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from typing import List
+from uuid import UUID
 import logging
+import os
 
 from app.db.base import get_db
 from app.models.device_token import DeviceToken
@@ -15,6 +17,7 @@ from app.core.auth import get_current_user_optional
 from app.core.dependencies import get_current_active_admin
 from app.models.user import User
 from app.models.admin import AdminUser
+from app.models.race import Race
 
 logger = logging.getLogger(__name__)
 
@@ -173,15 +176,12 @@ async def send_race_notification(
     - **notification_type**: "one_day_before" or "race_day"
     - **FREE**: Uses Firebase topic messaging (no cost)
     """
-    from app.models.race import Race
     from app.services.firebase_service import firebase_service
-    from uuid import UUID
 
     try:
         # Initialize Firebase (only initializes once due to singleton pattern)
         # Note: firebase_service is already initialized at app startup in main.py
         # This is just a safety check
-        import os
         try:
             firebase_key_path = "/secrets/firebase-key.json" if os.path.exists("/secrets/firebase-key.json") else "firebase-key.json"
             firebase_service.initialize(firebase_key_path)
@@ -5,7 +5,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from app.core.dependencies import get_current_active_admin
 from app.db.base import get_db
@@ -13,6 +13,7 @@ from app.models.admin import AdminUser
 from app.models.owner import Owner
 from app.models.bull import Bull
 from app.schemas.owner import OwnerCreate, OwnerUpdate, OwnerResponse
+from app.services.response_cache import response_cache
 
 router = APIRouter(prefix="/admin/owners", tags=["Admin - Owners"])
 
@@ -29,6 +30,7 @@ async def create_owner(
     db_owner = Owner(**owner.model_dump())
     db.add(db_owner)
     db.commit()
+    response_cache.invalidate("search")
     db.refresh(db_owner)
     
     # Sign URL if present (though create likely sends URL string, we might want to ensure it's valid)
@@ -60,12 +62,13 @@ async def list_owners(
         )
 
     total = query.count()
-    owners = query.order_by(Owner.full_name).offset(skip).limit(limit).all()
+    owners = query.options(raiseload("*")).order_by(Owner.full_name).offset(skip).limit(limit).all()
     
-    # Generate signed URLs
+    # Generate signed URLs concurrently
+    photo_urls = await storage_service.generate_signed_urls(owner.photo_url for owner in owners)
     for owner in owners:
         if owner.photo_url:
-            owner.photo_url = storage_service.generate_signed_url(owner.photo_url)
+            owner.photo_url = photo_urls.get(owner.photo_url)
 
     return {
         "data": owners,
@@ -114,18 +117,16 @@ async def update_owner(
     update_data = owner_update.model_dump(exclude_unset=True)
 
     # Delete old images from storage if photo_url or thumbnail_url is being updated
-    if 'photo_url' in update_data and update_data['photo_url'] != owner.photo_url:
-        if owner.photo_url:
-            storage_service.delete_file(owner.photo_url)
-
-    if 'thumbnail_url' in update_data and update_data['thumbnail_url'] != owner.thumbnail_url:
-        if owner.thumbnail_url:
-            storage_service.delete_file(owner.thumbnail_url)
+    await storage_service.delete_files(
+        getattr(owner, field) for field in ('photo_url', 'thumbnail_url')
+        if field in update_data and update_data[field] != getattr(owner, field)
+    )
 
     for field, value in update_data.items():
         setattr(owner, field, value)
 
     db.commit()
+    response_cache.invalidate("owner_detail", "race_results", "search")
     db.refresh(owner)
 
     if owner.photo_url:
@@ -158,11 +159,9 @@ async def delete_owner(
         )
 
     # Delete images from storage before deleting owner
-    if owner.photo_url:
-        storage_service.delete_file(owner.photo_url)
-    if owner.thumbnail_url:
-        storage_service.delete_file(owner.thumbnail_url)
+    await storage_service.delete_files([owner.photo_url, owner.thumbnail_url])
 
     db.delete(owner)
     db.commit()
+    response_cache.invalidate("owner_detail", "race_results", "search")
     return None
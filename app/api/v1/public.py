@@ -1,30 +1,88 @@
 """
 Public APIs for mobile app (no authentication required)
 """
+from operator import attrgetter
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, case
+from fastapi.responses import Response
+from sqlalchemy import func, or_, case, select, literal, null
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.db.base import get_db
+from app.core.config import settings
+from app.db.base import get_async_db
 from app.models.bull import Bull
 from app.models.owner import Owner
 from app.models.race import Race, RaceDay, RaceResult
 from app.models.marketplace import MarketplaceListing
 from app.models.user_bull import UserBullSell
+from app.models.bull_stats import bull_stats
 from app.schemas.bull import BullResponse
 from app.schemas.race import RaceResponse
+from app.services.response_cache import response_cache
 from app.services.storage import storage_service
+from app.utils.responses import FastJSONResponse
+from app.utils.row_builders import make_row_builder
+from app.utils.sql import any_of
 
 router = APIRouter(prefix="/public", tags=["Public APIs"])
 
+# Compiled once at import; used to serialize column-select rows in list endpoints
+_build_bull_list_item = make_row_builder(
+    ["id", "name", "photo_url", "breed", "color", "birth_year", "registration_number",
+     "owner_name", "owner_address", "statistics"],
+    extra=["photo_url", "statistics"],
+)
+_build_available_bull = make_row_builder(
+    ["id", "name", "owner_name", "owner_mobile", "location", "price", "image_url",
+     "description", "status", "created_at", "source"],
+    extra=["image_url", "source"],
+)
+_build_user_bull_for_sale = make_row_builder(
+    ["id", "name", "breed", "birth_year", "color", "description", "price", "image_url",
+     "location", "owner_name", "owner_mobile", "status", "created_at", "expires_at",
+     "days_remaining"],
+    extra=["image_url", "days_remaining"],
+)
+
+# Reads every field an owner's bull list item needs in one C-level call per ORM row
+_owner_bull_fields = attrgetter(
+    "id", "name", "thumbnail_url", "photo_url", "breed", "color", "birth_year",
+    "registration_number",
+)
+
+# Columns selected (as row tuples, not ORM objects) for race and race day listings
+_RACE_LIST_COLUMNS = (
+    Race.id, Race.name, Race.description, Race.start_date, Race.end_date, Race.address,
+    Race.gps_location, Race.management_contact, Race.track_length, Race.track_length_unit,
+    Race.status, Race.created_by, Race.created_at, Race.updated_at,
+)
+_build_race_list_item = make_row_builder([column.key for column in _RACE_LIST_COLUMNS])
+
+_RACE_DAY_LIST_COLUMNS = (
+    RaceDay.id, RaceDay.race_id, RaceDay.day_number, RaceDay.race_date, RaceDay.day_subtitle,
+    RaceDay.status, RaceDay.total_participants, RaceDay.created_at, RaceDay.updated_at,
+)
+_build_race_day_list_item = make_row_builder([column.key for column in _RACE_DAY_LIST_COLUMNS])
+
+
+def _bull_list_statistics(stats) -> dict:
+    """Statistics block for bull list items from a bull_stats row (None if never raced)"""
+    if stats is None:
+        return {"total_races": 0, "first_place_wins": 0, "best_time_milliseconds": None}
+    return {
+        "total_races": stats.total_races,
+        "first_place_wins": stats.first_place_wins,
+        "best_time_milliseconds": stats.best_time_milliseconds
+    }
+
 
 @router.get("/dashboard")
 async def get_dashboard_public(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     OPTIMIZED: Get both recent and upcoming races in a single API call
@@ -35,27 +93,24 @@ async def get_dashboard_public(
 
     Performance: ~500ms vs 4000ms (2 separate calls)
     """
-    from datetime import datetime
-
     now = datetime.now().date()
 
-    # Parallel queries - both executed in same database round trip
-    recent_races = db.query(Race).filter(
-        Race.end_date < now
-    ).order_by(Race.end_date.desc()).limit(4).all()
+    recent_races = (await db.scalars(
+        select(Race).where(Race.end_date < now).order_by(Race.end_date.desc()).limit(4)
+    )).all()
 
-    upcoming_races = db.query(Race).filter(
-        Race.start_date >= now
-    ).order_by(Race.start_date.asc()).limit(4).all()
+    upcoming_races = (await db.scalars(
+        select(Race).where(Race.start_date >= now).order_by(Race.start_date.asc()).limit(4)
+    )).all()
 
-    return {
+    return FastJSONResponse({
         "recent": [
             {
-                "id": str(race.id),
+                "id": race.id,
                 "name": race.name,
                 "description": race.description,
-                "start_date": race.start_date.isoformat(),
-                "end_date": race.end_date.isoformat(),
+                "start_date": race.start_date,
+                "end_date": race.end_date,
                 "address": race.address,
                 "gps_location": race.gps_location,
                 "status": race.status
@@ -64,18 +119,18 @@ async def get_dashboard_public(
         ],
         "upcoming": [
             {
-                "id": str(race.id),
+                "id": race.id,
                 "name": race.name,
                 "description": race.description,
-                "start_date": race.start_date.isoformat(),
-                "end_date": race.end_date.isoformat(),
+                "start_date": race.start_date,
+                "end_date": race.end_date,
                 "address": race.address,
                 "gps_location": race.gps_location,
                 "status": race.status
             }
             for race in upcoming_races
         ]
-    }
+    })
 
 
 # ============================================================================
@@ -87,115 +142,71 @@ async def list_bulls_public(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     search: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List bulls with statistics (public) - OPTIMIZED
 
     Performance improvements:
-    - Eager loads owners to avoid N+1 queries
-    - Batch fetches statistics for all bulls
+    - Selects only the needed columns (joined with owner) as row tuples
+    - Reads statistics for all bulls from the bull_stats materialized view
     - Serves direct CDN URLs (no signing for public images)
     """
-    from sqlalchemy.orm import joinedload
-
-    # Eager load owners in single query
-    query = db.query(Bull).options(joinedload(Bull.owner)).filter(Bull.is_active == True)
+    # Column select instead of ORM hydration - rows are plain named tuples
+    query = select(
+        Bull.id, Bull.name, Bull.thumbnail_url, Bull.photo_url, Bull.breed,
+        Bull.color, Bull.birth_year, Bull.registration_number,
+        Owner.full_name.label("owner_name"), Owner.address.label("owner_address")
+    ).join(Owner, Owner.id == Bull.owner_id, isouter=True).where(Bull.is_active == True)
 
     if search:
-        query = query.filter(Bull.name.ilike(f"%{search}%"))
+        query = query.where(Bull.name.ilike(f"%{search}%"))
 
-    bulls = query.order_by(Bull.name).offset(skip).limit(limit).all()
+    bulls = (await db.execute(query.order_by(Bull.name).offset(skip).limit(limit))).all()
 
     if not bulls:
-        return []
+        return FastJSONResponse([])
 
-    # Batch fetch statistics for all bulls in 3 queries instead of N queries
+    # Precomputed statistics for all bulls in one keyed lookup
     bull_ids = [bull.id for bull in bulls]
-
-    # Query 1: Total races for all bulls
-    total_races_subq = db.query(
-        func.coalesce(RaceResult.bull1_id, RaceResult.bull2_id).label('bull_id'),
-        func.count(RaceResult.id).label('count')
-    ).filter(
-        and_(
-            or_(RaceResult.bull1_id.in_(bull_ids), RaceResult.bull2_id.in_(bull_ids)),
-            RaceResult.is_disqualified == False
-        )
-    ).group_by('bull_id').all()
-
-    total_races_map = {str(row.bull_id): row.count for row in total_races_subq}
-
-    # Query 2: First place wins for all bulls
-    wins_subq = db.query(
-        func.coalesce(RaceResult.bull1_id, RaceResult.bull2_id).label('bull_id'),
-        func.count(RaceResult.id).label('count')
-    ).filter(
-        and_(
-            or_(RaceResult.bull1_id.in_(bull_ids), RaceResult.bull2_id.in_(bull_ids)),
-            RaceResult.position == 1,
-            RaceResult.is_disqualified == False
+    stats_map = {
+        row.bull_id: row for row in await db.execute(
+            select(
+                bull_stats.c.bull_id,
+                bull_stats.c.total_races,
+                bull_stats.c.first_place_wins,
+                bull_stats.c.best_time_milliseconds
+            ).where(any_of(bull_stats.c.bull_id, bull_ids))
         )
-    ).group_by('bull_id').all()
-
-    wins_map = {str(row.bull_id): row.count for row in wins_subq}
-
-    # Query 3: Best times for all bulls
-    best_times_subq = db.query(
-        func.coalesce(RaceResult.bull1_id, RaceResult.bull2_id).label('bull_id'),
-        func.min(RaceResult.time_milliseconds).label('best_time')
-    ).filter(
-        and_(
-            or_(RaceResult.bull1_id.in_(bull_ids), RaceResult.bull2_id.in_(bull_ids)),
-            RaceResult.is_disqualified == False
-        )
-    ).group_by('bull_id').all()
+    }
 
-    best_times_map = {str(row.bull_id): row.best_time for row in best_times_subq}
+    # Resolve all image URLs in one parallel pass; use thumbnail for list view (much smaller file size)
+    # Direct public URLs (falls back to 7-day signed URLs so mobile apps can cache)
+    photo_urls = await storage_service.get_public_urls(
+        (bull.thumbnail_url or bull.photo_url for bull in bulls), expiration=604800
+    )
 
-    # Build response with signed URLs (7-day expiration for mobile app caching)
     result = []
     for bull in bulls:
-        bull_id_str = str(bull.id)
+        result.append(_build_bull_list_item(
+            bull,
+            photo_url=photo_urls.get(bull.thumbnail_url or bull.photo_url),
+            statistics=_bull_list_statistics(stats_map.get(bull.id))
+        ))
 
-        # Use thumbnail for list view (much smaller file size)
-        thumbnail_path = bull.thumbnail_url or bull.photo_url
-        if thumbnail_path:
-            # Generate long-lived signed URL (7 days) so mobile apps can cache
-            photo_url = storage_service.generate_signed_url(thumbnail_path, expiration=604800)  # 7 days
-        else:
-            photo_url = None
-
-        result.append({
-            "id": bull_id_str,
-            "name": bull.name,
-            "photo_url": photo_url,  # Signed URL valid for 7 days
-            "breed": bull.breed,
-            "color": bull.color,
-            "birth_year": bull.birth_year,
-            "registration_number": bull.registration_number,
-            "owner_name": bull.owner.full_name if bull.owner else None,
-            "owner_address": bull.owner.address if bull.owner else None,
-            "statistics": {
-                "total_races": total_races_map.get(bull_id_str, 0),
-                "first_place_wins": wins_map.get(bull_id_str, 0),
-                "best_time_milliseconds": best_times_map.get(bull_id_str)
-            }
-        })
-
-    return result
+    return FastJSONResponse(result)
 
 
 @router.get("/bulls/{bull_id}", response_model=dict)
 async def get_bull_detail_public(
     bull_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get detailed bull information with statistics (public)"""
-    bull = db.query(Bull).filter(
+    bull = await db.scalar(select(Bull).where(
         Bull.id == bull_id,
         Bull.is_active == True
-    ).first()
+    ))
 
     if not bull:
         raise HTTPException(
@@ -203,54 +214,20 @@ async def get_bull_detail_public(
             detail="Bull not found"
         )
 
-    # Get comprehensive statistics (bull can be bull1 or bull2)
-    total_races = db.query(func.count(RaceResult.id)).filter(
-        and_(
-            or_(RaceResult.bull1_id == bull.id, RaceResult.bull2_id == bull.id),
-            RaceResult.is_disqualified == False
-        )
-    ).scalar()
-
-    first_place_wins = db.query(func.count(RaceResult.id)).filter(
-        and_(
-            or_(RaceResult.bull1_id == bull.id, RaceResult.bull2_id == bull.id),
-            RaceResult.position == 1,
-            RaceResult.is_disqualified == False
-        )
-    ).scalar()
-
-    second_place = db.query(func.count(RaceResult.id)).filter(
-        and_(
-            or_(RaceResult.bull1_id == bull.id, RaceResult.bull2_id == bull.id),
-            RaceResult.position == 2,
-            RaceResult.is_disqualified == False
-        )
-    ).scalar()
-
-    third_place = db.query(func.count(RaceResult.id)).filter(
-        and_(
-            or_(RaceResult.bull1_id == bull.id, RaceResult.bull2_id == bull.id),
-            RaceResult.position == 3,
-            RaceResult.is_disqualified == False
-        )
-    ).scalar()
-
-    best_time = db.query(func.min(RaceResult.time_milliseconds)).filter(
-        and_(
-            or_(RaceResult.bull1_id == bull.id, RaceResult.bull2_id == bull.id),
-            RaceResult.is_disqualified == False
-        )
-    ).scalar()
+    # Comprehensive statistics from the bull_stats materialized view
+    stats = (await db.execute(
+        select(bull_stats).where(bull_stats.c.bull_id == bull.id)
+    )).first()
 
-    avg_time = db.query(func.avg(RaceResult.time_milliseconds)).filter(
-        and_(
-            or_(RaceResult.bull1_id == bull.id, RaceResult.bull2_id == bull.id),
-            RaceResult.is_disqualified == False
-        )
-    ).scalar()
+    total_races = stats.total_races if stats else 0
+    first_place_wins = stats.first_place_wins if stats else 0
+    second_place = stats.second_place_wins if stats else 0
+    third_place = stats.third_place_wins if stats else 0
+    best_time = stats.best_time_milliseconds if stats else None
+    avg_time = stats.avg_time_milliseconds if stats else None
 
     # Get owner details
-    owner = db.query(Owner).filter(Owner.id == bull.owner_id).first()
+    owner = await db.get(Owner, bull.owner_id) if bull.owner_id else None
 
     # Generate signed URL for owner photo
     owner_photo_url = None
@@ -266,10 +243,10 @@ async def get_bull_detail_public(
     # For detail view, serve ORIGINAL high-quality image (not thumbnail)
     photo_url = None
     if bull.photo_url:
-        photo_url = storage_service.generate_signed_url(bull.photo_url, expiration=604800)  # 7 days
+        photo_url = storage_service.get_public_url(bull.photo_url, expiration=604800)
 
-    return {
-        "id": str(bull.id),
+    return FastJSONResponse({
+        "id": bull.id,
         "name": bull.name,
         "photo_url": photo_url,  # Original image for detail view (~100-200 KB)
         "breed": bull.breed,
@@ -278,7 +255,7 @@ async def get_bull_detail_public(
         "registration_number": bull.registration_number,
         "description": bull.description,
         "owner": {
-            "id": str(owner.id) if owner else None,
+            "id": owner.id if owner else None,
             "name": owner.full_name if owner else None,
             "phone": owner.phone_number if owner else None,
             "email": owner.email if owner else None,
@@ -296,7 +273,7 @@ async def get_bull_detail_public(
             "avg_time_formatted": f"{avg_time / 1000:.2f}s" if avg_time else None
         },
         "recent_races": recent_races
-    }
+    })
 
 
 # ============================================================================
@@ -308,7 +285,7 @@ async def list_owners_public(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     search: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     OPTIMIZED: List owners with bull count (public)
@@ -321,11 +298,14 @@ async def list_owners_public(
     - **limit**: Maximum number of records to return
     - **search**: Search by owner name, phone, or address
     """
-    query = db.query(Owner)
+    query = select(
+        Owner.id, Owner.full_name, Owner.address, Owner.phone_number,
+        Owner.thumbnail_url, Owner.photo_url
+    )
 
     if search:
         search_filter = f"%{search}%"
-        query = query.filter(
+        query = query.where(
             or_(
                 Owner.full_name.ilike(search_filter),
                 Owner.phone_number.ilike(search_filter),
@@ -340,57 +320,58 @@ async def list_owners_public(
         (Owner.thumbnail_url.isnot(None), 0),
         else_=1
     )
-    owners = query.order_by(has_photo, Owner.full_name).offset(skip).limit(limit).all()
+    owners = (await db.execute(query.order_by(has_photo, Owner.full_name).offset(skip).limit(limit))).all()
 
     if not owners:
-        return []
+        return FastJSONResponse([])
 
     # OPTIMIZATION: Batch fetch bull counts for all owners in a single query
     owner_ids = [owner.id for owner in owners]
-    bull_counts_subq = db.query(
-        Bull.owner_id,
-        func.count(Bull.id).label('count')
-    ).filter(
-        Bull.owner_id.in_(owner_ids),
-        Bull.is_active == True
-    ).group_by(Bull.owner_id).all()
+    bull_counts_subq = (await db.execute(
+        select(
+            Bull.owner_id,
+            func.count(Bull.id).label('count')
+        ).where(
+            any_of(Bull.owner_id, owner_ids),
+            Bull.is_active == True
+        ).group_by(Bull.owner_id)
+    )).all()
 
     # Create a map of owner_id -> bull_count
-    bull_counts_map = {str(row.owner_id): row.count for row in bull_counts_subq}
+    bull_counts_map = {row.owner_id: row.count for row in bull_counts_subq}
 
-    # Build response
-    result = []
-    for owner in owners:
-        owner_id_str = str(owner.id)
-
-        # Use thumbnail for list view (prefer thumbnail, fallback to original)
-        thumbnail_path = owner.thumbnail_url or owner.photo_url
-        photo_url = None
-        if thumbnail_path:
-            try:
-                photo_url = storage_service.generate_signed_url(thumbnail_path, expiration=604800)
-            except:
-                photo_url = None
-
-        result.append({
-            "id": owner_id_str,
-            "name": owner.full_name,
-            "photo_url": photo_url,  # Thumbnail for fast list view
-            "address": owner.address,
-            "phone": owner.phone_number,
-            "bull_count": bull_counts_map.get(owner_id_str, 0)
-        })
+    # Use thumbnail for list view (prefer thumbnail, fallback to original), signed in one parallel pass
+    photo_urls = await storage_service.generate_signed_urls(
+        (owner.thumbnail_url or owner.photo_url for owner in owners), expiration=604800
+    )
 
-    return result
+    # Rows are plain tuples in select order; unpacking them avoids a named
+    # attribute lookup per field
+    return FastJSONResponse([
+        {
+            "id": oid,
+            "name": name,
+            "photo_url": photo_urls.get(thumb or photo),  # Thumbnail for fast list view
+            "address": address,
+            "phone": phone,
+            "bull_count": bull_counts_map.get(oid, 0)
+        }
+        for oid, name, address, phone, thumb, photo in owners
+    ])
 
 
 @router.get("/owners/{owner_id}", response_model=dict)
 async def get_owner_detail_public(
     owner_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get detailed owner information (public)"""
-    owner = db.query(Owner).filter(Owner.id == owner_id).first()
+    cache_key = ("owner_detail", owner_id)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    owner = await db.get(Owner, owner_id)
 
     if not owner:
         raise HTTPException(
@@ -399,10 +380,10 @@ async def get_owner_detail_public(
         )
 
     # Count active bulls
-    bull_count = db.query(func.count(Bull.id)).filter(
+    bull_count = await db.scalar(select(func.count(Bull.id)).where(
         Bull.owner_id == owner.id,
         Bull.is_active == True
-    ).scalar()
+    ))
 
     # Generate signed URL for photo
     photo_url = None
@@ -412,16 +393,18 @@ async def get_owner_detail_public(
         except:
             photo_url = None
 
-    return {
-        "id": str(owner.id),
+    response = FastJSONResponse({
+        "id": owner.id,
         "name": owner.full_name,
         "photo_url": photo_url,
         "phone": owner.phone_number,
         "email": owner.email,
         "address": owner.address,
         "bull_count": bull_count or 0,
-        "created_at": owner.created_at.isoformat() if owner.created_at else None
-    }
+        "created_at": owner.created_at
+    })
+    response_cache.set(cache_key, response.body, settings.DETAIL_CACHE_SECONDS)
+    return response
 
 
 @router.get("/owners/{owner_id}/bulls", response_model=List[dict])
@@ -429,7 +412,7 @@ async def get_owner_bulls_public(
     owner_id: UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all bulls owned by a specific owner (public)
@@ -437,7 +420,7 @@ async def get_owner_bulls_public(
     Returns bulls with their statistics in the same format as /public/bulls
     """
     # Verify owner exists
-    owner = db.query(Owner).filter(Owner.id == owner_id).first()
+    owner = await db.get(Owner, owner_id)
     if not owner:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -445,87 +428,51 @@ async def get_owner_bulls_public(
         )
 
     # Get bulls for this owner
-    bulls = db.query(Bull).filter(
-        Bull.owner_id == owner_id,
-        Bull.is_active == True
-    ).order_by(Bull.name).offset(skip).limit(limit).all()
+    bulls = (await db.scalars(
+        select(Bull).where(
+            Bull.owner_id == owner_id,
+            Bull.is_active == True
+        ).order_by(Bull.name).offset(skip).limit(limit)
+    )).all()
 
     if not bulls:
-        return []
+        return FastJSONResponse([])
 
-    # Batch fetch statistics for all bulls
+    # Precomputed statistics for all bulls in one keyed lookup
     bull_ids = [bull.id for bull in bulls]
-
-    # Total races
-    total_races_subq = db.query(
-        func.coalesce(RaceResult.bull1_id, RaceResult.bull2_id).label('bull_id'),
-        func.count(RaceResult.id).label('count')
-    ).filter(
-        and_(
-            or_(RaceResult.bull1_id.in_(bull_ids), RaceResult.bull2_id.in_(bull_ids)),
-            RaceResult.is_disqualified == False
+    stats_map = {
+        row.bull_id: row for row in await db.execute(
+            select(
+                bull_stats.c.bull_id,
+                bull_stats.c.total_races,
+                bull_stats.c.first_place_wins,
+                bull_stats.c.best_time_milliseconds
+            ).where(any_of(bull_stats.c.bull_id, bull_ids))
         )
-    ).group_by('bull_id').all()
-
-    total_races_map = {str(row.bull_id): row.count for row in total_races_subq}
-
-    # First place wins
-    wins_subq = db.query(
-        func.coalesce(RaceResult.bull1_id, RaceResult.bull2_id).label('bull_id'),
-        func.count(RaceResult.id).label('count')
-    ).filter(
-        and_(
-            or_(RaceResult.bull1_id.in_(bull_ids), RaceResult.bull2_id.in_(bull_ids)),
-            RaceResult.position == 1,
-            RaceResult.is_disqualified == False
-        )
-    ).group_by('bull_id').all()
-
-    wins_map = {str(row.bull_id): row.count for row in wins_subq}
-
-    # Best times
-    best_times_subq = db.query(
-        func.coalesce(RaceResult.bull1_id, RaceResult.bull2_id).label('bull_id'),
-        func.min(RaceResult.time_milliseconds).label('best_time')
-    ).filter(
-        and_(
-            or_(RaceResult.bull1_id.in_(bull_ids), RaceResult.bull2_id.in_(bull_ids)),
-            RaceResult.is_disqualified == False
-        )
-    ).group_by('bull_id').all()
-
-    best_times_map = {str(row.bull_id): row.best_time for row in best_times_subq}
-
-    # Build response
-    result = []
-    for bull in bulls:
-        bull_id_str = str(bull.id)
-
-        # Use thumbnail for list view
-        thumbnail_path = bull.thumbnail_url or bull.photo_url
-        if thumbnail_path:
-            photo_url = storage_service.generate_signed_url(thumbnail_path, expiration=604800)
-        else:
-            photo_url = None
+    }
 
-        result.append({
-            "id": bull_id_str,
-            "name": bull.name,
-            "photo_url": photo_url,
-            "breed": bull.breed,
-            "color": bull.color,
-            "birth_year": bull.birth_year,
-            "registration_number": bull.registration_number,
-            "owner_name": owner.full_name,
-            "owner_address": owner.address,
-            "statistics": {
-                "total_races": total_races_map.get(bull_id_str, 0),
-                "first_place_wins": wins_map.get(bull_id_str, 0),
-                "best_time_milliseconds": best_times_map.get(bull_id_str)
-            }
-        })
+    # Use thumbnail for list view, resolved in one parallel pass
+    photo_urls = await storage_service.get_public_urls(
+        (bull.thumbnail_url or bull.photo_url for bull in bulls), expiration=604800
+    )
 
-    return result
+    owner_name, owner_address = owner.full_name, owner.address
+    return FastJSONResponse([
+        {
+            "id": bid,
+            "name": name,
+            "photo_url": photo_urls.get(thumb or photo),
+            "breed": breed,
+            "color": color,
+            "birth_year": birth_year,
+            "registration_number": registration_number,
+            "owner_name": owner_name,
+            "owner_address": owner_address,
+            "statistics": _bull_list_statistics(stats_map.get(bid))
+        }
+        for bid, name, thumb, photo, breed, color, birth_year, registration_number
+        in map(_owner_bull_fields, bulls)
+    ])
 
 
 # ============================================================================
@@ -539,7 +486,7 @@ async def list_races_public(
     status_filter: Optional[str] = Query(None, alias="status"),
     from_date: Optional[str] = Query(None),
     to_date: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List races (public)
@@ -550,99 +497,79 @@ async def list_races_public(
     - **from_date**: Filter races from this date
     - **to_date**: Filter races up to this date
     """
-    query = db.query(Race)
+    cache_key = ("races", skip, limit, status_filter, from_date, to_date)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    query = select(*_RACE_LIST_COLUMNS)
 
     if status_filter:
-        query = query.filter(Race.status == status_filter)
+        query = query.where(Race.status == status_filter)
 
     if from_date:
-        from datetime import datetime
         from_date_obj = datetime.fromisoformat(from_date.replace('Z', '+00:00')).date()
-        query = query.filter(Race.start_date >= from_date_obj)
+        query = query.where(Race.start_date >= from_date_obj)
 
     if to_date:
-        from datetime import datetime
         to_date_obj = datetime.fromisoformat(to_date.replace('Z', '+00:00')).date()
-        query = query.filter(Race.end_date <= to_date_obj)
+        query = query.where(Race.end_date <= to_date_obj)
 
     # OPTIMIZED: Removed count() query for better performance (saves ~300-500ms)
     # For infinite scroll, check if results.length < limit to know if more data exists
-    races = query.order_by(Race.start_date.desc()).offset(skip).limit(limit).all()
+    races = (await db.execute(query.order_by(Race.start_date.desc()).offset(skip).limit(limit))).all()
 
-    result = []
-    for race in races:
-        result.append({
-            "id": str(race.id),
-            "name": race.name,
-            "description": race.description,
-            "start_date": race.start_date.isoformat(),
-            "end_date": race.end_date.isoformat(),
-            "address": race.address,
-            "gps_location": race.gps_location,
-            "management_contact": race.management_contact,
-            "track_length": race.track_length,
-            "track_length_unit": race.track_length_unit,
-            "status": race.status,
-            "created_by": race.created_by,
-            "created_at": race.created_at.isoformat() if race.created_at else None,
-            "updated_at": race.updated_at.isoformat() if race.updated_at else None
-        })
+    result = [_build_race_list_item(race) for race in races]
 
-    return {
+    response = FastJSONResponse({
         "data": result,
         "skip": skip,
         "limit": limit,
         "has_more": len(result) == limit  # If we got full limit, there might be more
-    }
+    })
+    response_cache.set(cache_key, response.body, settings.RACES_CACHE_SECONDS)
+    return response
 
 
 @router.get("/races/recent")
 async def get_recent_races_public(
     skip: int = Query(0, ge=0),
     limit: int = Query(4, ge=1, le=20),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get recent completed races (public)
 
     Returns completed races ordered by end date descending
     """
-    query = db.query(Race).filter(Race.status == "completed")
-    total = query.count()
-    races = query.order_by(Race.end_date.desc()).offset(skip).limit(limit).all()
+    cache_key = ("races_recent", skip, limit)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    result = []
-    for race in races:
-        result.append({
-            "id": str(race.id),
-            "name": race.name,
-            "description": race.description,
-            "start_date": race.start_date.isoformat(),
-            "end_date": race.end_date.isoformat(),
-            "address": race.address,
-            "gps_location": race.gps_location,
-            "management_contact": race.management_contact,
-            "track_length": race.track_length,
-            "track_length_unit": race.track_length_unit,
-            "status": race.status,
-            "created_by": race.created_by,
-            "created_at": race.created_at.isoformat() if race.created_at else None,
-            "updated_at": race.updated_at.isoformat() if race.updated_at else None
-        })
+    # No count() query - clients check has_more (same as /races)
+    races = (await db.execute(
+        select(*_RACE_LIST_COLUMNS).where(Race.status == "completed")
+        .order_by(Race.end_date.desc()).offset(skip).limit(limit)
+    )).all()
 
-    return {
+    result = [_build_race_list_item(race) for race in races]
+
+    response = FastJSONResponse({
         "data": result,
-        "total": total,
         "skip": skip,
-        "limit": limit
-    }
+        "limit": limit,
+        "has_more": len(result) == limit
+    })
+    response_cache.set(cache_key, response.body, settings.RECENT_RACES_CACHE_SECONDS)
+    return response
 
 
 @router.get("/races/upcoming")
 async def get_upcoming_races_public(
     skip: int = Query(0, ge=0),
     limit: int = Query(4, ge=1, le=20),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get upcoming scheduled races (public)
@@ -651,47 +578,43 @@ async def get_upcoming_races_public(
     """
     now = datetime.now().date()
 
-    query = db.query(Race).filter(
-        Race.status == "scheduled",
-        Race.start_date >= now
-    )
-    total = query.count()
-    races = query.order_by(Race.start_date.asc()).offset(skip).limit(limit).all()
+    cache_key = ("races_upcoming", now, skip, limit)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    result = []
-    for race in races:
-        result.append({
-            "id": str(race.id),
-            "name": race.name,
-            "description": race.description,
-            "start_date": race.start_date.isoformat(),
-            "end_date": race.end_date.isoformat(),
-            "address": race.address,
-            "gps_location": race.gps_location,
-            "management_contact": race.management_contact,
-            "track_length": race.track_length,
-            "track_length_unit": race.track_length_unit,
-            "status": race.status,
-            "created_by": race.created_by,
-            "created_at": race.created_at.isoformat() if race.created_at else None,
-            "updated_at": race.updated_at.isoformat() if race.updated_at else None
-        })
+    # No count() query - clients check has_more (same as /races)
+    races = (await db.execute(
+        select(*_RACE_LIST_COLUMNS).where(
+            Race.status == "scheduled",
+            Race.start_date >= now
+        ).order_by(Race.start_date.asc()).offset(skip).limit(limit)
+    )).all()
 
-    return {
+    result = [_build_race_list_item(race) for race in races]
+
+    response = FastJSONResponse({
         "data": result,
-        "total": total,
         "skip": skip,
-        "limit": limit
-    }
+        "limit": limit,
+        "has_more": len(result) == limit
+    })
+    response_cache.set(cache_key, response.body, settings.UPCOMING_RACES_CACHE_SECONDS)
+    return response
 
 
 @router.get("/races/{race_id}")
 async def get_race_detail_public(
     race_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get detailed race information (public)"""
-    race = db.query(Race).filter(Race.id == race_id).first()
+    cache_key = ("race_detail", race_id)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    race = await db.get(Race, race_id)
 
     if not race:
         raise HTTPException(
@@ -699,12 +622,12 @@ async def get_race_detail_public(
             detail="Race not found"
         )
 
-    return {
-        "id": str(race.id),
+    response = FastJSONResponse({
+        "id": race.id,
         "name": race.name,
         "description": race.description,
-        "start_date": race.start_date.isoformat(),
-        "end_date": race.end_date.isoformat(),
+        "start_date": race.start_date,
+        "end_date": race.end_date,
         "address": race.address,
         "gps_location": race.gps_location,
         "management_contact": race.management_contact,
@@ -712,9 +635,11 @@ async def get_race_detail_public(
         "track_length_unit": race.track_length_unit,
         "status": race.status,
         "created_by": race.created_by,
-        "created_at": race.created_at.isoformat() if race.created_at else None,
-        "updated_at": race.updated_at.isoformat() if race.updated_at else None
-    }
+        "created_at": race.created_at,
+        "updated_at": race.updated_at
+    })
+    response_cache.set(cache_key, response.body, settings.DETAIL_CACHE_SECONDS)
+    return response
 
 
 # ============================================================================
@@ -726,63 +651,60 @@ async def list_race_days_public(
     race_id: UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     OPTIMIZED: List all race days for a specific race (public)
     Removed unnecessary race existence check and count query
     """
     # Direct query - if race doesn't exist, result will be empty (no error needed)
-    race_days = db.query(RaceDay).filter(
-        RaceDay.race_id == race_id
-    ).order_by(RaceDay.day_number).offset(skip).limit(limit).all()
+    race_days = (await db.execute(
+        select(*_RACE_DAY_LIST_COLUMNS).where(
+            RaceDay.race_id == race_id
+        ).order_by(RaceDay.day_number).offset(skip).limit(limit)
+    )).all()
 
-    result = []
-    for day in race_days:
-        result.append({
-            "id": str(day.id),
-            "race_id": str(day.race_id),
-            "day_number": day.day_number,
-            "race_date": day.race_date.isoformat(),
-            "day_subtitle": day.day_subtitle,
-            "status": day.status,
-            "total_participants": day.total_participants,
-            "created_at": day.created_at.isoformat() if day.created_at else None,
-            "updated_at": day.updated_at.isoformat() if day.updated_at else None
-        })
+    result = [_build_race_day_list_item(day) for day in race_days]
 
-    return {
+    return FastJSONResponse({
         "data": result,
         "skip": skip,
         "limit": limit,
         "has_more": len(result) == limit
-    }
+    })
 
 
 @router.get("/races/days/{race_day_id}")
 async def get_race_day_public(
     race_day_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a race day by ID (public)"""
-    race_day = db.query(RaceDay).filter(RaceDay.id == race_day_id).first()
+    cache_key = ("race_day_detail", race_day_id)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    race_day = await db.get(RaceDay, race_day_id)
     if not race_day:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Race day not found"
         )
 
-    return {
-        "id": str(race_day.id),
-        "race_id": str(race_day.race_id),
+    response = FastJSONResponse({
+        "id": race_day.id,
+        "race_id": race_day.race_id,
         "day_number": race_day.day_number,
-        "race_date": race_day.race_date.isoformat(),
+        "race_date": race_day.race_date,
         "day_subtitle": race_day.day_subtitle,
         "status": race_day.status,
         "total_participants": race_day.total_participants,
-        "created_at": race_day.created_at.isoformat() if race_day.created_at else None,
-        "updated_at": race_day.updated_at.isoformat() if race_day.updated_at else None
-    }
+        "created_at": race_day.created_at,
+        "updated_at": race_day.updated_at
+    })
+    response_cache.set(cache_key, response.body, settings.DETAIL_CACHE_SECONDS)
+    return response
 
 
 # ============================================================================
@@ -795,141 +717,147 @@ async def get_race_results_public(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
     search: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    after_position: Optional[int] = Query(None, ge=0),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     OPTIMIZED: Get all results for a race day (public)
 
-    Uses eager loading to eliminate N+1 queries
+    Uses a single joined column select (no ORM hydration, no N+1 queries)
+    Search and pagination run in SQL, so cost scales with page size
     Returns thumbnails instead of original images (94% smaller!)
 
     - **skip**: Number of records to skip
     - **limit**: Maximum number of records to return
     - **search**: Search by bull name or owner name
+    - **after_position**: Keyset cursor - return results after this position (skip is ignored).
+      Pass the previous page's next_after_position to page without OFFSET scans.
     """
-    from sqlalchemy.orm import joinedload
-
-    # OPTIMIZED: Eager load all related data in single query
-    all_results = db.query(RaceResult).options(
-        joinedload(RaceResult.bull1),
-        joinedload(RaceResult.bull2),
-        joinedload(RaceResult.owner1),
-        joinedload(RaceResult.owner2)
-    ).filter(
-        RaceResult.race_day_id == race_day_id
-    ).order_by(RaceResult.position).all()
-
-    # Build team data with bull and owner info
-    team_results = []
-    for result in all_results:
+    Bull1, Bull2 = aliased(Bull), aliased(Bull)
+    Owner1, Owner2 = aliased(Owner), aliased(Owner)
+
+    # Search by bull or owner name in SQL (escapes % and _ in user input)
+    filters = [RaceResult.race_day_id == race_day_id]
+    if search:
+        filters.append(or_(
+            Bull1.name.icontains(search, autoescape=True),
+            Bull2.name.icontains(search, autoescape=True),
+            Owner1.full_name.icontains(search, autoescape=True),
+            Owner2.full_name.icontains(search, autoescape=True)
+        ))
+
+    def with_joins(stmt):
+        return (
+            stmt
+            .join(Bull1, Bull1.id == RaceResult.bull1_id, isouter=True)
+            .join(Bull2, Bull2.id == RaceResult.bull2_id, isouter=True)
+            .join(Owner1, Owner1.id == RaceResult.owner1_id, isouter=True)
+            .join(Owner2, Owner2.id == RaceResult.owner2_id, isouter=True)
+            .where(*filters)
+        )
+
+    # Total matching results (joins are only needed when searching)
+    if search:
+        total = await db.scalar(with_joins(select(func.count(RaceResult.id))))
+    else:
+        total = await db.scalar(select(func.count(RaceResult.id)).where(*filters))
+
+    # OPTIMIZED: Single column select with outer joins, paginated in SQL
+    page_query = (
+        with_joins(select(
+            RaceResult.id, RaceResult.race_day_id, RaceResult.position,
+            RaceResult.time_milliseconds, RaceResult.is_disqualified,
+            RaceResult.disqualification_reason, RaceResult.notes,
+            RaceResult.created_at, RaceResult.updated_at,
+            Bull1.id.label("bull1_id"), Bull1.name.label("bull1_name"),
+            Bull1.thumbnail_url.label("bull1_thumbnail_url"), Bull1.photo_url.label("bull1_photo_url"),
+            Bull1.breed.label("bull1_breed"), Bull1.color.label("bull1_color"),
+            Bull2.id.label("bull2_id"), Bull2.name.label("bull2_name"),
+            Bull2.thumbnail_url.label("bull2_thumbnail_url"), Bull2.photo_url.label("bull2_photo_url"),
+            Bull2.breed.label("bull2_breed"), Bull2.color.label("bull2_color"),
+            Owner1.id.label("owner1_id"), Owner1.full_name.label("owner1_full_name"),
+            Owner1.phone_number.label("owner1_phone_number"), Owner1.address.label("owner1_address"),
+            Owner2.id.label("owner2_id"), Owner2.full_name.label("owner2_full_name"),
+            Owner2.phone_number.label("owner2_phone_number"), Owner2.address.label("owner2_address"),
+        ))
+        .order_by(RaceResult.position)
+        .limit(limit)
+    )
+    if after_position is not None:
+        # Keyset: seeks ix_race_results_race_day_position (positions are unique per day)
+        page_query = page_query.where(RaceResult.position > after_position)
+    else:
+        page_query = page_query.offset(skip)
+    page = (await db.execute(page_query)).all()
+
+    # Use THUMBNAIL for list view (94% smaller than original!), resolved in one parallel pass
+    photo_urls = await storage_service.get_public_urls(
+        [r.bull1_thumbnail_url or r.bull1_photo_url for r in page] +
+        [r.bull2_thumbnail_url or r.bull2_photo_url for r in page],
+        expiration=604800
+    )
+
+    paginated_results = []
+    for result in page:
         team_data = {
-            'id': str(result.id),
-            'race_day_id': str(result.race_day_id),
+            'id': result.id,
+            'race_day_id': result.race_day_id,
             'position': result.position,
             'time_milliseconds': result.time_milliseconds,
             'is_disqualified': result.is_disqualified,
             'disqualification_reason': result.disqualification_reason,
             'notes': result.notes,
-            'created_at': result.created_at.isoformat() if result.created_at else None,
-            'updated_at': result.updated_at.isoformat() if result.updated_at else None
+            'created_at': result.created_at,
+            'updated_at': result.updated_at
         }
 
-        # Add bull1 info if exists (already loaded via joinedload)
-        bull1_name = None
-        bull1_photo = None
-        if result.bull1:
-            # Use THUMBNAIL for list view (94% smaller than original!)
-            thumbnail_path = result.bull1.thumbnail_url or result.bull1.photo_url
-            photo_url = None
-            if thumbnail_path:
-                try:
-                    photo_url = storage_service.generate_signed_url(thumbnail_path, expiration=604800)
-                except:
-                    photo_url = None
-
+        # Add bull1 info if exists
+        if result.bull1_id:
             team_data['bull1'] = {
-                'id': str(result.bull1.id),
-                'name': result.bull1.name,
-                'photo_url': photo_url,
-                'breed': result.bull1.breed,
-                'color': result.bull1.color
+                'id': result.bull1_id,
+                'name': result.bull1_name,
+                'photo_url': photo_urls.get(result.bull1_thumbnail_url or result.bull1_photo_url),
+                'breed': result.bull1_breed,
+                'color': result.bull1_color
             }
-            bull1_name = result.bull1.name
-            bull1_photo = photo_url
-
-        # Add bull2 info if exists (already loaded via joinedload)
-        bull2_name = None
-        bull2_photo = None
-        if result.bull2:
-            # Use THUMBNAIL for list view
-            thumbnail_path = result.bull2.thumbnail_url or result.bull2.photo_url
-            photo_url = None
-            if thumbnail_path:
-                try:
-                    photo_url = storage_service.generate_signed_url(thumbnail_path, expiration=604800)
-                except:
-                    photo_url = None
 
+        # Add bull2 info if exists
+        if result.bull2_id:
             team_data['bull2'] = {
-                'id': str(result.bull2.id),
-                'name': result.bull2.name,
-                'photo_url': photo_url,
-                'breed': result.bull2.breed,
-                'color': result.bull2.color
+                'id': result.bull2_id,
+                'name': result.bull2_name,
+                'photo_url': photo_urls.get(result.bull2_thumbnail_url or result.bull2_photo_url),
+                'breed': result.bull2_breed,
+                'color': result.bull2_color
             }
-            bull2_name = result.bull2.name
-            bull2_photo = photo_url
 
-        # Add owner1 info if exists (already loaded via joinedload)
-        owner1_name = None
-        if result.owner1:
+        # Add owner1 info if exists
+        if result.owner1_id:
             team_data['owner1'] = {
-                'id': str(result.owner1.id),
-                'full_name': result.owner1.full_name,
-                'phone_number': result.owner1.phone_number,
-                'address': result.owner1.address
+                'id': result.owner1_id,
+                'full_name': result.owner1_full_name,
+                'phone_number': result.owner1_phone_number,
+                'address': result.owner1_address
             }
-            owner1_name = result.owner1.full_name
 
-        # Add owner2 info if exists (already loaded via joinedload)
-        owner2_name = None
-        if result.owner2:
+        # Add owner2 info if exists
+        if result.owner2_id:
             team_data['owner2'] = {
-                'id': str(result.owner2.id),
-                'full_name': result.owner2.full_name,
-                'phone_number': result.owner2.phone_number,
-                'address': result.owner2.address
+                'id': result.owner2_id,
+                'full_name': result.owner2_full_name,
+                'phone_number': result.owner2_phone_number,
+                'address': result.owner2_address
             }
-            owner2_name = result.owner2.full_name
-
-        # Apply search filter
-        if search:
-            search_lower = search.lower()
-            matches = False
-            if bull1_name and search_lower in bull1_name.lower():
-                matches = True
-            elif bull2_name and search_lower in bull2_name.lower():
-                matches = True
-            elif owner1_name and search_lower in owner1_name.lower():
-                matches = True
-            elif owner2_name and search_lower in owner2_name.lower():
-                matches = True
-
-            if not matches:
-                continue
-
-        team_results.append(team_data)
-
-    # Apply pagination
-    total = len(team_results)
-    paginated_results = team_results[skip:skip + limit]
 
-    return {
+        paginated_results.append(team_data)
+
+    return FastJSONResponse({
         "data": paginated_results,
         "total": total,
         "skip": skip,
-        "limit": limit
-    }
+        "limit": limit,
+        "next_after_position": page[-1].position if len(page) == limit else None
+    })
 
 
 # ============================================================================
@@ -939,80 +867,83 @@ async def get_race_results_public(
 @router.get("/search", response_model=dict)
 async def search_public(
     q: str = Query(..., min_length=1),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Search across bulls and races (public)
 
     Returns matching bulls and races based on search query
     """
+    cache_key = ("search", "public", q)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     search_term = f"%{q}%"
 
-    # Search bulls by name
-    bulls = db.query(Bull).filter(
+    # Bulls by name, with owner name and precomputed statistics joined in
+    bulls_query = select(
+        literal("bull").label("kind"),
+        Bull.id, Bull.name, Bull.photo_url, Bull.breed,
+        Owner.full_name.label("owner_name"),
+        func.coalesce(bull_stats.c.total_races, 0).label("total_races"),
+        func.coalesce(bull_stats.c.first_place_wins, 0).label("first_place_wins"),
+        null().label("race_date"), null().label("address"), null().label("status"),
+        null().label("total_participants")
+    ).outerjoin(Owner, Owner.id == Bull.owner_id).outerjoin(
+        bull_stats, bull_stats.c.bull_id == Bull.id
+    ).where(
         Bull.is_active == True,
         Bull.name.ilike(search_term)
-    ).limit(20).all()
-
-    bull_results = []
-    for bull in bulls:
-        owner = db.query(Owner).filter(Owner.id == bull.owner_id).first()
-
-        # Get statistics (bull can be bull1 or bull2)
-        total_races = db.query(func.count(RaceResult.id)).filter(
-            and_(
-                or_(RaceResult.bull1_id == bull.id, RaceResult.bull2_id == bull.id),
-                RaceResult.is_disqualified == False
-            )
-        ).scalar()
-
-        first_place_wins = db.query(func.count(RaceResult.id)).filter(
-            and_(
-                or_(RaceResult.bull1_id == bull.id, RaceResult.bull2_id == bull.id),
-                RaceResult.position == 1,
-                RaceResult.is_disqualified == False
-            )
-        ).scalar()
-
-        bull_results.append({
-            "type": "bull",
-            "id": str(bull.id),
-            "name": bull.name,
-            "photo_url": bull.photo_url,
-            "breed": bull.breed,
-            "owner_name": owner.full_name if owner else None,
-            "statistics": {
-                "total_races": total_races or 0,
-                "first_place_wins": first_place_wins or 0
-            }
-        })
-
-    # Search races by name
-    races = db.query(Race).filter(
+    ).limit(20)
+
+    # Races by name (total_participants is kept summed over race days by a trigger)
+    races_query = select(
+        literal("race").label("kind"),
+        Race.id, Race.name, null(), null(), null(), null(), null(),
+        Race.end_date, Race.address, Race.status, Race.total_participants
+    ).where(
         Race.name.ilike(search_term)
-    ).order_by(Race.end_date.desc()).limit(20).all()
+    ).order_by(Race.end_date.desc()).limit(20)
 
-    race_results = []
-    for race in races:
-        # Get total participants from race days
-        total_participants = sum(rd.total_participants for rd in race.race_days) if race.race_days else 0
-
-        race_results.append({
-            "type": "race",
-            "id": str(race.id),
-            "name": race.name,
-            "race_date": race.end_date.isoformat(),
-            "address": race.address,
-            "status": race.status,
-            "total_participants": total_participants
-        })
+    # Both searches in one round trip; rows are split by kind (bulls first)
+    rows = (await db.execute(bulls_query.union_all(races_query))).all()
 
-    return {
+    bull_results = []
+    race_results = []
+    for row in rows:
+        if row.kind == "bull":
+            bull_results.append({
+                "type": "bull",
+                "id": row.id,
+                "name": row.name,
+                "photo_url": row.photo_url,
+                "breed": row.breed,
+                "owner_name": row.owner_name,
+                "statistics": {
+                    "total_races": row.total_races,
+                    "first_place_wins": row.first_place_wins
+                }
+            })
+        else:
+            race_results.append({
+                "type": "race",
+                "id": row.id,
+                "name": row.name,
+                "race_date": row.race_date,
+                "address": row.address,
+                "status": row.status,
+                "total_participants": row.total_participants
+            })
+
+    response = FastJSONResponse({
         "query": q,
         "bulls": bull_results,
         "races": race_results,
         "total_results": len(bull_results) + len(race_results)
-    }
+    })
+    response_cache.set(cache_key, response.body, settings.SEARCH_CACHE_SECONDS)
+    return response
 
 
 # ============================================================================
@@ -1023,7 +954,7 @@ async def search_public(
 async def get_available_bulls(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     OPTIMIZED: Get available bulls for sale (public)
@@ -1035,102 +966,77 @@ async def get_available_bulls(
     Combined and sorted by created_at descending
     Uses thumbnails for list view (consistent with bulls listing)
     """
-    # Query user-created bulls (active and not expired)
-    user_bulls = db.query(UserBullSell).filter(
-        UserBullSell.status == "available",
-        UserBullSell.expires_at > datetime.utcnow()
-    ).all()
+    # Query user-created bulls (active and not expired). status is kept current by
+    # expire_user_bulls.py, so this reads the status = 'available' partial index and
+    # expires_at only guards rows the job hasn't demoted yet.
+    user_bulls = (await db.execute(
+        select(
+            UserBullSell.id, UserBullSell.name, UserBullSell.owner_name, UserBullSell.owner_mobile,
+            UserBullSell.location, UserBullSell.price, UserBullSell.thumbnail_url, UserBullSell.image_url,
+            UserBullSell.description, UserBullSell.status, UserBullSell.created_at
+        ).where(
+            UserBullSell.status == "available",
+            UserBullSell.expires_at > datetime.utcnow()
+        )
+    )).all()
 
     # Query admin marketplace listings (available status)
-    marketplace_listings = db.query(MarketplaceListing).filter(
-        MarketplaceListing.status == "available"
-    ).all()
-
-    # Combine both lists with a unified format
-    combined_results = []
-
-    # Add user bulls
-    for bull in user_bulls:
-        thumbnail_path = bull.thumbnail_url or bull.image_url
-        image_url = None
-        if thumbnail_path:
-            try:
-                image_url = storage_service.generate_signed_url(thumbnail_path, expiration=604800)
-            except:
-                image_url = None
-
-        combined_results.append({
-            "id": str(bull.id),
-            "name": bull.name,
-            "owner_name": bull.owner_name,
-            "owner_mobile": bull.owner_mobile,
-            "location": bull.location,
-            "price": bull.price,
-            "image_url": image_url,
-            "description": bull.description,
-            "status": bull.status,
-            "created_at": bull.created_at.isoformat() if bull.created_at else None,
-            "source": "user"  # Indicate source
-        })
-
-    # Add marketplace listings
-    for listing in marketplace_listings:
-        thumbnail_path = listing.thumbnail_url or listing.image_url
-        image_url = None
-        if thumbnail_path:
-            try:
-                image_url = storage_service.generate_signed_url(thumbnail_path, expiration=604800)
-            except:
-                image_url = None
-
-        combined_results.append({
-            "id": str(listing.id),
-            "name": listing.name,
-            "owner_name": listing.owner_name,
-            "owner_mobile": listing.owner_mobile,
-            "location": listing.location,
-            "price": listing.price,
-            "image_url": image_url,
-            "description": listing.description,
-            "status": listing.status,
-            "created_at": listing.created_at.isoformat() if listing.created_at else None,
-            "source": "marketplace"  # Indicate source
-        })
-
-    # Sort combined results by created_at (most recent first)
-    combined_results.sort(key=lambda x: x["created_at"] if x["created_at"] else "", reverse=True)
+    marketplace_listings = (await db.execute(
+        select(
+            MarketplaceListing.id, MarketplaceListing.name, MarketplaceListing.owner_name,
+            MarketplaceListing.owner_mobile, MarketplaceListing.location, MarketplaceListing.price,
+            MarketplaceListing.thumbnail_url, MarketplaceListing.image_url,
+            MarketplaceListing.description, MarketplaceListing.status, MarketplaceListing.created_at
+        ).where(MarketplaceListing.status == "available")
+    )).all()
+
+    # Combine both lists, sort by created_at (most recent first) and paginate
+    combined = [(bull, "user") for bull in user_bulls] + [(listing, "marketplace") for listing in marketplace_listings]
+    combined.sort(key=lambda item: item[0].created_at or datetime.min, reverse=True)
+    page = combined[skip:skip + limit]
+
+    # Resolve thumbnail URLs for this page only, in one parallel pass
+    image_urls = await storage_service.get_public_urls(
+        (row.thumbnail_url or row.image_url for row, _ in page), expiration=604800
+    )
 
-    # Apply pagination
-    paginated_results = combined_results[skip:skip + limit]
+    # Unified format with the source indicated
+    paginated_results = [
+        _build_available_bull(row, image_url=image_urls.get(row.thumbnail_url or row.image_url), source=source)
+        for row, source in page
+    ]
 
-    return paginated_results
+    return FastJSONResponse(paginated_results)
 
 
 @router.get("/available-bulls/{listing_id}", response_model=dict)
 async def get_available_bull_detail(
     listing_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get detailed information about an available bull (public)
 
     Checks both UserBullSell and MarketplaceListing tables
     """
+    cache_key = ("available_bull_detail", listing_id)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     # Try to find in user bulls first
-    bull = db.query(UserBullSell).filter(
-        UserBullSell.id == listing_id
-    ).first()
+    bull = await db.get(UserBullSell, listing_id)
 
     if bull:
         # Found in UserBullSell - return with extra fields
         image_url = bull.image_url
         if image_url:
             try:
-                image_url = storage_service.generate_signed_url(image_url, expiration=604800)
+                image_url = storage_service.get_public_url(image_url, expiration=604800)
             except:
                 image_url = None
 
-        return {
-            "id": str(bull.id),
+        response = FastJSONResponse({
+            "id": bull.id,
             "name": bull.name,
             "owner_name": bull.owner_name,
             "owner_mobile": bull.owner_mobile,
@@ -1142,28 +1048,28 @@ async def get_available_bull_detail(
             "breed": bull.breed,
             "birth_year": bull.birth_year,
             "color": bull.color,
-            "expires_at": bull.expires_at.isoformat() if bull.expires_at else None,
+            "expires_at": bull.expires_at,
             "days_remaining": bull.days_remaining,
-            "created_at": bull.created_at.isoformat() if bull.created_at else None,
+            "created_at": bull.created_at,
             "source": "user"
-        }
+        })
+        response_cache.set(cache_key, response.body, settings.DETAIL_CACHE_SECONDS)
+        return response
 
     # Try to find in marketplace listings
-    listing = db.query(MarketplaceListing).filter(
-        MarketplaceListing.id == listing_id
-    ).first()
+    listing = await db.get(MarketplaceListing, listing_id)
 
     if listing:
         # Found in MarketplaceListing
         image_url = listing.image_url
         if image_url:
             try:
-                image_url = storage_service.generate_signed_url(image_url, expiration=604800)
+                image_url = storage_service.get_public_url(image_url, expiration=604800)
             except:
                 image_url = None
 
-        return {
-            "id": str(listing.id),
+        response = FastJSONResponse({
+            "id": listing.id,
             "name": listing.name,
             "owner_name": listing.owner_name,
             "owner_mobile": listing.owner_mobile,
@@ -1172,9 +1078,11 @@ async def get_available_bull_detail(
             "image_url": image_url,
             "description": listing.description,
             "status": listing.status,
-            "created_at": listing.created_at.isoformat() if listing.created_at else None,
+            "created_at": listing.created_at,
             "source": "marketplace"
-        }
+        })
+        response_cache.set(cache_key, response.body, settings.DETAIL_CACHE_SECONDS)
+        return response
 
     # Not found in either table
     raise HTTPException(
@@ -1191,60 +1099,50 @@ async def get_available_bull_detail(
 async def get_user_bulls_for_sale(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get bulls listed for sale by users (public)
 
     Returns active user bull listings that haven't expired
     """
-    from datetime import datetime
-
-    bulls = db.query(UserBullSell).filter(
-        UserBullSell.status == "available",
-        UserBullSell.expires_at > datetime.utcnow()
-    ).order_by(UserBullSell.created_at.desc()).offset(skip).limit(limit).all()
+    # Walks ix_user_bulls_sell_available_created newest first; expires_at only guards
+    # rows expire_user_bulls.py hasn't demoted yet
+    now = datetime.utcnow()
+    bulls = (await db.execute(
+        select(
+            UserBullSell.id, UserBullSell.name, UserBullSell.breed, UserBullSell.birth_year,
+            UserBullSell.color, UserBullSell.description, UserBullSell.price, UserBullSell.image_url,
+            UserBullSell.location, UserBullSell.owner_name, UserBullSell.owner_mobile,
+            UserBullSell.status, UserBullSell.created_at, UserBullSell.expires_at
+        ).where(
+            UserBullSell.status == "available",
+            UserBullSell.expires_at > now
+        ).order_by(UserBullSell.created_at.desc()).offset(skip).limit(limit)
+    )).all()
+
+    # Public URLs for all images in one parallel pass
+    image_urls = await storage_service.get_public_urls(bull.image_url for bull in bulls)
 
     result = []
     for bull in bulls:
-        # Generate signed URL for image
-        image_url = bull.image_url
-        if image_url:
-            try:
-                image_url = storage_service.generate_signed_url(image_url)
-            except:
-                image_url = None
+        result.append(_build_user_bull_for_sale(
+            bull,
+            image_url=image_urls.get(bull.image_url),
+            # Same as UserBullSell.days_remaining (rows are already filtered to unexpired)
+            days_remaining=(bull.expires_at - now).days
+        ))
 
-        result.append({
-            "id": str(bull.id),
-            "name": bull.name,
-            "breed": bull.breed,
-            "birth_year": bull.birth_year,
-            "color": bull.color,
-            "description": bull.description,
-            "price": bull.price,
-            "image_url": image_url,
-            "location": bull.location,
-            "owner_name": bull.owner_name,
-            "owner_mobile": bull.owner_mobile,
-            "status": bull.status,
-            "created_at": bull.created_at.isoformat() if bull.created_at else None,
-            "expires_at": bull.expires_at.isoformat() if bull.expires_at else None,
-            "days_remaining": bull.days_remaining
-        })
-
-    return result
+    return FastJSONResponse(result)
 
 
 @router.get("/user-bulls-sell/{bull_id}", response_model=dict)
 async def get_user_bull_detail(
     bull_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get detailed information about a user bull for sale (public)"""
-    bull = db.query(UserBullSell).filter(
-        UserBullSell.id == bull_id
-    ).first()
+    bull = await db.get(UserBullSell, bull_id)
 
     if not bull:
         raise HTTPException(
@@ -1252,16 +1150,16 @@ async def get_user_bull_detail(
             detail="Bull listing not found"
         )
 
-    # Generate signed URL for image
+    # Public URL for image
     image_url = bull.image_url
     if image_url:
         try:
-            image_url = storage_service.generate_signed_url(image_url)
+            image_url = storage_service.get_public_url(image_url)
         except:
             image_url = None
 
-    return {
-        "id": str(bull.id),
+    return FastJSONResponse({
+        "id": bull.id,
         "name": bull.name,
         "breed": bull.breed,
         "birth_year": bull.birth_year,
@@ -1273,7 +1171,7 @@ async def get_user_bull_detail(
         "owner_name": bull.owner_name,
         "owner_mobile": bull.owner_mobile,
         "status": bull.status,
-        "created_at": bull.created_at.isoformat() if bull.created_at else None,
-        "expires_at": bull.expires_at.isoformat() if bull.expires_at else None,
+        "created_at": bull.created_at,
+        "expires_at": bull.expires_at,
         "days_remaining": bull.days_remaining
-    }
+    })
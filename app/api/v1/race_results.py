@@ -4,24 +4,28 @@ Race Results management endpoints (separate from races)
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 
 from app.core.dependencies import get_current_active_admin
-from app.db.base import get_db
+from app.db.base import get_async_db
 from app.models.admin import AdminUser
-from app.models.race import Race, RaceResult
+from app.models.race import RaceDay, RaceResult
 from app.models.bull import Bull
 from app.models.owner import Owner
 from app.schemas.race import RaceResultResponse
+from app.services.bull_stats import refresh_bull_stats
+from app.services.response_cache import response_cache
 
 router = APIRouter(prefix="/admin/race-results", tags=["Admin - Race Results"])
 
 
 # Request schema for creating race results (team races)
 class CreateRaceResultRequest(BaseModel):
-    race_id: UUID
+    race_day_id: UUID
     owner1_id: Optional[UUID] = None
     owner2_id: Optional[UUID] = None
     bull1_id: Optional[UUID] = None
@@ -31,10 +35,48 @@ class CreateRaceResultRequest(BaseModel):
     is_disqualified: bool = False
 
 
+async def _verify_participants_exist(
+    db: AsyncSession,
+    owner_ids: List[Optional[UUID]],
+    bull_ids: List[Optional[UUID]]
+) -> None:
+    """
+    Raise 404 for the first referenced owner or bull that doesn't exist
+
+    Checks all owners in one IN query and all bulls in another, instead of one
+    lookup per id.
+    """
+    for model, label, ids in ((Owner, "Owner", owner_ids), (Bull, "Bull", bull_ids)):
+        wanted = [i for i in ids if i]
+        if not wanted:
+            continue
+        found = set(await db.scalars(select(model.id).where(model.id.in_(wanted))))
+        for i in wanted:
+            if i not in found:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"{label} with ID {i} not found"
+                )
+
+
+def _is_position_conflict(error: IntegrityError) -> bool:
+    """
+    Whether error is a unique violation of the race day position index
+
+    asyncpg's exception (the cause of the DBAPI error) carries the SQLSTATE
+    and the violated constraint's name.
+    """
+    return (
+        getattr(error.orig, "sqlstate", None) == "23505"
+        and getattr(error.orig.__cause__, "constraint_name", None) == "ix_race_results_race_day_position"
+    )
+
+
 @router.post("", status_code=status.HTTP_201_CREATED)
 async def create_race_result(
     request_data: CreateRaceResultRequest,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """
@@ -47,99 +89,59 @@ async def create_race_result(
 
     Creates a single race result entry representing the team's performance.
     """
-    race_id = request_data.race_id
-    owner1_id = request_data.owner1_id
-    owner2_id = request_data.owner2_id
-    bull1_id = request_data.bull1_id
-    bull2_id = request_data.bull2_id
-    position = request_data.position
-    time_milliseconds = request_data.time_milliseconds
-    is_disqualified = request_data.is_disqualified
-
-    # Verify race exists
-    race = db.query(Race).filter(Race.id == race_id).first()
-    if not race:
+    # Verify owners and bulls exist
+    await _verify_participants_exist(
+        db,
+        [request_data.owner1_id, request_data.owner2_id],
+        [request_data.bull1_id, request_data.bull2_id]
+    )
+
+    # Count the new team on its race day with one UPDATE, which also verifies
+    # the race day exists; races.total_participants follows via its trigger
+    updated_id = await db.scalar(
+        update(RaceDay).where(RaceDay.id == request_data.race_day_id).values(
+            total_participants=func.coalesce(RaceDay.total_participants, 0) + 1,
+            # Mark in progress once the race day has any results
+            status=case((RaceDay.status == "scheduled", "in_progress"), else_=RaceDay.status)
+        ).returning(RaceDay.id).execution_options(synchronize_session=False)
+    )
+    if not updated_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Race not found"
+            detail="Race day not found"
         )
 
-    # Verify owners exist
-    if owner1_id:
-        owner1 = db.query(Owner).filter(Owner.id == owner1_id).first()
-        if not owner1:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Owner with ID {owner1_id} not found"
-            )
-
-    if owner2_id:
-        owner2 = db.query(Owner).filter(Owner.id == owner2_id).first()
-        if not owner2:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Owner with ID {owner2_id} not found"
-            )
-
-    # Verify bulls exist
-    if bull1_id:
-        bull1 = db.query(Bull).filter(Bull.id == bull1_id).first()
-        if not bull1:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Bull with ID {bull1_id} not found"
-            )
-
-    if bull2_id:
-        bull2 = db.query(Bull).filter(Bull.id == bull2_id).first()
-        if not bull2:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Bull with ID {bull2_id} not found"
-            )
-
     # Create a single race result for the team
-    # A team consists of 2 owners and optionally 2 bulls
-    result = RaceResult(
-        race_id=race_id,
-        bull1_id=bull1_id,
-        bull2_id=bull2_id,
-        owner1_id=owner1_id,
-        owner2_id=owner2_id,
-        position=position,
-        time_milliseconds=time_milliseconds,
-        is_disqualified=is_disqualified
-    )
-    db.add(result)
-
-    # Commit the race result first
-    db.commit()
-
-    # Update race participant count (count by position)
-    from sqlalchemy import func
-    team_count = db.query(
-        func.count(RaceResult.position)
-    ).filter(
-        RaceResult.race_id == race_id
-    ).scalar()
-
-    race.total_participants = team_count or 0
-    db.commit()
-
-    # Refresh the created result
-    db.refresh(result)
+    # A team consists of 2 owners and optionally 2 bulls. Result and participant
+    # count commit together; positions are unique per race day
+    # (ix_race_results_race_day_position)
+    try:
+        result_id = await db.scalar(
+            insert(RaceResult).values(**request_data.model_dump()).returning(RaceResult.id)
+        )
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if not _is_position_conflict(e):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Position {request_data.position} already exists for this race day"
+        )
+    background_tasks.add_task(refresh_bull_stats)
+    response_cache.invalidate("race_day_detail", "race_results")
 
-    return {"message": "Participant added successfully", "result_id": str(result.id)}
+    return {"message": "Participant added successfully", "result_id": str(result_id)}
 
 
 @router.get("/{result_id}")
 async def get_race_result(
     result_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Get a single race result by ID"""
-    result = db.query(RaceResult).filter(RaceResult.id == result_id).first()
+    result = await db.get(RaceResult, result_id)
     if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -148,7 +150,7 @@ async def get_race_result(
 
     return {
         "id": str(result.id),
-        "race_id": str(result.race_id),
+        "race_day_id": str(result.race_day_id),
         "bull1_id": str(result.bull1_id) if result.bull1_id else None,
         "bull2_id": str(result.bull2_id) if result.bull2_id else None,
         "owner1_id": str(result.owner1_id) if result.owner1_id else None,
@@ -174,51 +176,25 @@ class UpdateRaceResultRequest(BaseModel):
 async def update_race_result(
     result_id: UUID,
     request_data: UpdateRaceResultRequest,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Update a race result"""
     # Find the result
-    result = db.query(RaceResult).filter(RaceResult.id == result_id).first()
+    result = await db.get(RaceResult, result_id)
     if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Result not found"
         )
 
-    # Verify owners exist
-    if request_data.owner1_id:
-        owner1 = db.query(Owner).filter(Owner.id == request_data.owner1_id).first()
-        if not owner1:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Owner with ID {request_data.owner1_id} not found"
-            )
-
-    if request_data.owner2_id:
-        owner2 = db.query(Owner).filter(Owner.id == request_data.owner2_id).first()
-        if not owner2:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Owner with ID {request_data.owner2_id} not found"
-            )
-
-    # Verify bulls exist
-    if request_data.bull1_id:
-        bull1 = db.query(Bull).filter(Bull.id == request_data.bull1_id).first()
-        if not bull1:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Bull with ID {request_data.bull1_id} not found"
-            )
-
-    if request_data.bull2_id:
-        bull2 = db.query(Bull).filter(Bull.id == request_data.bull2_id).first()
-        if not bull2:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Bull with ID {request_data.bull2_id} not found"
-            )
+    # Verify owners and bulls exist
+    await _verify_participants_exist(
+        db,
+        [request_data.owner1_id, request_data.owner2_id],
+        [request_data.bull1_id, request_data.bull2_id]
+    )
 
     # Update the result
     result.bull1_id = request_data.bull1_id
@@ -229,26 +205,39 @@ async def update_race_result(
     result.time_milliseconds = request_data.time_milliseconds
     result.is_disqualified = request_data.is_disqualified
 
-    db.commit()
-    db.refresh(result)
+    await db.commit()
+    background_tasks.add_task(refresh_bull_stats)
+    response_cache.invalidate("race_day_detail", "race_results")
 
-    return {"message": "Participant updated successfully", "result_id": str(result.id)}
+    return {"message": "Participant updated successfully", "result_id": str(result_id)}
 
 
 @router.delete("/{result_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_race_result(
     result_id: UUID,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
-    """Delete a race result"""
-    result = db.query(RaceResult).filter(RaceResult.id == result_id).first()
-    if not result:
+    """Delete a race result and update participant count"""
+    race_day_id = await db.scalar(
+        delete(RaceResult).where(RaceResult.id == result_id).returning(RaceResult.race_day_id)
+        .execution_options(synchronize_session=False)
+    )
+    if not race_day_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Result not found"
         )
 
-    db.delete(result)
-    db.commit()
+    # Decrement the race day's participant count in the same transaction
+    await db.execute(
+        update(RaceDay).where(RaceDay.id == race_day_id).values(
+            total_participants=func.greatest(func.coalesce(RaceDay.total_participants, 0) - 1, 0)
+        ).execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    background_tasks.add_task(refresh_bull_stats)
+    response_cache.invalidate("race_day_detail", "race_results")
+
     return None
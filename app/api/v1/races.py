@@ -1,25 +1,82 @@
 """
 Race and Race Results management endpoints
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status, Query
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import and_, case, delete, exists, func, insert, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
 from app.core.dependencies import get_current_active_admin
-from app.db.base import get_db
+from app.db.base import get_async_db
 from app.models.admin import AdminUser
+from app.models.bull import Bull
+from app.models.owner import Owner
 from app.models.race import Race, RaceDay, RaceResult
 from app.schemas.race import (
     RaceCreate, RaceUpdate, RaceResponse,
     RaceDayCreate, RaceDayUpdate, RaceDayResponse,
     RaceResultCreate, RaceResultResponse
 )
+from app.services.bull_stats import refresh_bull_stats
+from app.services.response_cache import response_cache, RACE_LIST_NAMESPACES
+from app.utils.responses import FastJSONResponse
+from app.utils.row_builders import make_row_builder
 
 router = APIRouter(prefix="/admin/races", tags=["Admin - Races"])
 
+# List endpoints select every column as row tuples and build plain dicts,
+# instead of loading ORM objects for jsonable_encoder to walk
+_RACE_COLUMNS = tuple(Race.__table__.c)
+_build_race = make_row_builder([column.key for column in _RACE_COLUMNS])
+
+_RACE_DAY_COLUMNS = tuple(RaceDay.__table__.c)
+_build_race_day = make_row_builder([column.key for column in _RACE_DAY_COLUMNS])
+
+# Detail GETs select exactly their response schema's fields and return them
+# directly; the response_model stays on the route for the OpenAPI docs only
+_RACE_RESPONSE_COLUMNS = tuple(Race.__table__.c[name] for name in RaceResponse.model_fields)
+_build_race_response = make_row_builder(list(RaceResponse.model_fields))
+
+_RACE_DAY_RESPONSE_COLUMNS = tuple(RaceDay.__table__.c[name] for name in RaceDayResponse.model_fields)
+_build_race_day_response = make_row_builder(list(RaceDayResponse.model_fields))
+
+# Batch result bodies can hold a whole race day's teams; validating the raw
+# bytes with a prebuilt adapter skips FastAPI's json.loads and dict pass
+_race_results_adapter = TypeAdapter(List[RaceResultCreate])
+
+# Columns overwritten when replace_all upserts a result into an existing position
+_RESULT_UPSERT_COLUMNS = (
+    "bull1_id", "bull2_id", "owner1_id", "owner2_id", "time_milliseconds",
+    "is_disqualified", "disqualification_reason", "notes", "updated_at",
+)
+
+
+def _encode_race_cursor(race) -> str:
+    """Keyset cursor for list_races: the last row's (start_date, id)"""
+    return f"{race.start_date.isoformat()}_{race.id}"
+
+
+def _decode_race_cursor(cursor: str) -> Tuple[date, UUID]:
+    """Parse a list_races cursor, raising 400 if it is malformed"""
+    try:
+        start_date, race_id = cursor.split("_", 1)
+        return date.fromisoformat(start_date), UUID(race_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
 
 # ============================================================================
 # RACES
@@ -28,7 +85,7 @@ router = APIRouter(prefix="/admin/races", tags=["Admin - Races"])
 @router.post("", response_model=RaceResponse, status_code=status.HTTP_201_CREATED)
 async def create_race(
     race: RaceCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Create a new race"""
@@ -37,8 +94,9 @@ async def create_race(
         created_by=current_user.username
     )
     db.add(db_race)
-    db.commit()
-    db.refresh(db_race)
+    await db.commit()
+    response_cache.invalidate(*RACE_LIST_NAMESPACES, "search")
+    await db.refresh(db_race)
     return db_race
 
 
@@ -50,7 +108,9 @@ async def list_races(
     status_filter: Optional[str] = Query(None, alias="status"),
     from_date: Optional[date] = Query(None),
     to_date: Optional[date] = Query(None),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """
@@ -62,61 +122,78 @@ async def list_races(
     - **status**: Filter by status (scheduled, in_progress, completed, cancelled)
     - **from_date**: Filter races from this date
     - **to_date**: Filter races up to this date
+    - **cursor**: Keyset cursor - return races after this one (skip is ignored).
+      Pass the previous page's next_cursor to page without OFFSET scans.
+    - **include_total**: Set false to skip counting all matching races (total is null)
     """
-    query = db.query(Race)
+    filters = []
 
     if search:
         search_filter = f"%{search}%"
-        query = query.filter(
+        filters.append(
             (Race.name.ilike(search_filter)) |
             (Race.address.ilike(search_filter))
         )
 
     if status_filter:
-        query = query.filter(Race.status == status_filter)
+        filters.append(Race.status == status_filter)
 
     if from_date:
-        query = query.filter(Race.start_date >= from_date)
+        filters.append(Race.start_date >= from_date)
 
     if to_date:
-        query = query.filter(Race.end_date <= to_date)
+        filters.append(Race.end_date <= to_date)
 
-    total = query.count()
-    races = query.order_by(Race.start_date.desc()).offset(skip).limit(limit).all()
+    total = None
+    if include_total:
+        total = await db.scalar(select(func.count(Race.id)).where(*filters))
 
-    return {
-        "data": races,
+    # id breaks ties between races starting on the same date, so cursors are stable
+    query = (
+        select(*_RACE_COLUMNS).where(*filters)
+        .order_by(Race.start_date.desc(), Race.id.desc())
+        .limit(limit)
+    )
+    if cursor:
+        query = query.where(tuple_(Race.start_date, Race.id) < tuple_(*_decode_race_cursor(cursor)))
+    else:
+        query = query.offset(skip)
+    races = (await db.execute(query)).all()
+
+    return FastJSONResponse({
+        "data": [_build_race(race) for race in races],
         "total": total,
         "skip": skip,
-        "limit": limit
-    }
+        "limit": limit,
+        "next_cursor": _encode_race_cursor(races[-1]) if len(races) == limit else None
+    })
 
 
 @router.get("/{race_id}", response_model=RaceResponse)
 async def get_race(
     race_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Get a race by ID"""
-    race = db.query(Race).filter(Race.id == race_id).first()
+    race = (await db.execute(select(*_RACE_RESPONSE_COLUMNS).where(Race.id == race_id))).first()
     if not race:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Race not found"
         )
-    return race
+    return FastJSONResponse(_build_race_response(race))
 
 
 @router.put("/{race_id}", response_model=RaceResponse)
 async def update_race(
     race_id: UUID,
     race_update: RaceUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Update a race"""
-    race = db.query(Race).filter(Race.id == race_id).first()
+    race = await db.get(Race, race_id)
     if not race:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -128,27 +205,34 @@ async def update_race(
     for field, value in update_data.items():
         setattr(race, field, value)
 
-    db.commit()
-    db.refresh(race)
+    await db.commit()
+    response_cache.invalidate(*RACE_LIST_NAMESPACES, "race_detail", "search")
+    await db.refresh(race)
     return race
 
 
 @router.delete("/{race_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_race(
     race_id: UUID,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Delete a race"""
-    race = db.query(Race).filter(Race.id == race_id).first()
-    if not race:
+    # Race days and results go with it via ON DELETE CASCADE
+    deleted = await db.scalar(
+        delete(Race).where(Race.id == race_id).returning(Race.id)
+        .execution_options(synchronize_session=False)
+    )
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Race not found"
         )
 
-    db.delete(race)
-    db.commit()
+    await db.commit()
+    response_cache.invalidate(*RACE_LIST_NAMESPACES, "race_detail", "race_day_detail", "race_results", "search")
+    background_tasks.add_task(refresh_bull_stats)
     return None
 
 
@@ -160,12 +244,14 @@ async def delete_race(
 async def create_race_day(
     race_id: UUID,
     race_day: RaceDayCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Create a new race day for a race"""
-    # Verify race exists
-    race = db.query(Race).filter(Race.id == race_id).first()
+    # Verify race exists (only its date range is needed)
+    race = (await db.execute(
+        select(Race.start_date, Race.end_date).where(Race.id == race_id)
+    )).first()
     if not race:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -179,21 +265,18 @@ async def create_race_day(
             detail=f"Race date must be between {race.start_date} and {race.end_date}"
         )
 
-    # Check if day_number already exists for this race
-    existing_day = db.query(RaceDay).filter(
-        RaceDay.race_id == race_id,
-        RaceDay.day_number == race_day.day_number
-    ).first()
-    if existing_day:
+    # Duplicate day numbers are rejected by the unique (race_id, day_number) index
+    db_race_day = RaceDay(**race_day.model_dump())
+    db.add(db_race_day)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Day number {race_day.day_number} already exists for this race"
         )
-
-    db_race_day = RaceDay(**race_day.model_dump())
-    db.add(db_race_day)
-    db.commit()
-    db.refresh(db_race_day)
+    await db.refresh(db_race_day)
     return db_race_day
 
 
@@ -202,69 +285,72 @@ async def list_race_days(
     race_id: UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """List all race days for a specific race"""
     # Verify race exists
-    race = db.query(Race).filter(Race.id == race_id).first()
-    if not race:
+    if not await db.scalar(select(Race.id).where(Race.id == race_id)):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Race not found"
         )
 
-    query = db.query(RaceDay).filter(RaceDay.race_id == race_id)
-    total = query.count()
-    race_days = query.order_by(RaceDay.day_number).offset(skip).limit(limit).all()
+    total = await db.scalar(select(func.count(RaceDay.id)).where(RaceDay.race_id == race_id))
+    race_days = (await db.execute(
+        select(*_RACE_DAY_COLUMNS).where(RaceDay.race_id == race_id)
+        .order_by(RaceDay.day_number).offset(skip).limit(limit)
+    )).all()
 
-    return {
-        "data": race_days,
+    return FastJSONResponse({
+        "data": [_build_race_day(race_day) for race_day in race_days],
         "total": total,
         "skip": skip,
         "limit": limit
-    }
+    })
 
 
 @router.get("/days/{race_day_id}", response_model=RaceDayResponse)
 async def get_race_day(
     race_day_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Get a race day by ID"""
-    race_day = db.query(RaceDay).filter(RaceDay.id == race_day_id).first()
+    race_day = (await db.execute(
+        select(*_RACE_DAY_RESPONSE_COLUMNS).where(RaceDay.id == race_day_id)
+    )).first()
     if not race_day:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Race day not found"
         )
-    return race_day
+    return FastJSONResponse(_build_race_day_response(race_day))
 
 
 @router.put("/days/{race_day_id}", response_model=RaceDayResponse)
 async def update_race_day(
     race_day_id: UUID,
     race_day_update: RaceDayUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Update a race day"""
-    race_day = db.query(RaceDay).filter(RaceDay.id == race_day_id).first()
+    race_day = await db.get(RaceDay, race_day_id)
     if not race_day:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Race day not found"
         )
 
-    # Get the parent race for validation
-    race = db.query(Race).filter(Race.id == race_day.race_id).first()
-
     # Update fields
     update_data = race_day_update.model_dump(exclude_unset=True)
 
-    # Validate race_date if being updated
+    # Validate race_date against the parent race's date range if being updated
     if "race_date" in update_data:
+        race = (await db.execute(
+            select(Race.start_date, Race.end_date).where(Race.id == race_day.race_id)
+        )).first()
         new_date = update_data["race_date"]
         if new_date < race.start_date or new_date > race.end_date:
             raise HTTPException(
@@ -272,43 +358,48 @@ async def update_race_day(
                 detail=f"Race date must be between {race.start_date} and {race.end_date}"
             )
 
-    # Validate day_number if being updated
-    if "day_number" in update_data:
-        existing_day = db.query(RaceDay).filter(
-            RaceDay.race_id == race_day.race_id,
-            RaceDay.day_number == update_data["day_number"],
-            RaceDay.id != race_day_id
-        ).first()
-        if existing_day:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Day number {update_data['day_number']} already exists for this race"
-            )
-
     for field, value in update_data.items():
         setattr(race_day, field, value)
 
-    db.commit()
-    db.refresh(race_day)
+    # A day_number already used by another day of this race violates the
+    # unique (race_id, day_number) index
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        if "day_number" not in update_data:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Day number {update_data['day_number']} already exists for this race"
+        )
+    response_cache.invalidate("race_day_detail")
+    await db.refresh(race_day)
     return race_day
 
 
 @router.delete("/days/{race_day_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_race_day(
     race_day_id: UUID,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Delete a race day"""
-    race_day = db.query(RaceDay).filter(RaceDay.id == race_day_id).first()
-    if not race_day:
+    # Results go with it via ON DELETE CASCADE
+    deleted = await db.scalar(
+        delete(RaceDay).where(RaceDay.id == race_day_id).returning(RaceDay.id)
+        .execution_options(synchronize_session=False)
+    )
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Race day not found"
         )
 
-    db.delete(race_day)
-    db.commit()
+    await db.commit()
+    response_cache.invalidate("race_day_detail", "race_results")
+    background_tasks.add_task(refresh_bull_stats)
     return None
 
 
@@ -316,12 +407,20 @@ async def delete_race_day(
 # RACE RESULTS
 # ============================================================================
 
-@router.post("/days/{race_day_id}/results", response_model=List[RaceResultResponse], status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/days/{race_day_id}/results",
+    response_model=List[RaceResultResponse],
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={"requestBody": {"required": True, "content": {"application/json": {"schema": {
+        "type": "array", "items": {"$ref": "#/components/schemas/RaceResultCreate"}, "title": "Results"
+    }}}}}
+)
 async def add_race_results(
     race_day_id: UUID,
-    results: List[RaceResultCreate],
+    request: Request,
+    background_tasks: BackgroundTasks,
     replace_all: bool = Query(False, description="If true, replace all existing results. If false, append new results."),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """
@@ -335,63 +434,95 @@ async def add_race_results(
     By default, appends new results to existing ones.
     Set replace_all=true to clear existing results first.
     """
-    # Verify race day exists
-    race_day = db.query(RaceDay).filter(RaceDay.id == race_day_id).first()
-    if not race_day:
+    # Parse and validate the raw body in one pydantic-core pass
+    try:
+        results = _race_results_adapter.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
+    # Update the race day's participant count and status with one UPDATE, which
+    # also verifies it exists; appends add to the stored count in SQL so
+    # concurrent batches don't overwrite each other. The row stays locked until
+    # this transaction commits (or rolls back on a validation error below)
+    if replace_all:
+        total_participants = len(results)
+        has_results = bool(results)
+    else:
+        total_participants = func.coalesce(RaceDay.total_participants, 0) + len(results)
+        has_results = bool(results) or exists().where(RaceResult.race_day_id == race_day_id)
+    updated_id = await db.scalar(
+        update(RaceDay).where(RaceDay.id == race_day_id).values(
+            total_participants=total_participants,
+            # Mark in progress once the race day has any results
+            status=case(
+                (and_(RaceDay.status == "scheduled", has_results), "in_progress"),
+                else_=RaceDay.status
+            )
+        ).returning(RaceDay.id).execution_options(synchronize_session=False)
+    )
+    if not updated_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Race day not found"
         )
 
-    # Get existing results if not replacing
-    existing_results = []
+    # Get existing positions if not replacing
+    existing_positions = []
     if not replace_all:
-        existing_results = db.query(RaceResult).filter(RaceResult.race_day_id == race_day_id).all()
+        existing_positions = (await db.scalars(
+            select(RaceResult.position).where(RaceResult.race_day_id == race_day_id)
+        )).all()
 
     # Validate no duplicate positions (check against both new and existing)
     new_positions = [r.position for r in results]
-    existing_positions = [r.position for r in existing_results]
 
-    if len(new_positions) != len(set(new_positions)):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Duplicate positions in new results"
-        )
+    # Single pass that stops at the first repeated position
+    seen_positions = set()
+    for position in new_positions:
+        if position in seen_positions:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Duplicate positions in new results"
+            )
+        seen_positions.add(position)
 
     # Check for position conflicts with existing results
-    position_conflicts = set(new_positions) & set(existing_positions)
+    position_conflicts = seen_positions.intersection(existing_positions)
     if position_conflicts:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Position(s) {sorted(position_conflicts)} already exist for this race day"
         )
 
-    # Clear existing results only if replace_all is true
-    if replace_all:
-        db.query(RaceResult).filter(RaceResult.race_day_id == race_day_id).delete()
-
-    # Create new results
+    # Create new results with one multi-row INSERT ... RETURNING, which also
+    # loads the generated ids and timestamps for the response
     db_results = []
-    for result in results:
-        db_result = RaceResult(**result.model_dump())
-        db.add(db_result)
-        db_results.append(db_result)
-
-    db.commit()
-
-    # Update race day total participants count
-    total_count = db.query(RaceResult).filter(RaceResult.race_day_id == race_day_id).count()
-    race_day.total_participants = total_count
-
-    # Update status if adding first results
-    if total_count > 0 and race_day.status == "scheduled":
-        race_day.status = "in_progress"
-
-    db.commit()
-
-    # Refresh all results
-    for result in db_results:
-        db.refresh(result)
+    if replace_all:
+        # Drop positions missing from the new set, then upsert the rest on the
+        # unique (race_day_id, position) index so existing rows keep their ids.
+        # Nothing from race_results is loaded in this session, so skip syncing it
+        await db.execute(delete(RaceResult).where(
+            RaceResult.race_day_id == race_day_id,
+            RaceResult.position.notin_(new_positions)
+        ).execution_options(synchronize_session=False))
+        if results:
+            stmt = pg_insert(RaceResult)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[RaceResult.race_day_id, RaceResult.position],
+                set_={column: stmt.excluded[column] for column in _RESULT_UPSERT_COLUMNS}
+            ).returning(RaceResult).execution_options(populate_existing=True)
+            db_results = (await db.scalars(stmt, [result.model_dump() for result in results])).all()
+    elif results:
+        db_results = (await db.scalars(
+            insert(RaceResult).returning(RaceResult),
+            [result.model_dump() for result in results]
+        )).all()
+
+    await db.commit()
+    background_tasks.add_task(refresh_bull_stats)
+    response_cache.invalidate("race_day_detail", "race_results")
 
     return db_results
 
@@ -402,7 +533,9 @@ async def get_race_results(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
     search: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    after_position: Optional[int] = Query(None, ge=0),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all results for a race day with pagination and search
@@ -413,103 +546,111 @@ async def get_race_results(
     - **skip**: Number of records to skip
     - **limit**: Maximum number of records to return
     - **search**: Search by bull name or owner name
+    - **after_position**: Keyset cursor - return results after this position (skip is ignored).
+      Pass the previous page's next_after_position to page without OFFSET scans.
+    - **include_total**: Set false to skip counting all matching results (total is null)
     """
-    from app.models.bull import Bull
-    from app.models.owner import Owner
-
-    # Get all results for this race day
-    query = db.query(RaceResult).filter(RaceResult.race_day_id == race_day_id)
+    cache_key = ("race_results", race_day_id, skip, limit, search, after_position, include_total)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    Bull1, Bull2 = aliased(Bull), aliased(Bull)
+    Owner1, Owner2 = aliased(Owner), aliased(Owner)
+
+    # Bull and owner names come from outer joins in the same query; search
+    # and pagination run in SQL so only the requested page is loaded
+    query = select(
+        RaceResult.id, RaceResult.race_day_id, RaceResult.position,
+        RaceResult.time_milliseconds, RaceResult.is_disqualified,
+        Bull1.id.label('bull1_id'), Bull1.name.label('bull1_name'),
+        Bull2.id.label('bull2_id'), Bull2.name.label('bull2_name'),
+        Owner1.id.label('owner1_id'), Owner1.full_name.label('owner1_name'),
+        Owner2.id.label('owner2_id'), Owner2.full_name.label('owner2_name'),
+    ).outerjoin(
+        Bull1, Bull1.id == RaceResult.bull1_id
+    ).outerjoin(
+        Bull2, Bull2.id == RaceResult.bull2_id
+    ).outerjoin(
+        Owner1, Owner1.id == RaceResult.owner1_id
+    ).outerjoin(
+        Owner2, Owner2.id == RaceResult.owner2_id
+    ).where(RaceResult.race_day_id == race_day_id)
+
+    # Search by bull or owner name (escapes % and _ in user input)
+    if search:
+        query = query.where(or_(
+            Bull1.name.icontains(search, autoescape=True),
+            Bull2.name.icontains(search, autoescape=True),
+            Owner1.full_name.icontains(search, autoescape=True),
+            Owner2.full_name.icontains(search, autoescape=True)
+        ))
+
+    # Joins only affect the count when searching (they are all outer joins)
+    total = None
+    if include_total and search:
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    elif include_total:
+        total = await db.scalar(
+            select(func.count(RaceResult.id)).where(RaceResult.race_day_id == race_day_id)
+        )
 
-    # For search, we'll filter after enrichment since we need to search in related tables
-    # So first get all results, then filter
-    all_results = query.order_by(RaceResult.position).all()
+    page_query = query.order_by(RaceResult.position).limit(limit)
+    if after_position is not None:
+        # Keyset: seeks ix_race_results_race_day_position (positions are unique per day)
+        page_query = page_query.where(RaceResult.position > after_position)
+    else:
+        page_query = page_query.offset(skip)
+    page = (await db.execute(page_query)).all()
 
     # Build team data with bull and owner info
-    team_results = []
-    for result in all_results:
+    paginated_results = []
+    for result in page:
         team_data = {
-            'result_id': str(result.id),
-            'race_day_id': str(result.race_day_id),
+            'result_id': result.id,
+            'race_day_id': result.race_day_id,
             'position': result.position,
             'time_milliseconds': result.time_milliseconds,
             'is_disqualified': result.is_disqualified,
         }
 
-        # Add bull1 info if exists
-        bull1_name = None
+        # Add bull and owner info if they exist
         if result.bull1_id:
-            bull1 = db.query(Bull).filter(Bull.id == result.bull1_id).first()
-            if bull1:
-                team_data['bull1_id'] = str(result.bull1_id)
-                team_data['bull1_name'] = bull1.name
-                bull1_name = bull1.name
-
-        # Add bull2 info if exists
-        bull2_name = None
+            team_data['bull1_id'] = result.bull1_id
+            team_data['bull1_name'] = result.bull1_name
         if result.bull2_id:
-            bull2 = db.query(Bull).filter(Bull.id == result.bull2_id).first()
-            if bull2:
-                team_data['bull2_id'] = str(result.bull2_id)
-                team_data['bull2_name'] = bull2.name
-                bull2_name = bull2.name
-
-        # Add owner1 info if exists
-        owner1_name = None
+            team_data['bull2_id'] = result.bull2_id
+            team_data['bull2_name'] = result.bull2_name
         if result.owner1_id:
-            owner1 = db.query(Owner).filter(Owner.id == result.owner1_id).first()
-            if owner1:
-                team_data['owner1_id'] = str(result.owner1_id)
-                team_data['owner1_name'] = owner1.full_name
-                owner1_name = owner1.full_name
-
-        # Add owner2 info if exists
-        owner2_name = None
+            team_data['owner1_id'] = result.owner1_id
+            team_data['owner1_name'] = result.owner1_name
         if result.owner2_id:
-            owner2 = db.query(Owner).filter(Owner.id == result.owner2_id).first()
-            if owner2:
-                team_data['owner2_id'] = str(result.owner2_id)
-                team_data['owner2_name'] = owner2.full_name
-                owner2_name = owner2.full_name
-
-        # Apply search filter
-        if search:
-            search_lower = search.lower()
-            matches = False
-            if bull1_name and search_lower in bull1_name.lower():
-                matches = True
-            elif bull2_name and search_lower in bull2_name.lower():
-                matches = True
-            elif owner1_name and search_lower in owner1_name.lower():
-                matches = True
-            elif owner2_name and search_lower in owner2_name.lower():
-                matches = True
-
-            if not matches:
-                continue
-
-        team_results.append(team_data)
-
-    # Apply pagination
-    total = len(team_results)
-    paginated_results = team_results[skip:skip + limit]
-
-    return {
+            team_data['owner2_id'] = result.owner2_id
+            team_data['owner2_name'] = result.owner2_name
+
+        paginated_results.append(team_data)
+
+    response = FastJSONResponse({
         "data": paginated_results,
         "total": total,
         "skip": skip,
-        "limit": limit
-    }
+        "limit": limit,
+        "next_after_position": page[-1].position if len(page) == limit else None
+    })
+    response_cache.set(cache_key, response.body, settings.RACE_RESULTS_CACHE_SECONDS)
+    return response
 
 
 @router.put("/results/{result_id}", response_model=RaceResultResponse)
 async def update_race_result(
     result_id: UUID,
     result_data: RaceResultCreate,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Update a race result"""
-    result = db.query(RaceResult).filter(RaceResult.id == result_id).first()
+    result = await db.get(RaceResult, result_id)
     if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -520,34 +661,39 @@ async def update_race_result(
     for field, value in result_data.model_dump().items():
         setattr(result, field, value)
 
-    db.commit()
-    db.refresh(result)
+    await db.commit()
+    background_tasks.add_task(refresh_bull_stats)
+    response_cache.invalidate("race_day_detail", "race_results")
+    await db.refresh(result)
     return result
 
 
 @router.delete("/results/{result_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_race_result(
     result_id: UUID,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """Delete a race result and update participant count"""
-    result = db.query(RaceResult).filter(RaceResult.id == result_id).first()
-    if not result:
+    race_day_id = await db.scalar(
+        delete(RaceResult).where(RaceResult.id == result_id).returning(RaceResult.race_day_id)
+        .execution_options(synchronize_session=False)
+    )
+    if not race_day_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Result not found"
         )
 
-    race_day_id = result.race_day_id
-    db.delete(result)
-    db.commit()
-
-    # Update race day total participants count
-    race_day = db.query(RaceDay).filter(RaceDay.id == race_day_id).first()
-    if race_day:
-        total_count = db.query(RaceResult).filter(RaceResult.race_day_id == race_day_id).count()
-        race_day.total_participants = total_count
-        db.commit()
+    # Decrement the race day's participant count in the same transaction
+    await db.execute(
+        update(RaceDay).where(RaceDay.id == race_day_id).values(
+            total_participants=func.greatest(func.coalesce(RaceDay.total_participants, 0) - 1, 0)
+        ).execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    background_tasks.add_task(refresh_bull_stats)
+    response_cache.invalidate("race_day_detail", "race_results")
 
     return None
@@ -5,13 +5,18 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import or_, func
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy import Date, Integer, cast, func, literal, null, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.core.config import settings
+from app.db.base import get_async_db
 from app.models.bull import Bull
+from app.models.bull_stats import bull_stats
 from app.models.owner import Owner
 from app.models.race import Race
+from app.services.response_cache import response_cache
+from app.utils.responses import FastJSONResponse
 
 router = APIRouter(prefix="/public/search", tags=["Search"])
 
@@ -20,7 +25,7 @@ router = APIRouter(prefix="/public/search", tags=["Search"])
 async def global_search(
     q: str = Query(..., min_length=2, description="Search query (minimum 2 characters)"),
     limit: int = Query(10, ge=1, le=50),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Global search across bulls, owners, and races
@@ -37,66 +42,94 @@ async def global_search(
     Returns:
         Results grouped by category (bulls, owners, races)
     """
+    cache_key = ("search", "global", q, limit)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     search_pattern = f"%{q}%"
 
-    # Search bulls
-    bulls = db.query(Bull).filter(
+    # Bulls by name, with the owner's name joined in
+    bulls_query = select(
+        literal("bull").label("kind"),
+        Bull.id, Bull.name, Bull.photo_url,
+        Owner.full_name.label("owner_name"),
+        null().label("phone"), null().label("bulls_count"),
+        # Typed so Postgres can match them against the race columns below
+        cast(null(), Date).label("date"), null().label("address"), null().label("status"),
+        cast(null(), Integer).label("total_participants")
+    ).outerjoin(Owner, Owner.id == Bull.owner_id).where(
         Bull.is_active == True,
         Bull.name.ilike(search_pattern)
-    ).limit(limit).all()
+    ).limit(limit)
 
-    bull_results = []
-    for bull in bulls:
-        # Get owner name
-        owner = db.query(Owner).filter(Owner.id == bull.owner_id).first()
-
-        bull_results.append({
-            "id": str(bull.id),
-            "name": bull.name,
-            "photo_url": bull.photo_url,
-            "owner_name": owner.full_name if owner else None,
-            "type": "bull"
-        })
-
-    # Search owners
-    owners = db.query(Owner).filter(
+    # Owners by name; active bulls are counted in one GROUP BY over the
+    # matched owners only
+    owners_page = select(
+        Owner.id, Owner.full_name, Owner.phone_number
+    ).where(
         Owner.full_name.ilike(search_pattern)
-    ).limit(limit).all()
+    ).limit(limit).subquery()
 
-    owner_results = []
-    for owner in owners:
-        # Count bulls owned
-        bulls_count = db.query(func.count(Bull.id)).filter(
-            Bull.owner_id == owner.id,
-            Bull.is_active == True
-        ).scalar()
-
-        owner_results.append({
-            "id": str(owner.id),
-            "name": owner.full_name,
-            "phone": owner.phone_number,
-            "bulls_count": bulls_count,
-            "type": "owner"
-        })
-
-    # Search races
-    races = db.query(Race).filter(
+    bull_counts = select(
+        Bull.owner_id, func.count(Bull.id).label("bulls_count")
+    ).where(
+        Bull.is_active == True,
+        Bull.owner_id.in_(select(owners_page.c.id))
+    ).group_by(Bull.owner_id).subquery()
+
+    owners_query = select(
+        literal("owner"),
+        owners_page.c.id, owners_page.c.full_name, null(), null(),
+        owners_page.c.phone_number,
+        func.coalesce(bull_counts.c.bulls_count, 0),
+        null(), null(), null(), null()
+    ).outerjoin(bull_counts, bull_counts.c.owner_id == owners_page.c.id)
+
+    # Races by name, most recent first
+    races_query = select(
+        literal("race"),
+        Race.id, Race.name, null(), null(), null(), null(),
+        Race.start_date, Race.address, Race.status, Race.total_participants
+    ).where(
         Race.name.ilike(search_pattern)
-    ).order_by(Race.race_date.desc()).limit(limit).all()
+    ).order_by(Race.start_date.desc()).limit(limit)
 
+    # All three searches in one round trip; rows are split by kind
+    rows = (await db.execute(union_all(bulls_query, owners_query, races_query))).all()
+
+    bull_results = []
+    owner_results = []
     race_results = []
-    for race in races:
-        race_results.append({
-            "id": str(race.id),
-            "name": race.name,
-            "date": race.race_date.isoformat(),
-            "address": race.address,
-            "status": race.status,
-            "total_participants": race.total_participants,
-            "type": "race"
-        })
-
-    return {
+    for row in rows:
+        if row.kind == "bull":
+            bull_results.append({
+                "id": row.id,
+                "name": row.name,
+                "photo_url": row.photo_url,
+                "owner_name": row.owner_name,
+                "type": "bull"
+            })
+        elif row.kind == "owner":
+            owner_results.append({
+                "id": row.id,
+                "name": row.name,
+                "phone": row.phone,
+                "bulls_count": row.bulls_count,
+                "type": "owner"
+            })
+        else:
+            race_results.append({
+                "id": row.id,
+                "name": row.name,
+                "date": row.date,
+                "address": row.address,
+                "status": row.status,
+                "total_participants": row.total_participants,
+                "type": "race"
+            })
+
+    response = FastJSONResponse({
         "query": q,
         "results": {
             "bulls": bull_results,
@@ -104,14 +137,16 @@ async def global_search(
             "races": race_results
         },
         "total_results": len(bull_results) + len(owner_results) + len(race_results)
-    }
+    })
+    response_cache.set(cache_key, response.body, settings.SEARCH_CACHE_SECONDS)
+    return response
 
 
 @router.get("/bulls")
 async def search_bulls(
     q: str = Query(..., min_length=2),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Search bulls only (with more details)
@@ -123,58 +158,52 @@ async def search_bulls(
     Returns:
         List of bulls matching search
     """
-    search_pattern = f"%{q}%"
+    cache_key = ("search", "bulls", q, limit)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    query = db.query(Bull).filter(
-        Bull.is_active == True,
-        Bull.name.ilike(search_pattern)
-    )
+    search_pattern = f"%{q}%"
 
-    bulls = query.limit(limit).all()
-
-    results = []
-    for bull in bulls:
-        # Get statistics
-        from app.models.race import RaceResult
-
-        total_races = db.query(func.count(RaceResult.id)).filter(
-            RaceResult.bull_id == bull.id,
-            RaceResult.is_disqualified == False
-        ).scalar()
-
-        first_place_wins = db.query(func.count(RaceResult.id)).filter(
-            RaceResult.bull_id == bull.id,
-            RaceResult.position == 1,
-            RaceResult.is_disqualified == False
-        ).scalar()
-
-        best_time = db.query(func.min(RaceResult.time_milliseconds)).filter(
-            RaceResult.bull_id == bull.id,
-            RaceResult.is_disqualified == False
-        ).scalar()
-
-        # Get owner
-        owner = db.query(Owner).filter(Owner.id == bull.owner_id).first()
-
-        results.append({
-            "id": str(bull.id),
-            "name": bull.name,
-            "photo_url": bull.photo_url,
-            "breed": bull.breed,
-            "color": bull.color,
-            "owner_name": owner.full_name if owner else None,
+    # Bulls with owner name and precomputed statistics joined in, one query
+    rows = (await db.execute(
+        select(
+            Bull.id, Bull.name, Bull.photo_url, Bull.breed, Bull.color,
+            Owner.full_name.label("owner_name"),
+            bull_stats.c.total_races, bull_stats.c.first_place_wins,
+            bull_stats.c.best_time_milliseconds
+        ).outerjoin(Owner, Owner.id == Bull.owner_id).outerjoin(
+            bull_stats, bull_stats.c.bull_id == Bull.id
+        ).where(
+            Bull.is_active == True,
+            Bull.name.ilike(search_pattern)
+        ).limit(limit)
+    )).all()
+
+    results = [
+        {
+            "id": row.id,
+            "name": row.name,
+            "photo_url": row.photo_url,
+            "breed": row.breed,
+            "color": row.color,
+            "owner_name": row.owner_name,
             "statistics": {
-                "total_races": total_races or 0,
-                "first_place_wins": first_place_wins or 0,
-                "best_time_milliseconds": best_time
+                "total_races": row.total_races or 0,
+                "first_place_wins": row.first_place_wins or 0,
+                "best_time_milliseconds": row.best_time_milliseconds
             }
-        })
+        }
+        for row in rows
+    ]
 
-    return {
+    response = FastJSONResponse({
         "query": q,
         "results": results,
         "total": len(results)
-    }
+    })
+    response_cache.set(cache_key, response.body, settings.SEARCH_CACHE_SECONDS)
+    return response
 
 
 @router.get("/races")
@@ -182,7 +211,7 @@ async def search_races(
     q: str = Query(..., min_length=2),
     status_filter: Optional[str] = Query(None, alias="status"),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Search races only
@@ -195,30 +224,41 @@ async def search_races(
     Returns:
         List of races matching search
     """
+    cache_key = ("search", "races", q, status_filter, limit)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     search_pattern = f"%{q}%"
 
-    query = db.query(Race).filter(
+    # Only the columns in the response, as row tuples rather than Race objects
+    query = select(
+        Race.id, Race.name, Race.start_date, Race.address, Race.status, Race.total_participants
+    ).where(
         Race.name.ilike(search_pattern)
     )
 
     if status_filter:
-        query = query.filter(Race.status == status_filter)
-
-    races = query.order_by(Race.race_date.desc()).limit(limit).all()
-
-    results = []
-    for race in races:
-        results.append({
-            "id": str(race.id),
-            "name": race.name,
-            "date": race.race_date.isoformat(),
-            "address": race.address,
-            "status": race.status,
-            "total_participants": race.total_participants
-        })
-
-    return {
+        query = query.where(Race.status == status_filter)
+
+    rows = (await db.execute(query.order_by(Race.start_date.desc()).limit(limit))).all()
+
+    results = [
+        {
+            "id": row.id,
+            "name": row.name,
+            "date": row.start_date,
+            "address": row.address,
+            "status": row.status,
+            "total_participants": row.total_participants
+        }
+        for row in rows
+    ]
+
+    response = FastJSONResponse({
         "query": q,
         "results": results,
         "total": len(results)
-    }
+    })
+    response_cache.set(cache_key, response.body, settings.SEARCH_CACHE_SECONDS)
+    return response
@@ -1,14 +1,15 @@
 """
 File upload endpoints
 """
+from pathlib import Path
 from typing import Optional
 from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status, Form
-from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.dependencies import get_current_active_admin
-from app.db.base import get_db
 from app.models.admin import AdminUser
 from app.services.storage import storage_service
+from app.utils.image_utils import IMAGE_SIGNATURE_LENGTH, sniff_image_type, upload_size
 
 router = APIRouter(prefix="/admin/upload", tags=["Admin - Upload"])
 
@@ -18,11 +19,45 @@ ALLOWED_FOLDERS = {"others", "documents"}
 # Image folders that require specialized endpoints with thumbnail generation
 IMAGE_FOLDERS = {"owners", "race_bulls", "selling_bulls"}
 
+# Extensions accepted by the image endpoints
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+
+async def validate_image_upload(file: UploadFile) -> None:
+    """
+    Reject non-image uploads before the body is decoded
+
+    Checks the filename extension, the spooled size and the leading magic
+    bytes, so only the first few bytes are read for a rejected file.
+
+    Raises HTTPException if validation fails
+    """
+    if not file.filename or Path(file.filename).suffix.lower() not in IMAGE_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only JPG and PNG images are allowed"
+        )
+
+    if upload_size(file) > settings.max_upload_size_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Image size must be less than {settings.MAX_UPLOAD_SIZE_MB}MB"
+        )
+
+    await file.seek(0)
+    header = await file.read(IMAGE_SIGNATURE_LENGTH)
+    await file.seek(0)
+    if sniff_image_type(header) not in settings.allowed_image_types_list:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File content is not a supported image"
+        )
+
+
 @router.post("")
 async def upload_file(
     file: UploadFile = File(...),
     folder: str = Form("others"),
-    db: Session = Depends(get_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """
@@ -74,7 +109,6 @@ async def upload_file(
 async def upload_bull_image(
     file: UploadFile = File(...),
     folder: str = Form("race_bulls"),
-    db: Session = Depends(get_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """
@@ -95,6 +129,8 @@ async def upload_bull_image(
     if folder not in ["race_bulls", "selling_bulls"]:
         folder = "race_bulls"
 
+    await validate_image_upload(file)
+
     try:
         # Upload with thumbnail generation
         photo_url, thumbnail_url = await storage_service.upload_bull_image(file, folder=folder)
@@ -121,7 +157,6 @@ async def upload_bull_image(
 async def upload_owner_image(
     file: UploadFile = File(...),
     folder: str = Form("owners"),
-    db: Session = Depends(get_db),
     current_user: AdminUser = Depends(get_current_active_admin)
 ):
     """
@@ -138,6 +173,8 @@ async def upload_owner_image(
         signed_url: Preview URL for original
         thumbnail_signed_url: Preview URL for thumbnail
     """
+    await validate_image_upload(file)
+
     try:
         # Upload with thumbnail generation
         photo_url, thumbnail_url = await storage_service.upload_owner_image(file, folder=folder)
@@ -3,33 +3,57 @@ User Bulls for Sale API Endpoints
 Allows authenticated users to list their bulls for sale with restrictions
 """
 from typing import List, Optional
+import logging
+import uuid
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, File, UploadFile, Form
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import delete, exists, func, insert, literal, or_, select, update
 
 from app.api.v1.auth import get_current_app_user
-from app.db.base import get_db
+from app.db.base import AsyncSessionLocal, get_db
 from app.models.user import User
 from app.models.user_bull import UserBullSell
 from app.schemas.user_bull import UserBullSellResponse, UserBullSellListResponse
+from app.services.response_cache import response_cache
 from app.services.storage import storage_service
+from app.utils.image_utils import IMAGE_SIGNATURE_LENGTH, sniff_image_type, upload_size
+from app.utils.responses import FastJSONResponse
+from app.utils.row_builders import make_row_builder
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/user/bulls", tags=["User Bulls"])
 
 # Constants
 MAX_BULLS_PER_USER = 5
 MAX_IMAGE_SIZE_MB = 5
-ALLOWED_IMAGE_TYPES = {'image/jpeg', 'image/jpg', 'image/png'}
-ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
-
-
-def validate_image(file: UploadFile) -> None:
+ALLOWED_IMAGE_TYPES = frozenset({'image/jpeg', 'image/jpg', 'image/png'})
+ALLOWED_EXTENSIONS = ('.jpg', '.jpeg', '.png')  # tuple, for str.endswith
+UPLOAD_FOLDER = "user_bulls_sell"
+
+# list_my_bulls selects these columns and builds UserBullSellResponse dicts
+# from the rows directly
+_LIST_COLUMNS = tuple(
+    UserBullSell.__table__.c[field]
+    for field in UserBullSellResponse.model_fields if field in UserBullSell.__table__.c
+)
+_build_list_item = make_row_builder(
+    list(UserBullSellResponse.model_fields), extra=["image_url", "days_remaining"]
+)
+UPLOAD_URL_EXPIRATION_SECONDS = 900  # 15 minutes to PUT the image to GCS
+
+
+async def validate_image(file: UploadFile) -> None:
     """
     Validate image file format and size
 
+    The format is taken from the leading magic bytes rather than the
+    client-supplied content type, so at most IMAGE_SIGNATURE_LENGTH bytes of
+    the body are read.
+
     Raises HTTPException if validation fails
     """
     # Check file extension
@@ -39,24 +63,15 @@ def validate_image(file: UploadFile) -> None:
             detail="Filename is required"
         )
 
-    file_ext = file.filename.lower().split('.')[-1]
-    if f'.{file_ext}' not in ALLOWED_EXTENSIONS:
+    if not file.filename.lower().endswith(ALLOWED_EXTENSIONS):
+        file_ext = file.filename.lower().split('.')[-1]
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Only JPG and PNG images are allowed. Got: {file_ext}"
         )
 
-    # Check content type
-    if file.content_type not in ALLOWED_IMAGE_TYPES:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid image format. Only JPG and PNG are allowed. Got: {file.content_type}"
-        )
-
-    # Check file size
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()  # Get position (size)
-    file.file.seek(0)  # Reset to beginning
+    # Check file size (counted by the multipart parser as the body was spooled)
+    file_size = upload_size(file)
 
     max_size_bytes = MAX_IMAGE_SIZE_MB * 1024 * 1024
     if file_size > max_size_bytes:
@@ -66,6 +81,148 @@ def validate_image(file: UploadFile) -> None:
             detail=f"Image size must be less than {MAX_IMAGE_SIZE_MB}MB. Got: {size_mb:.2f}MB"
         )
 
+    # Check magic bytes
+    await file.seek(0)
+    header = await file.read(IMAGE_SIGNATURE_LENGTH)
+    await file.seek(0)
+    if sniff_image_type(header) not in ALLOWED_IMAGE_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid image format. Only JPG and PNG are allowed."
+        )
+
+
+async def _attach_listing_thumbnail(bull_id: UUID, contents: Optional[bytes], image_path: str) -> None:
+    """
+    Build and upload a listing's thumbnail, then store its path (background task)
+
+    contents are the image bytes, or None to download them from image_path
+    (images uploaded straight to GCS). Skipped if the listing was deleted or
+    its image replaced in the meantime; the orphaned thumbnail is removed in
+    that case.
+    """
+    try:
+        if contents is None:
+            contents = await storage_service.download_bytes(image_path)
+        thumbnail_path = await storage_service.upload_image_thumbnail(contents, image_path)
+    except Exception:
+        # List views fall back to the original image when there is no thumbnail
+        logger.exception(f"Failed to generate thumbnail for bull listing {bull_id}")
+        return
+
+    async with AsyncSessionLocal() as db:
+        updated_id = await db.scalar(
+            update(UserBullSell).where(
+                UserBullSell.id == bull_id,
+                UserBullSell.image_url == image_path
+            ).values(thumbnail_url=thumbnail_path).returning(UserBullSell.id)
+        )
+        await db.commit()
+
+    if updated_id:
+        response_cache.invalidate("available_bull_detail")
+    else:
+        await storage_service.delete_files([thumbnail_path])
+
+
+async def _validate_uploaded_image(db: Session, object_path: str, user_id: UUID) -> None:
+    """
+    Validate an image the client uploaded directly to GCS via /upload-url
+
+    Raises HTTPException if the path isn't one issued to this user, is already
+    used by a listing, or the stored object is missing, too large or not a
+    JPG/PNG (by its magic bytes). Rejected objects are deleted.
+    """
+    if not object_path.startswith(f"{UPLOAD_FOLDER}/{user_id}/"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid image path"
+        )
+
+    # Listings own their images (deleting one deletes its files), so an
+    # uploaded object can back at most one listing
+    in_use = db.scalar(
+        select(
+            exists().where(
+                or_(UserBullSell.image_url == object_path, UserBullSell.thumbnail_url == object_path)
+            )
+        )
+    )
+    if in_use:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Image is already used by another listing"
+        )
+
+    info = await storage_service.get_blob_info(object_path)
+    if info is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Image has not been uploaded"
+        )
+
+    size, _ = info
+    if size > MAX_IMAGE_SIZE_MB * 1024 * 1024:
+        await storage_service.delete_files([object_path])
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Image size must be less than {MAX_IMAGE_SIZE_MB}MB. Got: {size / (1024 * 1024):.2f}MB"
+        )
+
+    # The stored content type is whatever the client declared; check the bytes
+    header = await storage_service.download_bytes(object_path, start=0, end=IMAGE_SIGNATURE_LENGTH - 1)
+    if sniff_image_type(header) not in ALLOWED_IMAGE_TYPES:
+        await storage_service.delete_files([object_path])
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid image format. Only JPG and PNG are allowed."
+        )
+
+
+@router.post("/upload-url")
+async def create_image_upload_url(
+    content_type: str = Form(...),
+    current_user: User = Depends(get_current_app_user)
+):
+    """
+    Get a signed URL to upload a listing image directly to GCS
+
+    The client PUTs the image bytes to upload_url with upload_headers, then
+    creates the listing with object_path instead of a file. GCS rejects
+    uploads over the size limit.
+    """
+    if content_type not in ALLOWED_IMAGE_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid image format. Only JPG and PNG are allowed. Got: {content_type}"
+        )
+
+    max_size_bytes = MAX_IMAGE_SIZE_MB * 1024 * 1024
+    file_ext = ".png" if content_type == "image/png" else ".jpg"
+    object_path = f"{UPLOAD_FOLDER}/{current_user.id}/{uuid.uuid4()}{file_ext}"
+    try:
+        upload_url = storage_service.generate_upload_signed_url(
+            object_path,
+            content_type,
+            expiration=UPLOAD_URL_EXPIRATION_SECONDS,
+            max_size=max_size_bytes
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create upload URL: {str(e)}"
+        )
+
+    return {
+        "upload_url": upload_url,
+        "upload_headers": {
+            "Content-Type": content_type,
+            "x-goog-content-length-range": f"0,{max_size_bytes}"
+        },
+        "object_path": object_path,
+        "expires_in": UPLOAD_URL_EXPIRATION_SECONDS
+    }
+
 
 @router.get("", response_model=UserBullSellListResponse)
 async def list_my_bulls(
@@ -80,27 +237,39 @@ async def list_my_bulls(
     - Use thumbnails for list view (smaller/faster)
     - 7-day signed URL expiration for better caching
     """
-    bulls = db.query(UserBullSell).filter(
-        UserBullSell.user_id == current_user.id
-    ).order_by(UserBullSell.created_at.desc()).all()
+    # Select just the rendered columns as row tuples (no ORM objects to build)
+    bulls = db.execute(
+        select(*_LIST_COLUMNS, UserBullSell.thumbnail_url).where(
+            UserBullSell.user_id == current_user.id
+        ).order_by(UserBullSell.created_at.desc())
+    ).all()
 
     # OPTIMIZED: Calculate active count from already fetched bulls (no extra query)
     active_count = sum(1 for bull in bulls if bull.status == 'available')
 
-    # Generate signed URLs with thumbnails for list view
-    for bull in bulls:
-        if bull.image_url:
-            # Use THUMBNAIL for list view (smaller/faster)
-            thumbnail_path = bull.thumbnail_url or bull.image_url
-            bull.image_url = storage_service.generate_signed_url(thumbnail_path, expiration=604800)  # 7 days
-
-    return UserBullSellListResponse(
-        bulls=bulls,
-        total=len(bulls),
-        active_count=active_count,
-        max_allowed=MAX_BULLS_PER_USER
+    # Generate signed URLs with thumbnails for list view, signed concurrently
+    # Use THUMBNAIL for list view (smaller/faster)
+    image_urls = await storage_service.generate_signed_urls(
+        (bull.thumbnail_url or bull.image_url for bull in bulls),
+        expiration=604800  # 7 days
     )
 
+    now = datetime.utcnow()
+    return FastJSONResponse({
+        "bulls": [
+            _build_list_item(
+                bull,
+                image_url=image_urls.get(bull.thumbnail_url or bull.image_url),
+                # Same as UserBullSell.days_remaining
+                days_remaining=(bull.expires_at - now).days if bull.expires_at >= now else 0
+            )
+            for bull in bulls
+        ],
+        "total": len(bulls),
+        "active_count": active_count,
+        "max_allowed": MAX_BULLS_PER_USER
+    })
+
 
 @router.get("/{bull_id}", response_model=UserBullSellResponse)
 async def get_bull_detail(
@@ -109,7 +278,7 @@ async def get_bull_detail(
     current_user: User = Depends(get_current_app_user)
 ):
     """Get details of a specific bull (must be owned by current user)"""
-    bull = db.query(UserBullSell).filter(
+    bull = db.query(UserBullSell).options(raiseload("*")).filter(
         UserBullSell.id == bull_id,
         UserBullSell.user_id == current_user.id
     ).first()
@@ -129,9 +298,11 @@ async def get_bull_detail(
 
 @router.post("", response_model=UserBullSellResponse, status_code=status.HTTP_201_CREATED)
 async def create_bull_listing(
+    background_tasks: BackgroundTasks,
     name: str = Form(...),
     price: float = Form(...),
-    image: UploadFile = File(...),
+    image: Optional[UploadFile] = File(None),
+    object_path: Optional[str] = Form(None),
     owner_name: str = Form(...),
     owner_mobile: str = Form(...),
     breed: Optional[str] = Form(None),
@@ -150,22 +321,35 @@ async def create_bull_listing(
     - Only JPG/PNG images allowed
     - Image size must be less than 5MB
     - Bull listing expires after 30 days
-    """
 
-    # 1. Check if user has reached the limit of active bulls
-    active_count = db.query(func.count(UserBullSell.id)).filter(
-        UserBullSell.user_id == current_user.id,
-        UserBullSell.status == 'available'
-    ).scalar()
+    Send the image either as the multipart `image` file, or upload it to GCS
+    first via POST /user/bulls/upload-url and pass its `object_path`.
+    """
 
-    if active_count >= MAX_BULLS_PER_USER:
+    # 1. Reject users already at the listing cap before any image work. This is
+    # only a fast path; the cap is enforced under a lock by the INSERT below
+    active_listings = db.scalar(
+        select(func.count(UserBullSell.id)).where(
+            UserBullSell.user_id == current_user.id,
+            UserBullSell.status == 'available'
+        )
+    )
+    if active_listings >= MAX_BULLS_PER_USER:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"You can only have {MAX_BULLS_PER_USER} active bull listings. Please delete or wait for an existing listing to expire."
         )
 
     # 2. Validate image
-    validate_image(image)
+    if (image is None) == (object_path is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide either an image file or an uploaded object_path"
+        )
+    if image is not None:
+        await validate_image(image)
+    else:
+        await _validate_uploaded_image(db, object_path, current_user.id)
 
     # 3. Validate price
     if price <= 0:
@@ -174,17 +358,25 @@ async def create_bull_listing(
             detail="Price must be greater than 0"
         )
 
-    # 4. Upload image to GCP with automatic thumbnail generation
-    try:
-        image_path, thumbnail_path = await storage_service.upload_bull_image(image, folder="user_bulls_sell")
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to upload image: {str(e)}"
-        )
+    # 4. Upload the optimized original to GCP (unless the client already stored
+    # it there); the thumbnail is generated after the response is sent (list
+    # views use the original until it exists)
+    if image is not None:
+        try:
+            image_path, image_contents = await storage_service.upload_image_original(image, folder=UPLOAD_FOLDER)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to upload image: {str(e)}"
+            )
+    else:
+        image_path, image_contents = object_path, None
 
-    # 5. Create bull listing
+    # 5. Create bull listing, unless the user already has the maximum number of
+    # active listings. The cap is checked in the INSERT itself, so every column
+    # without a server default is set here instead of by flush-time defaults
     bull = UserBullSell(
+        id=uuid.uuid4(),
         user_id=current_user.id,
         name=name,
         breed=breed,
@@ -193,17 +385,47 @@ async def create_bull_listing(
         description=description,
         price=price,
         image_url=image_path,
-        thumbnail_url=thumbnail_path,
+        thumbnail_url=None,
         location=location,
         owner_name=owner_name,
         owner_mobile=owner_mobile,
-        status="available",
-        expires_at=datetime.utcnow() + timedelta(days=30)
+        status="available"
     )
-
-    db.add(bull)
+    # Timestamps come from the column server defaults and are returned below
+    values = {
+        column.key: getattr(bull, column.key)
+        for column in UserBullSell.__table__.columns
+        if column.server_default is None
+    }
+
+    # Serialize this user's creates until commit: under READ COMMITTED two
+    # concurrent INSERTs would otherwise both count the same active listings
+    db.execute(select(func.pg_advisory_xact_lock(func.hashtext(str(current_user.id)))))
+    active_count = select(func.count(UserBullSell.id)).where(
+        UserBullSell.user_id == current_user.id,
+        UserBullSell.status == 'available'
+    ).scalar_subquery()
+    inserted = db.execute(
+        insert(UserBullSell).from_select(
+            list(values),
+            select(*[
+                literal(value, type_=UserBullSell.__table__.c[key].type)
+                for key, value in values.items()
+            ]).where(active_count < MAX_BULLS_PER_USER)
+        ).returning(UserBullSell.created_at, UserBullSell.updated_at, UserBullSell.expires_at)
+    ).first()
     db.commit()
-    db.refresh(bull)
+
+    if inserted is None:
+        # Background tasks don't run for error responses, so clean up inline
+        await storage_service.delete_files([image_path])
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"You can only have {MAX_BULLS_PER_USER} active bull listings. Please delete or wait for an existing listing to expire."
+        )
+
+    bull.created_at, bull.updated_at, bull.expires_at = inserted
+    background_tasks.add_task(_attach_listing_thumbnail, bull.id, image_contents, image_path)
 
     # 6. Generate signed URL for response (use original for detail/create response)
     if bull.image_url:
@@ -215,6 +437,7 @@ async def create_bull_listing(
 @router.put("/{bull_id}", response_model=UserBullSellResponse)
 async def update_bull_listing(
     bull_id: UUID,
+    background_tasks: BackgroundTasks,
     name: Optional[str] = Form(None),
     price: Optional[float] = Form(None),
     breed: Optional[str] = Form(None),
@@ -276,17 +499,15 @@ async def update_bull_listing(
         bull.status = status
 
     # 3. Update image if provided
+    old_image_paths = []
     if image:
-        validate_image(image)
+        await validate_image(image)
         try:
-            # Delete old images (both original and thumbnail)
-            if bull.image_url:
-                storage_service.delete_file(bull.image_url)
-            if bull.thumbnail_url:
-                storage_service.delete_file(bull.thumbnail_url)
+            # Old images (both original and thumbnail) are deleted after the commit
+            old_image_paths = [bull.image_url, bull.thumbnail_url]
 
             # Upload new image with automatic thumbnail generation
-            new_image_path, new_thumbnail_path = await storage_service.upload_bull_image(image, folder="user_bulls_sell")
+            new_image_path, new_thumbnail_path = await storage_service.upload_bull_image(image, folder=UPLOAD_FOLDER)
             bull.image_url = new_image_path
             bull.thumbnail_url = new_thumbnail_path
         except Exception as e:
@@ -295,9 +516,15 @@ async def update_bull_listing(
                 detail=f"Failed to upload new image: {str(e)}"
             )
 
-    bull.updated_at = datetime.utcnow()
+    # The UPDATE returns the database-set updated_at (eager_defaults), so after
+    # the flush the loaded row is current; detach it so the commit doesn't
+    # expire it and force a re-SELECT for the response
+    db.flush()
+    db.expunge(bull)
     db.commit()
-    db.refresh(bull)
+    response_cache.invalidate("available_bull_detail")
+    # Storage cleanup isn't user-visible, so it runs after the response is sent
+    background_tasks.add_task(storage_service.delete_files, old_image_paths)
 
     # 4. Generate signed URL for response (use original for detail/update response)
     if bull.image_url:
@@ -309,29 +536,33 @@ async def update_bull_listing(
 @router.delete("/{bull_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_bull_listing(
     bull_id: UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_app_user)
 ):
     """Delete a bull listing (must be owned by current user)"""
 
-    bull = db.query(UserBullSell).filter(
-        UserBullSell.id == bull_id,
-        UserBullSell.user_id == current_user.id
+    # Ownership check and delete in one statement, returning the image paths
+    deleted = db.execute(
+        delete(UserBullSell).where(
+            UserBullSell.id == bull_id,
+            UserBullSell.user_id == current_user.id
+        ).returning(UserBullSell.image_url, UserBullSell.thumbnail_url)
+        .execution_options(synchronize_session=False)
     ).first()
 
-    if not bull:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Bull not found or you don't have permission to delete it"
         )
 
-    # Delete images from storage (both original and thumbnail)
-    if bull.image_url:
-        storage_service.delete_file(bull.image_url)
-    if bull.thumbnail_url:
-        storage_service.delete_file(bull.thumbnail_url)
+    image_paths = [deleted.image_url, deleted.thumbnail_url]
 
-    db.delete(bull)
     db.commit()
+    response_cache.invalidate("available_bull_detail")
+
+    # Delete images from storage (both original and thumbnail) after the 204 is sent
+    background_tasks.add_task(storage_service.delete_files, image_paths)
 
     return None
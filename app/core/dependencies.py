@@ -1,11 +1,13 @@
 """
 FastAPI dependencies for authentication and authorization
 """
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.db.base import get_db
 from app.models.admin import AdminUser
 from app.core.security import decode_access_token
@@ -13,6 +15,36 @@ from app.core.security import decode_access_token
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"/api/v1/admin/login")
 
+# Fields of AdminUser handed to endpoints, cached per username so a burst of
+# admin requests doesn't query admin_users each time (the JWT is still verified
+# on every request)
+_ADMIN_USER_FIELDS = ("id", "username", "email", "full_name", "role", "is_active")
+_admin_user_cache: Dict[str, Tuple[float, Tuple]] = {}
+_ADMIN_USER_CACHE_MAX_ENTRIES = 1024
+
+
+def _load_admin_user(db: Session, username: str) -> Optional[AdminUser]:
+    """
+    Detached AdminUser snapshot for username, from the cache or the database
+
+    Returns None if no such user exists (misses are not cached).
+    """
+    now = time.monotonic()
+    entry = _admin_user_cache.get(username)
+    if entry is None or entry[0] <= now:
+        user = db.query(AdminUser).filter(AdminUser.username == username).first()
+        if user is None:
+            _admin_user_cache.pop(username, None)
+            return None
+        if len(_admin_user_cache) >= _ADMIN_USER_CACHE_MAX_ENTRIES:
+            _admin_user_cache.clear()
+        entry = (
+            now + settings.ADMIN_AUTH_CACHE_SECONDS,
+            tuple(getattr(user, field) for field in _ADMIN_USER_FIELDS)
+        )
+        _admin_user_cache[username] = entry
+    return AdminUser(**dict(zip(_ADMIN_USER_FIELDS, entry[1])))
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -26,7 +58,7 @@ async def get_current_user(
         db: Database session
 
     Returns:
-        AdminUser object
+        AdminUser object (not attached to a session)
 
     Raises:
         HTTPException: If token is invalid or user not found
@@ -46,8 +78,8 @@ async def get_current_user(
     if username is None:
         raise credentials_exception
 
-    # Get user from database
-    user = db.query(AdminUser).filter(AdminUser.username == username).first()
+    # Get user (cached for ADMIN_AUTH_CACHE_SECONDS)
+    user = _load_admin_user(db, username)
     if user is None:
         raise credentials_exception
 
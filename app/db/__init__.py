@@ -1,3 +1,3 @@
-from app.db.base import Base, engine, get_db, SessionLocal
+from app.db.base import Base, engine, get_db, SessionLocal, async_engine, get_async_db, AsyncSessionLocal
 
-__all__ = ["Base", "engine", "get_db", "SessionLocal"]
+__all__ = ["Base", "engine", "get_db", "SessionLocal", "async_engine", "get_async_db", "AsyncSessionLocal"]
@@ -1,7 +1,11 @@
 """
 Database base configuration and session management
 """
-from sqlalchemy import create_engine
+from uuid import uuid4
+
+from sqlalchemy import DDL, create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -9,16 +13,71 @@ from app.core.config import settings
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Drop connections the server/pooler may have closed
     pool_pre_ping=True,  # Enable connection health checks
+    # Cache compiled SQL keyed by statement shape so hot queries skip recompilation
+    query_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+    # Batch INSERT/UPDATE executemany into multi-row statements (psycopg2)
+    executemany_mode="values_plus_batch",
     echo=settings.DEBUG,  # Log SQL statements in debug mode
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def _async_database_url(database_url: str) -> URL:
+    """DATABASE_URL rewritten for the asyncpg driver (libpq-only options translated/dropped)"""
+    url = make_url(database_url).set(drivername="postgresql+asyncpg")
+    query = dict(url.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    query.pop("channel_binding", None)
+    return url.set(query=query)
+
+
+def _asyncpg_connect_args(prepared_statement_cache_size: int) -> dict:
+    """
+    asyncpg connect arguments for the given prepared statement cache size
+
+    A size of 0 is for pgbouncer transaction pooling: besides SQLAlchemy's
+    cache, asyncpg's own statement cache is disabled and the statements it
+    still prepares get unique names, so they can't collide with another
+    client's statement on a shared server connection.
+    """
+    if prepared_statement_cache_size:
+        return {"prepared_statement_cache_size": prepared_statement_cache_size}
+    return {
+        "prepared_statement_cache_size": 0,
+        "statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
+
+# Async engine for the public and admin race endpoints, so DB I/O doesn't block the event loop
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    pool_size=settings.DB_ASYNC_POOL_SIZE,
+    max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    query_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+    connect_args=_asyncpg_connect_args(settings.DB_PREPARED_STATEMENT_CACHE_SIZE),
+    echo=settings.DEBUG,
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Create Base class for models
 Base = declarative_base()
 
+# Trigram GIN indexes on search columns need pg_trgm (mirrors add_trigram_indexes_001)
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
 
 def get_db():
     """
@@ -30,3 +89,12 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Dependency function to get an async database session
+    Session is closed (connection returned to the pool) after the request
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -3,11 +3,13 @@ Naad Bailgada - Main FastAPI Application
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 import logging
 
+from app.services.storage import shutdown_image_pool
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +24,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson serializes UUID/date/datetime natively, so handlers can return them as-is
+    default_response_class=ORJSONResponse,
 )
 
 @app.on_event("startup")
@@ -40,6 +44,12 @@ async def startup_event():
     except Exception as e:
         logger.warning(f"⚠️ Firebase initialization warning (may already be initialized): {e}")
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release background workers on shutdown"""
+    shutdown_image_pool()
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -81,11 +91,12 @@ async def root():
 from app.api.v1.router import api_router as api_v1_router
 app.include_router(api_v1_router, prefix="/api/v1")
 
-# Mount static files for uploads
+# Images are served from GCS; the local uploads mount only exists for development
 from app.core.config import settings
-uploads_dir = settings.BASE_DIR / "uploads"
-uploads_dir.mkdir(parents=True, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
+if settings.ENVIRONMENT == "development":
+    uploads_dir = settings.BASE_DIR / "uploads"
+    uploads_dir.mkdir(parents=True, exist_ok=True)
+    app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
 
 if __name__ == "__main__":
     import uvicorn
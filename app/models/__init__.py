@@ -3,12 +3,13 @@ SQLAlchemy ORM Models
 """
 from app.models.owner import Owner
 from app.models.bull import Bull
-from app.models.race import Race, RaceResult, RaceDay
+from app.models.race import Race, RaceResult, RaceDay, RaceParticipant
 from app.models.admin import AdminUser
 from app.models.user import User
 from app.models.marketplace import MarketplaceListing
 from app.models.user_bull import UserBullSell
 from app.models.device_token import DeviceToken
+from app.models.bull_stats import bull_stats
 
 __all__ = [
     "Owner",
@@ -16,9 +17,11 @@ __all__ = [
     "Race",
     "RaceDay",
     "RaceResult",
+    "RaceParticipant",
     "AdminUser",
     "User",
     "MarketplaceListing",
     "UserBullSell",
     "DeviceToken",
+    "bull_stats",
 ]
@@ -1,7 +1,7 @@
 """
 Bull model
 """
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, DateTime, Text, Index
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, DateTime, Text, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -33,6 +33,14 @@ class Bull(Base):
     __table_args__ = (
         Index('ix_bulls_owner_active', 'owner_id', 'is_active'),
         Index('ix_bulls_name_active', 'name', 'is_active'),
+        # Owner's active bulls in name order (public owner bulls page)
+        Index('ix_bulls_owner_name_active', 'owner_id', 'name',
+              postgresql_where=text('is_active = true')),
+        # Trigram index for name search (ILIKE '%term%'), requires pg_trgm
+        Index('ix_bulls_name_trgm', 'name',
+              postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('ix_bulls_registration_number_trgm', 'registration_number',
+              postgresql_using='gin', postgresql_ops={'registration_number': 'gin_trgm_ops'}),
     )
 
     def __repr__(self):
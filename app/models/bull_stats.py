@@ -0,0 +1,48 @@
+"""
+Bull statistics materialized view
+"""
+from sqlalchemy import DDL, Integer, Numeric, event, table, column
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base import Base
+
+
+# Per-bull aggregates over non-disqualified race results (via race_participants,
+# so a bull counts whether it ran as bull1 or bull2).
+# Keep in sync with alembic/versions/add_race_participants.py
+BULL_STATS_VIEW_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS bull_stats AS
+SELECT
+    p.bull_id,
+    count(*) AS total_races,
+    count(*) FILTER (WHERE r.position = 1) AS first_place_wins,
+    count(*) FILTER (WHERE r.position = 2) AS second_place_wins,
+    count(*) FILTER (WHERE r.position = 3) AS third_place_wins,
+    min(r.time_milliseconds) AS best_time_milliseconds,
+    avg(r.time_milliseconds) AS avg_time_milliseconds
+FROM race_participants p
+JOIN race_results r ON r.id = p.race_result_id
+WHERE r.is_disqualified = false
+GROUP BY p.bull_id
+"""
+
+# Lightweight table clause for querying the view (not part of Base.metadata,
+# so create_all never tries to create it as a regular table)
+bull_stats = table(
+    "bull_stats",
+    column("bull_id", UUID(as_uuid=True)),
+    column("total_races", Integer),
+    column("first_place_wins", Integer),
+    column("second_place_wins", Integer),
+    column("third_place_wins", Integer),
+    column("best_time_milliseconds", Integer),
+    column("avg_time_milliseconds", Numeric),
+)
+
+# Create/drop the view alongside the tables when using metadata.create_all (reset_db.py)
+event.listen(Base.metadata, "after_create", DDL(BULL_STATS_VIEW_SQL))
+event.listen(
+    Base.metadata, "after_create",
+    DDL("CREATE UNIQUE INDEX IF NOT EXISTS ix_bull_stats_bull_id ON bull_stats (bull_id)")
+)
+event.listen(Base.metadata, "before_drop", DDL("DROP MATERIALIZED VIEW IF EXISTS bull_stats"))
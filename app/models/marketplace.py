@@ -1,7 +1,7 @@
 """
 Marketplace Listing models
 """
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, Index
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from datetime import datetime
@@ -27,5 +27,11 @@ class MarketplaceListing(Base):
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Public available-bulls listing
+        Index('ix_marketplace_listings_available_created', text('created_at DESC'),
+              postgresql_where=text("status = 'available'")),
+    )
+
     def __repr__(self):
         return f"<MarketplaceListing(id={self.id}, name='{self.name}', price={self.price})>"
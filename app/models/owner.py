@@ -26,5 +26,17 @@ class Owner(Base):
     # Relationships
     bulls = relationship("Bull", back_populates="owner")
 
+    __table_args__ = (
+        # Trigram indexes for substring search (ILIKE '%term%'), requires pg_trgm
+        Index('ix_owners_full_name_trgm', 'full_name',
+              postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'}),
+        Index('ix_owners_phone_number_trgm', 'phone_number',
+              postgresql_using='gin', postgresql_ops={'phone_number': 'gin_trgm_ops'}),
+        Index('ix_owners_address_trgm', 'address',
+              postgresql_using='gin', postgresql_ops={'address': 'gin_trgm_ops'}),
+        Index('ix_owners_email_trgm', 'email',
+              postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}),
+    )
+
     def __repr__(self):
         return f"<Owner(id={self.id}, name='{self.full_name}')>"
@@ -1,7 +1,7 @@
 """
 Race and RaceResult models
 """
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, DateTime, Date, Text, CheckConstraint, Index
+from sqlalchemy import Column, String, Integer, SmallInteger, Boolean, ForeignKey, DateTime, Date, Text, CheckConstraint, Index, text, DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -30,6 +30,8 @@ class Race(Base):
         index=True
     )
     created_by = Column(String(100), nullable=True)
+    # Sum of race_days.total_participants, maintained by a trigger on race_days
+    total_participants = Column(Integer, nullable=False, default=0, server_default=text("0"))
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -52,6 +54,15 @@ class Race(Base):
         ),
         Index('ix_races_status_start_date', 'status', 'start_date'),
         Index('ix_races_dates_range', 'start_date', 'end_date'),
+        Index('ix_races_status_end_date', 'status', text('end_date DESC')),
+        # Upcoming listings only read scheduled races
+        Index('ix_races_scheduled_start_date', 'start_date',
+              postgresql_where=text("status = 'scheduled'")),
+        # Trigram index for name search (ILIKE '%term%'), requires pg_trgm
+        Index('ix_races_name_trgm', 'name',
+              postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('ix_races_address_trgm', 'address',
+              postgresql_using='gin', postgresql_ops={'address': 'gin_trgm_ops'}),
     )
 
     def __repr__(self):
@@ -90,12 +101,46 @@ class RaceDay(Base):
         Index('ix_race_days_race_day_number', 'race_id', 'day_number', unique=True),
         Index('ix_race_days_race_status', 'race_id', 'status'),
         Index('ix_race_days_date_status', 'race_date', 'status'),
+        # Notification job looks up scheduled race days by date
+        Index('ix_race_days_scheduled_date', 'race_date',
+              postgresql_where=text("status = 'scheduled'")),
     )
 
     def __repr__(self):
         return f"<RaceDay(id={self.id}, race_id={self.race_id}, day={self.day_number}, date={self.race_date}, status='{self.status}')>"
 
 
+# Keep races.total_participants equal to the sum over its race days.
+# Keep in sync with alembic/versions/add_race_total_participants.py
+RACE_TOTAL_PARTICIPANTS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION sync_race_total_participants() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        UPDATE races SET total_participants = (
+            SELECT coalesce(sum(total_participants), 0) FROM race_days WHERE race_id = OLD.race_id
+        ) WHERE id = OLD.race_id;
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.race_id IS DISTINCT FROM OLD.race_id) THEN
+        UPDATE races SET total_participants = (
+            SELECT coalesce(sum(total_participants), 0) FROM race_days WHERE race_id = NEW.race_id
+        ) WHERE id = NEW.race_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+RACE_TOTAL_PARTICIPANTS_TRIGGER_SQL = """
+CREATE TRIGGER trg_race_days_sync_total_participants
+AFTER INSERT OR DELETE OR UPDATE OF race_id, total_participants ON race_days
+FOR EACH ROW EXECUTE FUNCTION sync_race_total_participants()
+"""
+
+# Install the trigger when tables are created via metadata.create_all (reset_db.py)
+event.listen(RaceDay.__table__, "after_create", DDL(RACE_TOTAL_PARTICIPANTS_FUNCTION_SQL))
+event.listen(RaceDay.__table__, "after_create", DDL(RACE_TOTAL_PARTICIPANTS_TRIGGER_SQL))
+
+
 class RaceResult(Base):
     __tablename__ = "race_results"
 
@@ -131,3 +176,54 @@ class RaceResult(Base):
 
     def __repr__(self):
         return f"<RaceResult(id={self.id}, race_day_id={self.race_day_id}, position={self.position})>"
+
+
+class RaceParticipant(Base):
+    """
+    One row per bull per race result (normalized bull1_id/bull2_id)
+
+    Lets per-bull queries use a single indexed lookup on bull_id instead of
+    OR-ing bull1_id and bull2_id. Rows are maintained by a database trigger on
+    race_results, so application code never writes to this table directly.
+    """
+    __tablename__ = "race_participants"
+
+    race_result_id = Column(UUID(as_uuid=True), ForeignKey("race_results.id", ondelete="CASCADE"), primary_key=True)
+    slot = Column(SmallInteger, primary_key=True)  # 1 = bull1, 2 = bull2
+    bull_id = Column(UUID(as_uuid=True), ForeignKey("bulls.id", ondelete="RESTRICT"), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("slot IN (1, 2)", name="check_participant_slot"),
+        Index('ix_race_participants_bull_id', 'bull_id', 'race_result_id'),
+    )
+
+    def __repr__(self):
+        return f"<RaceParticipant(race_result_id={self.race_result_id}, slot={self.slot}, bull_id={self.bull_id})>"
+
+
+# Keep race_participants in sync with race_results.bull1_id/bull2_id.
+# Keep in sync with alembic/versions/add_race_participants.py
+RACE_PARTICIPANTS_SYNC_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION sync_race_participants() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM race_participants WHERE race_result_id = NEW.id;
+    INSERT INTO race_participants (race_result_id, slot, bull_id)
+    SELECT NEW.id, p.slot, p.bull_id
+    FROM (VALUES (1, NEW.bull1_id), (2, NEW.bull2_id)) AS p(slot, bull_id)
+    WHERE p.bull_id IS NOT NULL
+      -- Same bull in both slots still counts as one participation
+      AND NOT (p.slot = 2 AND p.bull_id IS NOT DISTINCT FROM NEW.bull1_id);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+RACE_PARTICIPANTS_SYNC_TRIGGER_SQL = """
+CREATE TRIGGER trg_race_results_sync_participants
+AFTER INSERT OR UPDATE OF bull1_id, bull2_id ON race_results
+FOR EACH ROW EXECUTE FUNCTION sync_race_participants()
+"""
+
+# Install the trigger when tables are created via metadata.create_all (reset_db.py)
+event.listen(RaceParticipant.__table__, "after_create", DDL(RACE_PARTICIPANTS_SYNC_FUNCTION_SQL))
+event.listen(RaceParticipant.__table__, "after_create", DDL(RACE_PARTICIPANTS_SYNC_TRIGGER_SQL))
@@ -2,11 +2,11 @@
 User Bulls for Sale model
 Allows users to list their bulls for sale with restrictions
 """
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, Index, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, DateTime, Text, Index, ForeignKey, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from app.db.base import Base
 
@@ -31,25 +31,33 @@ class UserBullSell(Base):
     owner_mobile = Column(String(20), nullable=False)  # Owner's mobile for contact
 
     # Status: 'available', 'sold', 'expired'
-    status = Column(String(20), default="available", index=True, nullable=False)
+    status = Column(String(20), default="available", nullable=False)
 
-    # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, index=True, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    expires_at = Column(DateTime, nullable=False, index=True)  # 30 days from created_at
+    # Timestamps (naive UTC, set by the database)
+    created_at = Column(DateTime, server_default=text("timezone('utc', now())"), index=True, nullable=False)
+    updated_at = Column(DateTime, server_default=text("timezone('utc', now())"),
+                        onupdate=func.timezone('utc', func.now()), nullable=False)
+    expires_at = Column(DateTime, server_default=text("timezone('utc', now()) + interval '30 days'"),
+                        nullable=False, index=True)  # 30 days from created_at
 
     # Relationship
     user = relationship("User", backref="bulls_for_sale")
 
     __table_args__ = (
         Index('ix_user_bulls_sell_user_status', 'user_id', 'status'),
+        # Per-user active listing cap on create
+        Index('ix_user_bulls_sell_active_by_user', 'user_id',
+              postgresql_where=text("status = 'available'")),
+        # Public "for sale" listing: newest available listings first
+        Index('ix_user_bulls_sell_available_created', text('created_at DESC'),
+              postgresql_where=text("status = 'available'")),
+        # Expiry job: available listings past expires_at
+        Index('ix_user_bulls_sell_available_expires', 'expires_at',
+              postgresql_where=text("status = 'available'")),
     )
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Set expiration to 30 days from now if not set
-        if not self.expires_at:
-            self.expires_at = datetime.utcnow() + timedelta(days=30)
+    # Fetch the server-side timestamps with RETURNING on INSERT/UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self):
         return f"<UserBullSell(id={self.id}, name='{self.name}', user_id={self.user_id})>"
@@ -0,0 +1,28 @@
+"""
+Refresh of the bull_stats materialized view
+"""
+import logging
+
+from sqlalchemy import text
+
+from app.db.base import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_bull_stats():
+    """
+    Refresh bull_stats after race results change
+
+    Runs CONCURRENTLY so public reads are never blocked while it rebuilds.
+    Meant to be scheduled as a background task after the write commits.
+    """
+    db = SessionLocal()
+    try:
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY bull_stats"))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to refresh bull_stats: {e}")
+    finally:
+        db.close()
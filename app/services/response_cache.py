@@ -0,0 +1,58 @@
+"""
+In-process cache for serialized public API responses
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from app.core.config import settings
+
+
+class ResponseCache:
+    """
+    TTL cache of rendered JSON bodies keyed by (namespace, *params)
+
+    Entries are stored as the bytes that were sent to the client, so a hit
+    skips both the database and serialization. Each process keeps its own
+    copy; writes invalidate the local copy and the TTL bounds how stale other
+    instances can get.
+    """
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[bytes]:
+        """Return the cached body for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def set(self, key: Tuple[Hashable, ...], body: bytes, ttl: int) -> None:
+        """Store body for ttl seconds, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *namespaces: str) -> None:
+        """Drop every entry in the given namespaces"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] in namespaces]:
+                del self._entries[key]
+
+
+response_cache = ResponseCache(max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+# Namespaces of the public race listings; all are invalidated on race writes
+RACE_LIST_NAMESPACES = ("races", "races_recent", "races_upcoming")
@@ -1,22 +1,53 @@
 """
 Google Cloud Storage Service
 """
+import asyncio
+import multiprocessing
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 from fastapi import UploadFile
 from google.cloud import storage
 from google.auth import compute_engine
 from app.core.config import settings
 import uuid
 from datetime import timedelta
-from app.utils.image_utils import process_bull_image_upload
+from app.utils.image_utils import ImageProcessor, process_bull_image_upload
+
+_image_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_image_pool() -> ProcessPoolExecutor:
+    """Process pool for Pillow decode/resize/encode, created on first upload"""
+    global _image_pool
+    if _image_pool is None:
+        # Spawn rather than fork: the server process already runs executor
+        # threads and GCS clients whose locks a forked child would inherit
+        _image_pool = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _image_pool
+
+
+def shutdown_image_pool():
+    """Stop the image processing workers (called on app shutdown)"""
+    global _image_pool
+    if _image_pool is not None:
+        _image_pool.shutdown(cancel_futures=True)
+        _image_pool = None
+
 
 class StorageService:
     def __init__(self):
         self.bucket_name = settings.GCP_BUCKET_NAME
         self.client = None
         self.signing_credentials = None
+        # Per-instance memo of signed URLs keyed by (blob, expiration, time bucket)
+        self._cached_signed_url = lru_cache(maxsize=settings.SIGNED_URL_CACHE_SIZE)(self._sign_blob)
 
         if settings.GOOGLE_APPLICATION_CREDENTIALS:
             try:
@@ -63,16 +94,21 @@ class StorageService:
         unique_filename = f"{folder}/{uuid.uuid4()}{file_ext}"
         
         blob = bucket.blob(unique_filename)
-        
-        # Read file content
-        contents = await file.read()
-        
-        # Upload
-        blob.upload_from_string(
-            contents,
-            content_type=file.content_type
+
+        # Stream from the spooled upload instead of reading it into memory; the
+        # client sends small files in one request and larger ones in resumable
+        # chunks. Runs on the thread pool so the blocking upload doesn't stall
+        # the event loop.
+        source = file.file
+        source.seek(0, os.SEEK_END)
+        size = source.tell()
+        source.seek(0)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            partial(blob.upload_from_file, source, size=size, content_type=file.content_type)
         )
-        
+
         # Return path (blob name) for DB storage
         return unique_filename
 
@@ -97,7 +133,12 @@ class StorageService:
         contents = await file.read()
 
         # Generate both optimized original and thumbnail
-        optimized_original, thumbnail, original_filename, thumbnail_filename = process_bull_image_upload(
+        # Pillow holds the GIL while decoding and resizing, so run it in a worker
+        # process to keep the event loop serving other requests
+        loop = asyncio.get_running_loop()
+        optimized_original, thumbnail, original_filename, thumbnail_filename = await loop.run_in_executor(
+            _get_image_pool(),
+            process_bull_image_upload,
             contents,
             file.filename
         )
@@ -109,17 +150,17 @@ class StorageService:
         # Upload original
         original_blob_name = f"{folder}/{base_uuid}{file_ext}"
         original_blob = bucket.blob(original_blob_name)
-        original_blob.upload_from_string(
-            optimized_original,
-            content_type="image/jpeg"
+        await loop.run_in_executor(
+            None,
+            partial(original_blob.upload_from_string, optimized_original, content_type="image/jpeg")
         )
 
         # Upload thumbnail
         thumbnail_blob_name = f"{folder}/{base_uuid}_thumb{file_ext}"
         thumbnail_blob = bucket.blob(thumbnail_blob_name)
-        thumbnail_blob.upload_from_string(
-            thumbnail,
-            content_type="image/jpeg"
+        await loop.run_in_executor(
+            None,
+            partial(thumbnail_blob.upload_from_string, thumbnail, content_type="image/jpeg")
         )
 
         print(f"✓ Uploaded bull image: original={original_blob_name}, thumbnail={thumbnail_blob_name}")
@@ -147,7 +188,12 @@ class StorageService:
         contents = await file.read()
 
         # Generate both optimized original and thumbnail (reuse bull image processing)
-        optimized_original, thumbnail, original_filename, thumbnail_filename = process_bull_image_upload(
+        # Pillow holds the GIL while decoding and resizing, so run it in a worker
+        # process to keep the event loop serving other requests
+        loop = asyncio.get_running_loop()
+        optimized_original, thumbnail, original_filename, thumbnail_filename = await loop.run_in_executor(
+            _get_image_pool(),
+            process_bull_image_upload,
             contents,
             file.filename
         )
@@ -159,27 +205,167 @@ class StorageService:
         # Upload original
         original_blob_name = f"{folder}/{base_uuid}{file_ext}"
         original_blob = bucket.blob(original_blob_name)
-        original_blob.upload_from_string(
-            optimized_original,
-            content_type="image/jpeg"
+        await loop.run_in_executor(
+            None,
+            partial(original_blob.upload_from_string, optimized_original, content_type="image/jpeg")
         )
 
         # Upload thumbnail
         thumbnail_blob_name = f"{folder}/{base_uuid}_thumb{file_ext}"
         thumbnail_blob = bucket.blob(thumbnail_blob_name)
-        thumbnail_blob.upload_from_string(
-            thumbnail,
-            content_type="image/jpeg"
+        await loop.run_in_executor(
+            None,
+            partial(thumbnail_blob.upload_from_string, thumbnail, content_type="image/jpeg")
         )
 
         print(f"✓ Uploaded owner image: original={original_blob_name}, thumbnail={thumbnail_blob_name}")
 
         return original_blob_name, thumbnail_blob_name
 
+    async def upload_image_original(self, file: UploadFile, folder: str) -> Tuple[str, bytes]:
+        """
+        Upload only the optimized original of an image (no thumbnail)
+
+        Pair with upload_image_thumbnail, e.g. from a background task, to keep
+        the thumbnail off the request path.
+
+        Returns:
+            (blob_name, contents) - contents are the uploaded bytes as received,
+            for building the thumbnail later
+        """
+        if not self.client:
+            raise Exception("GCP Storage client not initialized. Check credentials.")
+
+        if not self.bucket_name:
+            raise Exception("GCP_BUCKET_NAME not set in configuration")
+
+        contents = await file.read()
+
+        loop = asyncio.get_running_loop()
+        optimized_original = await loop.run_in_executor(
+            _get_image_pool(), ImageProcessor.optimize_original, contents
+        )
+
+        file_ext = Path(file.filename).suffix.lower()
+        blob_name = f"{folder}/{uuid.uuid4()}{file_ext}"
+        blob = self.client.bucket(self.bucket_name).blob(blob_name)
+        await loop.run_in_executor(
+            None,
+            partial(blob.upload_from_string, optimized_original, content_type="image/jpeg")
+        )
+
+        return blob_name, contents
+
+    async def upload_image_thumbnail(self, contents: bytes, original_blob_name: str) -> str:
+        """
+        Generate and upload the thumbnail for an image stored by upload_image_original
+
+        The thumbnail is stored next to the original as <name>_thumb<ext>, the
+        same layout upload_bull_image uses.
+
+        Returns the thumbnail blob name
+        """
+        if not self.client:
+            raise Exception("GCP Storage client not initialized. Check credentials.")
+
+        if not self.bucket_name:
+            raise Exception("GCP_BUCKET_NAME not set in configuration")
+
+        loop = asyncio.get_running_loop()
+        thumbnail = await loop.run_in_executor(
+            _get_image_pool(), ImageProcessor.create_thumbnail, contents
+        )
+
+        original_path = Path(original_blob_name)
+        blob_name = f"{original_path.parent.as_posix()}/{original_path.stem}_thumb{original_path.suffix}"
+        blob = self.client.bucket(self.bucket_name).blob(blob_name)
+        await loop.run_in_executor(
+            None,
+            partial(blob.upload_from_string, thumbnail, content_type="image/jpeg")
+        )
+
+        return blob_name
+
+    def generate_upload_signed_url(
+        self,
+        blob_name: str,
+        content_type: str,
+        expiration: int = 900,
+        max_size: Optional[int] = None
+    ) -> str:
+        """
+        Generate a signed PUT URL so a client can upload a blob directly to GCS
+
+        The client must send the same Content-Type header when uploading, and
+        with max_size also "x-goog-content-length-range: 0,<max_size>", which
+        makes GCS reject larger uploads.
+
+        Args:
+            blob_name: The blob path to create
+            content_type: MIME type the upload is signed for
+            expiration: Expiration time in seconds (default: 900 = 15 minutes)
+            max_size: Largest accepted upload in bytes (default: no limit)
+        """
+        if not self.client:
+            raise Exception("GCP Storage client not initialized. Check credentials.")
+
+        if not self.bucket_name:
+            raise Exception("GCP_BUCKET_NAME not set in configuration")
+
+        blob = self.client.bucket(self.bucket_name).blob(blob_name)
+        return blob.generate_signed_url(
+            version="v4",
+            expiration=timedelta(seconds=expiration),
+            method="PUT",
+            content_type=content_type,
+            headers={"x-goog-content-length-range": f"0,{max_size}"} if max_size else None
+        )
+
+    async def get_blob_info(self, blob_name: str) -> Optional[Tuple[int, str]]:
+        """
+        Fetch a blob's stored size and content type (one metadata request)
+
+        Returns:
+            (size_bytes, content_type), or None if the blob doesn't exist
+        """
+        if not self.client or not self.bucket_name:
+            return None
+
+        loop = asyncio.get_running_loop()
+        blob = await loop.run_in_executor(
+            None, self.client.bucket(self.bucket_name).get_blob, blob_name
+        )
+        if blob is None:
+            return None
+        return blob.size, blob.content_type
+
+    async def download_bytes(
+        self,
+        blob_name: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> bytes:
+        """
+        Download a blob's contents without blocking the event loop
+
+        start/end (inclusive) download only that byte range
+        """
+        if not self.client:
+            raise Exception("GCP Storage client not initialized. Check credentials.")
+
+        blob = self.client.bucket(self.bucket_name).blob(blob_name)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(blob.download_as_bytes, start=start, end=end))
+
     def generate_signed_url(self, blob_name: str, expiration: int = 3600) -> str:
         """
         Generate a signed URL for a blob
 
+        URLs are memoized per time bucket (SIGNED_URL_CACHE_SECONDS, at most half
+        the expiration), so repeat requests skip signing and return the same URL,
+        which lets clients and CDNs cache the image. A reused URL always has at
+        least half of its lifetime left.
+
         Args:
             blob_name: The blob path in GCS
             expiration: Expiration time in seconds (default: 3600 = 1 hour)
@@ -192,26 +378,113 @@ class StorageService:
         if blob_name.startswith(prefix):
             blob_name = blob_name[len(prefix):]
 
-        bucket = self.client.bucket(self.bucket_name)
-        blob = bucket.blob(blob_name)
+        bucket_seconds = max(1, min(settings.SIGNED_URL_CACHE_SECONDS, expiration // 2))
+        time_bucket = int(time.time()) // bucket_seconds
 
         try:
-            # Generate signed URL - works with both service account JSON and Cloud Run ADC
-            # When using ADC in Cloud Run, this will use IAM signBlob API automatically
-            url = blob.generate_signed_url(
-                version="v4",
-                expiration=timedelta(seconds=expiration),
-                method="GET"
-            )
-            return url
+            return self._cached_signed_url(blob_name, expiration, time_bucket)
         except Exception as e:
             print(f"Error generating signed URL: {e}")
             print(f"Blob: {blob_name}, Bucket: {self.bucket_name}")
             import traceback
             traceback.print_exc()
-            # Fallback to public URL format
+            # Fallback to public URL format (not cached, so signing is retried next time)
             return f"https://storage.googleapis.com/{self.bucket_name}/{blob_name}"
 
+    def _sign_blob(self, blob_name: str, expiration: int, time_bucket: int) -> str:
+        """Sign a GET URL for a blob (time_bucket only keys the memo cache)"""
+        bucket = self.client.bucket(self.bucket_name)
+        blob = bucket.blob(blob_name)
+
+        # Generate signed URL - works with both service account JSON and Cloud Run ADC
+        # When using ADC in Cloud Run, this will use IAM signBlob API automatically
+        return blob.generate_signed_url(
+            version="v4",
+            expiration=timedelta(seconds=expiration),
+            method="GET"
+        )
+
+    def get_public_url(self, blob_name: str, expiration: int = 3600) -> str:
+        """
+        Get a URL for a publicly readable image
+
+        Returns a direct URL under PUBLIC_IMAGE_BASE_URL (no signing) when it is
+        configured, otherwise falls back to a signed URL.
+
+        Args:
+            blob_name: The blob path in GCS
+            expiration: Signed URL expiration in seconds, used only for the fallback
+        """
+        base_url = settings.PUBLIC_IMAGE_BASE_URL
+        if not base_url:
+            return self.generate_signed_url(blob_name, expiration=expiration)
+
+        if not blob_name:
+            return ""
+
+        # Handle case where old full URLs might still be in DB
+        prefix = f"https://storage.googleapis.com/{self.bucket_name}/"
+        if blob_name.startswith(prefix):
+            blob_name = blob_name[len(prefix):]
+
+        return f"{base_url.rstrip('/')}/{blob_name}"
+
+    async def get_public_urls(self, blob_names: Iterable[Optional[str]], expiration: int = 3600) -> Dict[str, Optional[str]]:
+        """
+        Resolve public URLs for many blobs at once (see get_public_url)
+
+        Returns:
+            Mapping of blob path -> URL (None if it could not be generated)
+        """
+        return await self._resolve_urls(self.get_public_url, blob_names, expiration)
+
+    async def generate_signed_urls(self, blob_names: Iterable[Optional[str]], expiration: int = 3600) -> Dict[str, Optional[str]]:
+        """
+        Generate signed URLs for many blobs at once (see generate_signed_url)
+
+        Returns:
+            Mapping of blob path -> signed URL (None if it could not be generated)
+        """
+        return await self._resolve_urls(self.generate_signed_url, blob_names, expiration)
+
+    async def _resolve_urls(self, resolve, blob_names: Iterable[Optional[str]], expiration: int) -> Dict[str, Optional[str]]:
+        """
+        Run resolve(blob_name, expiration) for each unique path in parallel
+
+        Paths are resolved on the default thread pool, so any signing I/O
+        (e.g. IAM signBlob on Cloud Run) overlaps instead of running one
+        request after another.
+        """
+        unique_names = list(dict.fromkeys(name for name in blob_names if name))
+        if not unique_names:
+            return {}
+
+        loop = asyncio.get_running_loop()
+        urls = await asyncio.gather(
+            *[loop.run_in_executor(None, resolve, name, expiration) for name in unique_names],
+            return_exceptions=True
+        )
+        return {
+            name: None if isinstance(url, Exception) else url
+            for name, url in zip(unique_names, urls)
+        }
+
+    async def delete_files(self, file_paths: Iterable[Optional[str]]) -> None:
+        """
+        Delete many files from the bucket without blocking the event loop
+
+        Each delete runs on the default thread pool and they overlap; empty
+        paths are skipped. Errors are logged by delete_file, as before.
+        """
+        unique_paths = list(dict.fromkeys(path for path in file_paths if path))
+        if not unique_paths:
+            return
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[loop.run_in_executor(None, self.delete_file, path) for path in unique_paths]
+        )
+
     def delete_file(self, file_path: str):
         """Delete file from bucket"""
         if not self.client or not self.bucket_name:
@@ -0,0 +1,28 @@
+"""
+JSON response returned directly from list/detail endpoints
+"""
+import uuid
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def _default(obj: Any) -> Any:
+    # asyncpg returns its own uuid.UUID subclass, which orjson doesn't serialize natively
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse for handlers that build plain dicts/lists themselves
+
+    Returning a Response instance skips FastAPI's response_model validation and
+    jsonable_encoder pass (a recursive Python walk over every value); orjson
+    serializes the dicts, dates and UUIDs straight to bytes instead.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
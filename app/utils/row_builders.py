@@ -0,0 +1,45 @@
+"""
+Generated dict builders for serializing query rows in list endpoints
+"""
+from typing import Callable, Dict, Sequence
+
+
+def make_row_builder(keys: Sequence[str], extra: Sequence[str] = ()) -> Callable[..., Dict]:
+    """
+    Compile a function that turns a row into a response dict
+
+    The generated function is straight-line code (one attribute read per key,
+    no loops or branches), so building a dict per row costs far fewer Python
+    instructions than a hand-written loop body.
+
+    Args:
+        keys: Response keys in output order. Each key is read from the row
+            attribute of the same name unless it is listed in ``extra``.
+        extra: Keys whose values are passed as keyword arguments instead
+            (e.g. signed URLs or precomputed statistics)
+
+    Returns:
+        Function ``build(row, **extra) -> dict``
+
+    Example:
+        _build = make_row_builder(["id", "name", "photo_url"], extra=["photo_url"])
+        _build(row, photo_url=url)  # {"id": row.id, "name": row.name, "photo_url": url}
+    """
+    extra = tuple(extra)
+    for name in (*keys, *extra):
+        if not name.isidentifier() or name == "row":
+            raise ValueError(f"Invalid row builder key: {name!r}")
+    missing = set(extra) - set(keys)
+    if missing:
+        raise ValueError(f"Extra keys not in output keys: {sorted(missing)}")
+
+    params = "".join(f", {name}" for name in extra)
+    items = ", ".join(
+        f"{name!r}: {name}" if name in extra else f"{name!r}: row.{name}"
+        for name in keys
+    )
+    source = f"def build(row{params}):\n    return {{{items}}}\n"
+
+    namespace: Dict = {}
+    exec(compile(source, "<row_builder>", "exec"), namespace)
+    return namespace["build"]
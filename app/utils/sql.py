@@ -0,0 +1,19 @@
+"""
+SQL expression helpers for PostgreSQL queries
+"""
+from typing import Iterable
+
+from sqlalchemy import any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def any_of(column: ColumnElement, values: Iterable) -> ColumnElement:
+    """
+    ``column = ANY(:values)`` with the values bound as a single array parameter
+
+    Unlike ``column.in_(values)``, which expands to one bound parameter per value,
+    the SQL text is the same for any number of values, so it is parsed, cached
+    and prepared once regardless of page size.
+    """
+    return column == any_(bindparam(None, list(values), type_=ARRAY(column.type)))
@@ -1,24 +1,27 @@
 """
 Script to expire old user bull listings
 
-This script should be run daily via a cron job to automatically
+This script should be run every minute via a cron job to automatically
 expire bull listings that have exceeded their 30-day expiration period.
+Keeping status current lets the public listing read only the
+status = 'available' partial index. Once an hour it also deletes images
+uploaded directly to GCS that never became a listing.
 
 Usage:
     python expire_user_bulls.py
 
-Cron example (run daily at 2 AM):
-    0 2 * * * cd /path/to/backend && python expire_user_bulls.py
+Cron example (run every minute):
+    * * * * * cd /path/to/backend && python expire_user_bulls.py
 """
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, or_, select, update
 from sqlalchemy.orm import sessionmaker
 from app.models.user_bull import UserBullSell
 from app.services.storage import storage_service
@@ -30,9 +33,9 @@ def expire_old_listings():
     Expire user bull listings that have exceeded their expiration date
 
     This function:
-    1. Finds all listings where expires_at < current time and status is 'available'
-    2. Updates their status to 'expired'
-    3. Optionally deletes images from storage to save space
+    1. Updates status to 'expired' for all listings where expires_at <= current time
+       and status is 'available', in a single UPDATE
+    2. Optionally deletes images from storage to save space
     """
     # Create database connection
     engine = create_engine(settings.DATABASE_URL)
@@ -40,24 +43,27 @@ def expire_old_listings():
     db = SessionLocal()
 
     try:
-        # Find expired listings
+        # Expire listings in one set-based UPDATE
         now = datetime.utcnow()
-        expired_listings = db.query(UserBullSell).filter(
-            UserBullSell.status == 'available',
-            UserBullSell.expires_at <= now
+        expired_listings = db.execute(
+            update(UserBullSell)
+            .where(
+                UserBullSell.status == 'available',
+                UserBullSell.expires_at <= now
+            )
+            .values(status='expired', updated_at=now)
+            .returning(UserBullSell.id, UserBullSell.name, UserBullSell.image_url)
         ).all()
 
         if not expired_listings:
+            db.rollback()
             print(f"[{now}] No expired listings found.")
             return
 
         print(f"[{now}] Found {len(expired_listings)} expired listings.")
 
-        # Update status to expired
         for listing in expired_listings:
             print(f"  - Expiring listing ID {listing.id}: {listing.name}")
-            listing.status = 'expired'
-            listing.updated_at = now
 
             # Optional: Delete image from storage to save space
             # Uncomment the following lines if you want to delete images
@@ -79,6 +85,56 @@ def expire_old_listings():
         db.close()
 
 
+def delete_abandoned_uploads(hours_old=24):
+    """
+    Delete listing images uploaded via /user/bulls/upload-url that no listing uses
+
+    Direct uploads are stored as user_bulls_sell/<user_id>/<name>, so only that
+    level is listed. Objects younger than hours_old are kept, since the client
+    may still be creating the listing.
+    """
+    if not storage_service.client or not storage_service.bucket_name:
+        print("Storage not configured; skipping abandoned upload cleanup.")
+        return
+
+    now = datetime.utcnow()
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours_old)
+    bucket = storage_service.client.bucket(storage_service.bucket_name)
+    candidates = {
+        blob.name
+        for blob in bucket.list_blobs(prefix="user_bulls_sell/", match_glob="user_bulls_sell/*/*")
+        if blob.time_created < cutoff
+    }
+    if not candidates:
+        print(f"[{now}] No abandoned uploads found.")
+        return
+
+    engine = create_engine(settings.DATABASE_URL)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = SessionLocal()
+
+    try:
+        referenced = set()
+        for image_url, thumbnail_url in db.execute(
+            select(UserBullSell.image_url, UserBullSell.thumbnail_url).where(
+                or_(UserBullSell.image_url.in_(candidates), UserBullSell.thumbnail_url.in_(candidates))
+            )
+        ):
+            referenced.update((image_url, thumbnail_url))
+    finally:
+        db.close()
+
+    abandoned = candidates - referenced
+    for blob_name in abandoned:
+        try:
+            storage_service.delete_file(blob_name)
+            print(f"  - Deleted abandoned upload: {blob_name}")
+        except Exception as e:
+            print(f"    Failed to delete {blob_name}: {e}")
+
+    print(f"[{now}] Deleted {len(abandoned)} abandoned uploads.")
+
+
 def delete_old_expired_listings(days_old=60):
     """
     Permanently delete expired listings that are older than specified days
@@ -88,7 +144,6 @@ def delete_old_expired_listings(days_old=60):
 
     This is optional cleanup - removes very old expired listings to keep database clean
     """
-    from datetime import timedelta
 
     engine = create_engine(settings.DATABASE_URL)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -141,6 +196,10 @@ if __name__ == "__main__":
     # Expire listings that have reached their expiration date
     expire_old_listings()
 
+    # Hourly: remove direct uploads that never became a listing
+    if datetime.utcnow().minute == 0:
+        delete_abandoned_uploads(hours_old=24)
+
     # Optional: Delete very old expired listings (older than 60 days)
     # Uncomment the following line if you want to clean up old expired listings
     # delete_old_expired_listings(days_old=60)
@@ -1,9 +1,9 @@
 #!/bin/bash
 # Setup cron job for expiring user bull listings
-# This script adds a cron job to run daily at 2 AM
+# This script adds a cron job to run every minute
 
 BACKEND_DIR="/Users/omkar/Documents/Naad/Repos/backend"
-CRON_COMMAND="0 2 * * * cd $BACKEND_DIR && /usr/bin/python3 expire_user_bulls.py >> $BACKEND_DIR/expire_bulls.log 2>&1"
+CRON_COMMAND="* * * * * cd $BACKEND_DIR && /usr/bin/python3 expire_user_bulls.py >> $BACKEND_DIR/expire_bulls.log 2>&1"
 
 # Check if cron job already exists
 if crontab -l 2>/dev/null | grep -q "expire_user_bulls.py"; then
@@ -14,7 +14,7 @@ else
     # Add the cron job
     (crontab -l 2>/dev/null; echo "$CRON_COMMAND") | crontab -
     echo "✓ Cron job added successfully!"
-    echo "  Schedule: Daily at 2:00 AM"
+    echo "  Schedule: Every minute"
     echo "  Script: $BACKEND_DIR/expire_user_bulls.py"
     echo "  Log file: $BACKEND_DIR/expire_bulls.log"
 fi